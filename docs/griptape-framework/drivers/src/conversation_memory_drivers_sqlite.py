@@ -0,0 +1,9 @@
+from griptape.drivers.memory.conversation.sqlite import SqliteConversationMemoryDriver
+from griptape.memory.structure import ConversationMemory
+from griptape.structures import Agent
+
+sqlite_driver = SqliteConversationMemoryDriver(database="memory.db", conversation_id="surfing")
+agent = Agent(conversation_memory=ConversationMemory(conversation_memory_driver=sqlite_driver))
+
+agent.run("Surfing is my favorite sport.")
+agent.run("What is my favorite sport?")
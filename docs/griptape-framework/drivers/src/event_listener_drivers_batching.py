@@ -0,0 +1,24 @@
+import os
+
+from griptape.drivers.event_listener.webhook import WebhookEventListenerDriver
+from griptape.events import EventBus, EventListener
+from griptape.structures import Agent
+
+EventBus.add_event_listeners(
+    [
+        EventListener(
+            event_listener_driver=WebhookEventListenerDriver(
+                webhook_url=os.environ["WEBHOOK_URL"],
+                batch_size=50,
+                max_batch_bytes=256_000,
+                linger_time=0.5,
+                max_queue_size=10_000,
+                overflow_policy="drop",
+            ),
+        ),
+    ]
+)
+
+agent = Agent()
+
+agent.run("Analyze the pros and cons of remote work vs. office work")
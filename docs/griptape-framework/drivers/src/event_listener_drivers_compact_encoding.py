@@ -0,0 +1,27 @@
+import os
+
+from griptape.drivers.event_listener.webhook import WebhookEventListenerDriver
+from griptape.events import CompactEventEncoder, EventBus, EventListener
+from griptape.structures import Agent
+
+EventBus.add_event_listeners(
+    [
+        EventListener(
+            event_listener_driver=WebhookEventListenerDriver(
+                webhook_url=os.environ["WEBHOOK_URL"],
+                event_encoder=CompactEventEncoder(compression="gzip"),
+            ),
+        ),
+    ]
+)
+
+agent = Agent()
+
+agent.run("Analyze the pros and cons of remote work vs. office work")
+
+
+# In the webhook's receiver, decode the request body back into a list of event payloads.
+def receive(body: bytes) -> list[dict]:
+    event_payloads = CompactEventEncoder().decode(body)
+
+    return event_payloads if isinstance(event_payloads, list) else [event_payloads]
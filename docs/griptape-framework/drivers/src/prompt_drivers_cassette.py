@@ -0,0 +1,19 @@
+from griptape.drivers.prompt.cassette import RecordingPromptDriver, ReplayPromptDriver
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.structures import Agent
+
+# Record the responses of a real Prompt Driver.
+recording_driver = RecordingPromptDriver(
+    prompt_driver=OpenAiChatPromptDriver(model="gpt-4o"),
+    cassette_file="cassette.jsonl",
+)
+Agent(prompt_driver=recording_driver).run("What is the capital of France?")
+
+# Replay them offline, twice as fast as they were recorded.
+replay_driver = ReplayPromptDriver(
+    cassette_file="cassette.jsonl",
+    latency_scale=0.5,
+    use_native_tools=recording_driver.use_native_tools,
+    tokenizer=recording_driver.tokenizer,
+)
+Agent(prompt_driver=replay_driver).run("What is the capital of France?")
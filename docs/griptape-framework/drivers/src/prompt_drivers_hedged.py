@@ -0,0 +1,16 @@
+from griptape.drivers.prompt.anthropic import AnthropicPromptDriver
+from griptape.drivers.prompt.hedged import HedgedPromptDriver
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.structures import Agent
+
+agent = Agent(
+    prompt_driver=HedgedPromptDriver(
+        prompt_drivers=[
+            OpenAiChatPromptDriver(model="gpt-4o"),
+            AnthropicPromptDriver(model="claude-3-5-sonnet-20240620"),
+        ],
+        hedge_percentile=95,
+    ),
+)
+
+agent.run("What is the capital of France?")
@@ -0,0 +1,17 @@
+from griptape.drivers.prompt.huggingface_pipeline import HuggingFacePipelinePromptDriver
+from griptape.structures import Agent
+from griptape.utils import ModelRegistry
+
+ModelRegistry.enabled = True
+ModelRegistry.max_memory = 8 * 1024**3
+
+# Warm up the pipeline at import, so that the first Agent doesn't have to wait for it to load.
+pipeline = HuggingFacePipelinePromptDriver(model="TinyLlama/TinyLlama-1.1B-Chat-v1.0").pipeline
+
+
+def create_agent() -> Agent:
+    # Every Agent shares the loaded pipeline and tokenizer.
+    return Agent(prompt_driver=HuggingFacePipelinePromptDriver(model="TinyLlama/TinyLlama-1.1B-Chat-v1.0"))
+
+
+create_agent().run("How many helicopters can a human eat in one sitting?")
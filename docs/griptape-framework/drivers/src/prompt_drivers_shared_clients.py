@@ -0,0 +1,13 @@
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.utils import ClientRegistry
+
+ClientRegistry.enabled = True
+ClientRegistry.max_connections = 50
+ClientRegistry.timeout = 30
+
+prompt_driver = OpenAiChatPromptDriver(model="gpt-4o")
+embedding_driver = OpenAiEmbeddingDriver()
+
+# Both Drivers use the same client and connection pool.
+print(prompt_driver.client is embedding_driver.client)
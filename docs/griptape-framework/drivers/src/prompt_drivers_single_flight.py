@@ -0,0 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.structures import Agent
+
+prompt_driver = OpenAiChatPromptDriver(model="gpt-4o", single_flight=True)
+
+
+def answer(question: str) -> str:
+    return Agent(prompt_driver=prompt_driver).run(question).output.value
+
+
+# Only one request is sent to OpenAI, and every Agent receives its response.
+with ThreadPoolExecutor() as executor:
+    print(list(executor.map(answer, ["What is the capital of France?"] * 5)))
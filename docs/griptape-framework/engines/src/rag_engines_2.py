@@ -0,0 +1,40 @@
+from griptape.chunkers import TextChunker
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.drivers.vector.local import LocalVectorStoreDriver
+from griptape.engines.rag import RagContext, RagEngine
+from griptape.engines.rag.modules import PromptResponseRagModule, TranslateQueryRagModule, VectorStoreRetrievalRagModule
+from griptape.engines.rag.stages import QueryRagStage, ResponseRagStage, RetrievalRagStage
+from griptape.loaders import WebLoader
+
+prompt_driver = OpenAiChatPromptDriver(model="gpt-4o", temperature=0)
+
+vector_store = LocalVectorStoreDriver(embedding_driver=OpenAiEmbeddingDriver())
+artifact = WebLoader().load("https://www.griptape.ai")
+chunks = TextChunker(max_tokens=500).chunk(artifact)
+
+vector_store.upsert_text_artifacts({"griptape": chunks})
+
+rag_engine = RagEngine(
+    query_stage=QueryRagStage(
+        # Runs first, so that the parallel modules start from an English query.
+        query_modules=[TranslateQueryRagModule(name="English", prompt_driver=prompt_driver, language="english")],
+        # Runs concurrently, each producing a query variant.
+        parallel_query_modules=[
+            TranslateQueryRagModule(name="French", prompt_driver=prompt_driver, language="french"),
+            TranslateQueryRagModule(name="German", prompt_driver=prompt_driver, language="german"),
+        ],
+    ),
+    retrieval_stage=RetrievalRagStage(
+        max_chunks=5,
+        retrieval_modules=[
+            VectorStoreRetrievalRagModule(vector_store_driver=vector_store, query_params={"namespace": "griptape"})
+        ],
+    ),
+    response_stage=ResponseRagStage(response_modules=[PromptResponseRagModule(prompt_driver=prompt_driver)]),
+)
+
+rag_context = rag_engine.process(RagContext(query="¿Qué ofrecen los servicios en la nube de Griptape?"))
+
+print(rag_context.queries)
+print(rag_context.outputs[0].to_text())
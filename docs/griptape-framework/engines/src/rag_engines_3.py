@@ -0,0 +1,40 @@
+from griptape.chunkers import TextChunker
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.drivers.vector.local import LocalVectorStoreDriver
+from griptape.engines.rag import RagEngine
+from griptape.engines.rag.caches import DiskRagCache
+from griptape.engines.rag.modules import PromptResponseRagModule, VectorStoreRetrievalRagModule
+from griptape.engines.rag.stages import ResponseRagStage, RetrievalRagStage
+from griptape.loaders import WebLoader
+
+prompt_driver = OpenAiChatPromptDriver(model="gpt-4o", temperature=0)
+vector_store = LocalVectorStoreDriver(embedding_driver=OpenAiEmbeddingDriver())
+cache = DiskRagCache(directory="rag_cache")
+
+rag_engine = RagEngine(
+    retrieval_stage=RetrievalRagStage(
+        retrieval_modules=[
+            VectorStoreRetrievalRagModule(
+                name="Retriever", vector_store_driver=vector_store, query_params={"namespace": "griptape"}
+            )
+        ],
+        cache=cache,
+    ),
+    response_stage=ResponseRagStage(
+        response_modules=[PromptResponseRagModule(name="Responder", prompt_driver=prompt_driver)],
+        cache=cache,
+    ),
+)
+
+artifact = WebLoader().load("https://www.griptape.ai")
+vector_store.upsert_text_artifacts({"griptape": TextChunker(max_tokens=500).chunk(artifact)})
+
+# The second query is answered from the cache, without embedding it or prompting the LLM.
+print(rag_engine.process_query("What is Griptape?").outputs[0].to_text())
+print(rag_engine.process_query("what is griptape?").outputs[0].to_text())
+
+# Writing to the namespace changes its corpus version, so the next query retrieves text chunks again.
+# The response is only generated again if the retrieved text chunks changed.
+vector_store.upsert_text_artifacts({"griptape": TextChunker(max_tokens=500).chunk(artifact)})
+print(rag_engine.process_query("What is Griptape?").outputs[0].to_text())
@@ -0,0 +1,22 @@
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.events import ChunkEventCoalescer, EventBus, EventListener, TextChunkEvent
+from griptape.structures import Agent
+
+EventBus.add_event_listeners(
+    [
+        EventListener(
+            lambda e: print(str(e), end="", flush=True),
+            event_types=[TextChunkEvent],
+        ),
+    ]
+)
+
+agent = Agent(
+    prompt_driver=OpenAiChatPromptDriver(
+        model="gpt-4o",
+        stream=True,
+        chunk_event_coalescer=ChunkEventCoalescer(max_delay=0.2, max_bytes=512),
+    ),
+)
+
+agent.run("Hi!")
@@ -0,0 +1,13 @@
+from griptape.memory.structure import SummaryConversationMemory
+from griptape.structures import Agent
+
+conversation_memory = SummaryConversationMemory(offset=2, background_summarization=True)
+agent = Agent(conversation_memory=conversation_memory)
+
+agent.run("Hello my name is John?")
+agent.run("What is my name?")
+agent.run("My favorite color is blue.")
+
+conversation_memory.wait_for_summarization()
+
+print(conversation_memory.summary)
@@ -0,0 +1,16 @@
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+from griptape.drivers.vector.local import LocalVectorStoreDriver
+from griptape.memory.structure import VectorStoreConversationMemory
+from griptape.structures import Agent
+
+conversation_memory = VectorStoreConversationMemory(
+    vector_store_driver=LocalVectorStoreDriver(embedding_driver=OpenAiEmbeddingDriver()),
+    recent_count=2,
+    retrieval_count=3,
+)
+agent = Agent(conversation_memory=conversation_memory)
+
+agent.run("My favorite animal is a Liger.")
+agent.run("I live in Paris.")
+agent.run("I work as a baker.")
+agent.run("What is my favorite animal?")
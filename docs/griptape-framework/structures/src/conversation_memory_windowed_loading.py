@@ -0,0 +1,14 @@
+from griptape.drivers.memory.conversation.local import LocalConversationMemoryDriver
+from griptape.memory.structure import ConversationMemory
+from griptape.structures import Agent
+
+conversation_memory = ConversationMemory(
+    conversation_memory_driver=LocalConversationMemoryDriver(persist_file="conversation.jsonl"),
+    autoload_last_n=10,
+)
+agent = Agent(conversation_memory=conversation_memory)
+
+agent.run("What did we talk about last time?")
+
+# Page in older Runs when they're needed.
+older_runs = conversation_memory.load_older_runs(10)
@@ -0,0 +1,21 @@
+from griptape.artifacts import BlobArtifact, TextArtifact
+from griptape.memory import TaskMemory
+from griptape.memory.task.storage import BlobArtifactStorage, TextArtifactStorage
+from griptape.structures import Agent
+from griptape.tools import PromptSummaryTool, WebScraperTool
+
+# Embed the Artifacts of a namespace only once it's searched,
+# and then only up to 10 Artifacts that share words with the query.
+task_memory = TaskMemory(
+    artifact_storages={
+        TextArtifact: TextArtifactStorage(defer_embedding=True, lexical_prefilter_count=10),
+        BlobArtifact: BlobArtifactStorage(),
+    }
+)
+
+agent = Agent(
+    task_memory=task_memory,
+    tools=[WebScraperTool(off_prompt=True), PromptSummaryTool(off_prompt=False)],
+)
+
+agent.run("Summarize https://en.wikipedia.org/wiki/Elden_Ring")
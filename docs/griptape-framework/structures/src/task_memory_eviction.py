@@ -0,0 +1,15 @@
+from griptape.memory import TaskMemory
+from griptape.structures import Agent
+from griptape.tools import PromptSummaryTool, WebScraperTool
+
+# Evict namespaces unused for an hour, and the least recently used ones beyond 100 namespaces or 10,000 Artifacts.
+task_memory = TaskMemory(namespace_ttl=60 * 60, max_namespaces=100, max_artifacts=10_000, eviction_policy="lru")
+
+agent = Agent(
+    task_memory=task_memory,
+    tools=[WebScraperTool(off_prompt=True), PromptSummaryTool(off_prompt=False)],
+)
+
+agent.run("Summarize https://en.wikipedia.org/wiki/Elden_Ring")
+
+print(task_memory.eviction_metrics)
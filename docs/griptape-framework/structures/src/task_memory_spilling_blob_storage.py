@@ -0,0 +1,17 @@
+from griptape.artifacts import BlobArtifact, TextArtifact
+from griptape.memory import TaskMemory
+from griptape.memory.task.storage import SpillingBlobArtifactStorage, TextArtifactStorage
+from griptape.structures import Agent
+from griptape.tools import FileManagerTool
+
+# Hold up to 16 MiB of Blob Artifacts in memory, and spill the least recently used ones to disk.
+task_memory = TaskMemory(
+    artifact_storages={
+        TextArtifact: TextArtifactStorage(),
+        BlobArtifact: SpillingBlobArtifactStorage(max_memory_bytes=16 * 1024 * 1024, spill_directory="blobs"),
+    }
+)
+
+agent = Agent(task_memory=task_memory, tools=[FileManagerTool(off_prompt=True)])
+
+agent.run("Load the files in the images directory, and save them to the backup directory.")
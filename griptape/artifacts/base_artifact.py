@@ -6,14 +6,14 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
-from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.mixins.serializable_mixin import SlottedSerializableMixin
 
 if TYPE_CHECKING:
     from griptape.common import Reference
 
 
 @define
-class BaseArtifact(SerializableMixin, ABC):
+class BaseArtifact(SlottedSerializableMixin, ABC):
     """Serves as the base class for all Artifacts.
 
     Artifacts are used to encapsulate data and enhance it with metadata.
@@ -30,7 +30,10 @@ class BaseArtifact(SerializableMixin, ABC):
 
     id: str = field(default=Factory(lambda: uuid.uuid4().hex), kw_only=True, metadata={"serializable": True})
     reference: Optional[Reference] = field(default=None, kw_only=True, metadata={"serializable": True})
-    meta: dict[str, Any] = field(factory=dict, kw_only=True, metadata={"serializable": True})
+    # Most Artifacts never get metadata, so the dict is only created once it's accessed.
+    _meta: Optional[dict[str, Any]] = field(
+        default=None, kw_only=True, alias="meta", eq=lambda meta: meta or {}, metadata={"serializable": True}
+    )
     name: str = field(
         default=Factory(lambda self: self.id, takes_self=True),
         kw_only=True,
@@ -40,6 +43,17 @@ class BaseArtifact(SerializableMixin, ABC):
     encoding_error_handler: str = field(default="strict", kw_only=True)
     encoding: str = field(default="utf-8", kw_only=True)
 
+    @property
+    def meta(self) -> dict[str, Any]:
+        if self._meta is None:
+            self._meta = {}
+
+        return self._meta
+
+    @meta.setter
+    def meta(self, value: dict[str, Any]) -> None:
+        self._meta = value
+
     def __str__(self) -> str:
         return self.to_text()
 
@@ -4,9 +4,9 @@ from abc import ABC
 
 from attrs import define, field
 
-from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.mixins.serializable_mixin import SlottedSerializableMixin
 
 
 @define
-class BaseDeltaMessageContent(ABC, SerializableMixin):
+class BaseDeltaMessageContent(ABC, SlottedSerializableMixin):
     index: int = field(kw_only=True, default=0, metadata={"serializable": True})
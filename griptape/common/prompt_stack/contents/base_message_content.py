@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from attrs import define, field
 
-from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.mixins.serializable_mixin import SlottedSerializableMixin
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
 
 
 @define
-class BaseMessageContent(ABC, SerializableMixin):
+class BaseMessageContent(ABC, SlottedSerializableMixin):
     artifact: BaseArtifact = field(metadata={"serializable": True})
 
     def __str__(self) -> str:
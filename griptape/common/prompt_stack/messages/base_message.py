@@ -5,16 +5,16 @@ from typing import TYPE_CHECKING, Optional, Union
 
 from attrs import Factory, define, field
 
-from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.mixins.serializable_mixin import SlottedSerializableMixin
 
 if TYPE_CHECKING:
     from griptape.common import BaseDeltaMessageContent, BaseMessageContent
 
 
 @define
-class BaseMessage(ABC, SerializableMixin):
+class BaseMessage(ABC, SlottedSerializableMixin):
     @define
-    class Usage(SerializableMixin):
+    class Usage(SlottedSerializableMixin):
         input_tokens: Optional[float] = field(kw_only=True, default=None, metadata={"serializable": True})
         output_tokens: Optional[float] = field(kw_only=True, default=None, metadata={"serializable": True})
 
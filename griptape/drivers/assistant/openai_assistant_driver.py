@@ -10,6 +10,7 @@ from typing_extensions import override
 from griptape.artifacts import BaseArtifact, TextArtifact
 from griptape.drivers.assistant import BaseAssistantDriver
 from griptape.events import EventBus, TextChunkEvent
+from griptape.utils import ClientRegistry
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -50,7 +51,8 @@ class OpenAiAssistantDriver(BaseAssistantDriver):
 
     @lazy_property()
     def client(self) -> openai.OpenAI:
-        return openai.OpenAI(
+        return ClientRegistry.get_client(
+            openai.OpenAI,
             base_url=self.base_url,
             api_key=self.api_key,
             organization=self.organization,
@@ -8,6 +8,7 @@ from attrs import define, field
 
 from griptape.artifacts import AudioArtifact, TextArtifact
 from griptape.drivers.audio_transcription import BaseAudioTranscriptionDriver
+from griptape.utils import ClientRegistry
 from griptape.utils.decorators import lazy_property
 
 
@@ -22,7 +23,9 @@ class OpenAiAudioTranscriptionDriver(BaseAudioTranscriptionDriver):
 
     @lazy_property()
     def client(self) -> openai.OpenAI:
-        return openai.OpenAI(api_key=self.api_key, base_url=self.base_url, organization=self.organization)
+        return ClientRegistry.get_client(
+            openai.OpenAI, api_key=self.api_key, base_url=self.base_url, organization=self.organization
+        )
 
     def try_run(self, audio: AudioArtifact, prompts: Optional[list[str]] = None) -> TextArtifact:
         additional_params = {}
@@ -7,6 +7,7 @@ from attrs import Factory, define, field
 
 from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
 from griptape.tokenizers import OpenAiTokenizer
+from griptape.utils import ClientRegistry
 from griptape.utils.decorators import lazy_property
 
 
@@ -45,7 +46,8 @@ class AzureOpenAiEmbeddingDriver(OpenAiEmbeddingDriver):
 
     @lazy_property()
     def client(self) -> openai.AzureOpenAI:
-        return openai.AzureOpenAI(
+        return ClientRegistry.get_client(
+            openai.AzureOpenAI,
             organization=self.organization,
             api_key=self.api_key,
             api_version=self.api_version,
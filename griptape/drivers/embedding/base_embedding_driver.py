@@ -9,6 +9,7 @@ from attrs import define, field
 from griptape.chunkers import BaseChunker, TextChunker
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils import SingleFlight
 
 if TYPE_CHECKING:
     from griptape.artifacts import TextArtifact
@@ -22,11 +23,19 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        single_flight: Whether concurrent requests to embed the same string should share one request.
+        batch_size: Maximum number of strings to embed in one request with `embed_strings`.
+        max_batch_tokens: Maximum number of tokens to embed in one request with `embed_strings`, counted with
+            `tokenizer`. If None, or if `tokenizer` is not set, requests are only capped by `batch_size`.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: Optional[BaseTokenizer] = field(default=None, kw_only=True)
     chunker: Optional[BaseChunker] = field(init=False)
+    single_flight: bool = field(default=False, kw_only=True)
+    batch_size: int = field(default=1, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=None, kw_only=True)
+    _in_flight_embeddings: SingleFlight = field(factory=SingleFlight, init=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
         self.chunker = TextChunker(tokenizer=self.tokenizer) if self.tokenizer else None
@@ -35,6 +44,74 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         return self.embed_string(artifact.to_text())
 
     def embed_string(self, string: str) -> list[float]:
+        if self.single_flight:
+            embedding, is_shared = self._in_flight_embeddings.do(string, lambda: self._embed_string(string))
+
+            return list(embedding) if is_shared else embedding
+        else:
+            return self._embed_string(string)
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embeds several strings in requests of up to `batch_size` strings and `max_batch_tokens` tokens.
+
+        Strings that are too long to embed in one go are embedded on their own.
+
+        Args:
+            strings: The strings to embed.
+
+        Returns:
+            The embeddings, in the order of the strings.
+        """
+        embeddings: list[list[float]] = [[] for _ in strings]
+        batches: list[list[int]] = []
+        batch_tokens = 0
+        batch_size = max(self.batch_size, 1)
+
+        for i, string in enumerate(strings):
+            tokens = self.tokenizer.count_tokens(string) if self.tokenizer is not None else 0
+
+            if self.tokenizer is not None and tokens > self.tokenizer.max_input_tokens:
+                embeddings[i] = self.embed_string(string)
+            else:
+                if (
+                    not batches
+                    or len(batches[-1]) >= batch_size
+                    or (self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens)
+                ):
+                    batches.append([])
+                    batch_tokens = 0
+                batches[-1].append(i)
+                batch_tokens += tokens
+
+        for indexes in batches:
+            for i, embedding in zip(indexes, self._embed_chunks([strings[i] for i in indexes])):
+                embeddings[i] = embedding
+
+        return embeddings
+
+    @abstractmethod
+    def try_embed_chunk(self, chunk: str) -> list[float]: ...
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        """Embeds several chunks. Drivers whose APIs accept several inputs should override this to make one request.
+
+        Args:
+            chunks: The chunks to embed.
+
+        Returns:
+            The embeddings, in the order of the chunks.
+        """
+        return [self.try_embed_chunk(chunk) for chunk in chunks]
+
+    def _embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        for attempt in self.retrying():
+            with attempt:
+                return self.try_embed_chunks(chunks)
+
+        else:
+            raise RuntimeError("Failed to embed strings.")
+
+    def _embed_string(self, string: str) -> list[float]:
         for attempt in self.retrying():
             with attempt:
                 if self.tokenizer is not None and self.tokenizer.count_tokens(string) > self.tokenizer.max_input_tokens:
@@ -45,9 +122,6 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         else:
             raise RuntimeError("Failed to embed string.")
 
-    @abstractmethod
-    def try_embed_chunk(self, chunk: str) -> list[float]: ...
-
     def _embed_long_string(self, string: str) -> list[float]:
         """Embeds a string that is too long to embed in one go.
 
@@ -6,7 +6,7 @@ from attrs import Factory, define, field
 
 from griptape.drivers.embedding import BaseEmbeddingDriver
 from griptape.tokenizers import CohereTokenizer
-from griptape.utils import import_optional_dependency
+from griptape.utils import ClientRegistry, import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -29,6 +29,7 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
 
     api_key: str = field(kw_only=True, metadata={"serializable": False})
     input_type: str = field(kw_only=True, metadata={"serializable": True})
+    batch_size: int = field(default=96, kw_only=True)
     _client: Client = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
     tokenizer: CohereTokenizer = field(
         default=Factory(lambda self: CohereTokenizer(model=self.model, client=self.client), takes_self=True),
@@ -37,7 +38,7 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
 
     @lazy_property()
     def client(self) -> Client:
-        return import_optional_dependency("cohere").Client(self.api_key)
+        return ClientRegistry.get_client(import_optional_dependency("cohere").Client, api_key=self.api_key)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
         result = self.client.embed(texts=[chunk], model=self.model, input_type=self.input_type)
@@ -46,3 +47,11 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
             return result.embeddings[0]
         else:
             raise ValueError("Non-float embeddings are not supported.")
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        result = self.client.embed(texts=chunks, model=self.model, input_type=self.input_type)
+
+        if isinstance(result.embeddings, list):
+            return result.embeddings
+        else:
+            raise ValueError("Non-float embeddings are not supported.")
@@ -7,6 +7,7 @@ from attrs import Factory, define, field
 
 from griptape.drivers.embedding import BaseEmbeddingDriver
 from griptape.tokenizers import OpenAiTokenizer
+from griptape.utils import ClientRegistry
 from griptape.utils.decorators import lazy_property
 
 
@@ -26,6 +27,7 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         azure_ad_token: An optional Azure Active Directory token.
         azure_ad_token_provider: An optional Azure Active Directory token provider.
         api_version: An Azure OpenAi API version.
+        max_batch_tokens: Maximum number of tokens to embed in one request. Defaults to OpenAI's per-request limit.
     """
 
     DEFAULT_MODEL = "text-embedding-3-small"
@@ -38,11 +40,15 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True),
         kw_only=True,
     )
+    batch_size: int = field(default=100, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=300_000, kw_only=True)
     _client: openai.OpenAI = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
     def client(self) -> openai.OpenAI:
-        return openai.OpenAI(api_key=self.api_key, base_url=self.base_url, organization=self.organization)
+        return ClientRegistry.get_client(
+            openai.OpenAI, api_key=self.api_key, base_url=self.base_url, organization=self.organization
+        )
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
         # Address a performance issue in older ada models
@@ -51,5 +57,11 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
             chunk = chunk.replace("\n", " ")
         return self.client.embeddings.create(**self._params(chunk)).data[0].embedding
 
-    def _params(self, chunk: str) -> dict:
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        if self.model.endswith("001"):
+            chunks = [chunk.replace("\n", " ") for chunk in chunks]
+
+        return [data.embedding for data in self.client.embeddings.create(**self._params(chunks)).data]
+
+    def _params(self, chunk: str | list[str]) -> dict:
         return {"input": chunk, "model": self.model}
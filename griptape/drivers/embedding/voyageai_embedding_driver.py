@@ -23,6 +23,7 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         tokenizer: Optionally provide custom `VoyageAiTokenizer`.
         client: Optionally provide custom VoyageAI `Client`.
         input_type: VoyageAI input type. Defaults to `document`.
+        max_batch_tokens: Maximum number of tokens to embed in one request. Defaults to VoyageAI's per-request limit.
     """
 
     DEFAULT_MODEL = "voyage-large-2"
@@ -34,6 +35,8 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         kw_only=True,
     )
     input_type: str = field(default="document", kw_only=True, metadata={"serializable": True})
+    batch_size: int = field(default=128, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=120_000, kw_only=True)
     _client: Client = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -42,3 +45,6 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
         return self.client.embed([chunk], model=self.model, input_type=self.input_type).embeddings[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.client.embed(chunks, model=self.model, input_type=self.input_type).embeddings
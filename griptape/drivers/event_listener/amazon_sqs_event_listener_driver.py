@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
 from attrs import Factory, define, field
@@ -25,11 +24,11 @@ class AmazonSqsEventListenerDriver(BaseEventListenerDriver):
         return self.session.client("sqs")
 
     def try_publish_event_payload(self, event_payload: dict) -> None:
-        self.client.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(event_payload))
+        self.client.send_message(QueueUrl=self.queue_url, MessageBody=self._dump_event_payload(event_payload))
 
     def try_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> None:
         entries = [
-            {"Id": str(event_payload["id"]), "MessageBody": json.dumps(event_payload)}
+            {"Id": str(event_payload["id"]), "MessageBody": self._dump_event_payload(event_payload)}
             for event_payload in event_payload_batch
         ]
 
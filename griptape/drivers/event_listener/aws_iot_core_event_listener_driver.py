@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
 from attrs import Factory, define, field
@@ -26,7 +25,7 @@ class AwsIotCoreEventListenerDriver(BaseEventListenerDriver):
         return self.session.client("iot-data")
 
     def try_publish_event_payload(self, event_payload: dict) -> None:
-        self.client.publish(topic=self.topic, payload=json.dumps(event_payload))
+        self.client.publish(topic=self.topic, payload=self._dump_event_payload(event_payload))
 
     def try_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> None:
-        self.client.publish(topic=self.topic, payload=json.dumps(event_payload_batch))
+        self.client.publish(topic=self.topic, payload=self._dump_event_payload(event_payload_batch))
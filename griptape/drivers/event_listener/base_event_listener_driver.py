@@ -1,49 +1,108 @@
 from __future__ import annotations
 
+import atexit
+import contextvars
+import json
 import logging
+import queue
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, Optional, Union
 
 from attrs import Factory, define, field
 
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
 from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
-from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
-    from griptape.events import BaseEvent
+    from griptape.events import BaseEvent, CompactEventEncoder
 
 logger = logging.getLogger(__name__)
 
+OverflowPolicy = Literal["block", "drop"]
+# Seconds without events after which the publisher thread stops. It's started again by the next event.
+PUBLISHER_IDLE_TIMEOUT = 10.0
+
 
 @define
 class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC):
+    """Base class for Event Listener Drivers.
+
+    Events are queued and published from a long-lived publisher thread, so publishing an event doesn't wait on the
+    external service. When batched, the publisher thread publishes a batch once it is full, or once its first event has
+    waited for `linger_time`.
+
+    Attributes:
+        batched: Whether to publish events in batches.
+        batch_size: Maximum number of events in a batch.
+        max_batch_bytes: Maximum size in bytes of a batch's JSON encoded events. An event larger than this is published
+            in a batch of its own. Defaults to no limit.
+        linger_time: Seconds to wait for a batch to fill before publishing it. If None, batches are only published once
+            full or flushed.
+        max_queue_size: Maximum number of events waiting to be published.
+        overflow_policy: What to do when the queue is full. `block` waits for room in the queue, and `drop` discards
+            the event.
+        event_encoder: Optional encoder for sending events in a compact wire format instead of JSON. Receivers decode
+            them with `CompactEventEncoder.decode`.
+        flush_timeout: Seconds `flush_events` waits for the events to be published. If None, it waits indefinitely.
+    """
+
     batched: bool = field(default=True, kw_only=True)
     batch_size: int = field(default=10, kw_only=True)
+    max_batch_bytes: Optional[int] = field(default=None, kw_only=True)
+    linger_time: Optional[float] = field(default=1.0, kw_only=True)
+    max_queue_size: int = field(default=1000, kw_only=True)
+    overflow_policy: OverflowPolicy = field(default="block", kw_only=True)
+    event_encoder: Optional[CompactEventEncoder] = field(default=None, kw_only=True)
+    flush_timeout: Optional[float] = field(default=30.0, kw_only=True)
 
     _batch: list[dict] = field(default=Factory(list), kw_only=True)
+    _batch_bytes: int = field(default=0, init=False, eq=False)
+    _batch_context: Optional[contextvars.Context] = field(default=None, init=False, eq=False)
+    _queue: queue.Queue[Union[tuple[dict, contextvars.Context], threading.Event]] = field(
+        default=Factory(lambda self: queue.Queue(maxsize=self.max_queue_size), takes_self=True), init=False, eq=False
+    )
+    _publisher_thread: Optional[threading.Thread] = field(default=None, init=False, eq=False)
+    _publisher_thread_lock: threading.Lock = field(default=Factory(threading.Lock), init=False, eq=False)
 
     @property
     def batch(self) -> list[dict]:
+        """The batch the publisher thread is filling."""
         return self._batch
 
     def publish_event(self, event: BaseEvent | dict) -> None:
         event_payload = event if isinstance(event, dict) else event.to_dict()
+        # The event is published in the caller's context, as if it were published from the caller's thread.
+        item = (event_payload, contextvars.copy_context())
 
-        with self.create_futures_executor() as futures_executor:
-            if self.batched:
-                self._batch.append(event_payload)
-                if len(self.batch) >= self.batch_size:
-                    futures_executor.submit(with_contextvars(self._safe_publish_event_payload_batch), self.batch)
-                    self._batch = []
-            else:
-                futures_executor.submit(with_contextvars(self._safe_publish_event_payload), event_payload)
+        self._start_publisher_thread()
+
+        if self.overflow_policy == "drop":
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                logger.warning("Dropped event because the queue of events to publish is full")
+        else:
+            self._queue.put(item)
+
+        # The publisher thread may have stopped before the event was queued.
+        self._start_publisher_thread()
 
     def flush_events(self) -> None:
-        if self.batch:
-            with self.create_futures_executor() as futures_executor:
-                futures_executor.submit(with_contextvars(self._safe_publish_event_payload_batch), self.batch)
-            self._batch = []
+        """Publishes the queued events and the current batch, and waits for them to be published."""
+        if self._publisher_thread is None and self._queue.empty() and not self.batch:
+            return
+
+        self._start_publisher_thread()
+
+        flushed = threading.Event()
+        self._queue.put(flushed)
+
+        # Doesn't wait forever if the publisher thread stopped without publishing the events.
+        if not flushed.wait(self.flush_timeout):
+            logger.warning("Timed out after %s seconds waiting for events to be published", self.flush_timeout)
 
     @abstractmethod
     def try_publish_event_payload(self, event_payload: dict) -> None: ...
@@ -51,6 +110,94 @@ class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC
     @abstractmethod
     def try_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> None: ...
 
+    def _dump_event_payload(self, event_payload: dict | list[dict]) -> str:
+        if self.event_encoder is None:
+            return json.dumps(event_payload)
+        else:
+            return self.event_encoder.encode_text(event_payload)
+
+    def _start_publisher_thread(self) -> None:
+        with self._publisher_thread_lock:
+            # Also restarts the publisher thread in a forked process, where it no longer runs.
+            if self._publisher_thread is None or not self._publisher_thread.is_alive():
+                self._publisher_thread = threading.Thread(
+                    target=self._run_publisher, name=f"{type(self).__name__}Publisher", daemon=True
+                )
+                self._publisher_thread.start()
+
+                _drivers_with_publisher_threads[id(self)] = self
+
+    def _run_publisher(self) -> None:
+        batch_deadline = None
+
+        while True:
+            timeout = PUBLISHER_IDLE_TIMEOUT if batch_deadline is None else max(batch_deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                if batch_deadline is not None:
+                    # The first event of the batch has waited for `linger_time`.
+                    self._publish_batch()
+                    batch_deadline = None
+                elif self._stop_publisher_thread():
+                    return
+                continue
+
+            if isinstance(item, threading.Event):
+                self._publish_batch()
+                batch_deadline = None
+                item.set()
+            elif self.batched:
+                event_payload, self._batch_context = item
+                self._add_to_batch(event_payload)
+
+                if not self.batch:
+                    batch_deadline = None
+                elif batch_deadline is None and self.linger_time is not None:
+                    batch_deadline = time.monotonic() + self.linger_time
+            else:
+                event_payload, context = item
+                context.run(self._safe_publish_event_payload, event_payload)
+
+    def _stop_publisher_thread(self) -> bool:
+        # An idle publisher thread stops so that it doesn't keep the Driver alive.
+        with self._publisher_thread_lock:
+            if self._queue.empty() and not self.batch:
+                self._publisher_thread = None
+
+                return True
+
+        return False
+
+    def _add_to_batch(self, event_payload: dict) -> None:
+        event_payload_bytes = 0
+
+        if self.max_batch_bytes is not None:
+            event_payload_bytes = len(json.dumps(event_payload).encode())
+
+            if self.batch and self._batch_bytes + event_payload_bytes > self.max_batch_bytes:
+                self._publish_batch()
+
+        self._batch.append(event_payload)
+        self._batch_bytes += event_payload_bytes
+
+        if len(self.batch) >= self.batch_size or (
+            self.max_batch_bytes is not None and self._batch_bytes >= self.max_batch_bytes
+        ):
+            self._publish_batch()
+
+    def _publish_batch(self) -> None:
+        if self.batch:
+            batch = self.batch
+            self._batch = []
+            self._batch_bytes = 0
+
+            # Like publishing from the caller whose event was added to the batch last.
+            if self._batch_context is None:
+                self._safe_publish_event_payload_batch(batch)
+            else:
+                self._batch_context.run(self._safe_publish_event_payload_batch, batch)
+
     def _safe_publish_event_payload(self, event_payload: dict) -> None:
         try:
             for attempt in self.retrying():
@@ -66,3 +213,16 @@ class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC
                     self.try_publish_event_payload_batch(event_payload_batch)
         except Exception:
             logger.warning("Failed to publish event batch after %s attempts", self.max_attempts, exc_info=True)
+
+
+# Drivers are keyed by id since they aren't hashable. Entries are removed once the Drivers are garbage collected.
+_drivers_with_publisher_threads: weakref.WeakValueDictionary[int, BaseEventListenerDriver] = (
+    weakref.WeakValueDictionary()
+)
+
+
+@atexit.register
+def _flush_events_at_exit() -> None:
+    # Publisher threads are daemon threads, so events still queued at exit would otherwise be lost.
+    for driver in list(_drivers_with_publisher_threads.values()):
+        driver.flush_events()
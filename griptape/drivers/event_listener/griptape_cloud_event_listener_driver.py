@@ -67,8 +67,13 @@ class GriptapeCloudEventListenerDriver(BaseEventListenerDriver):
         }
 
     def _post_event(self, json: list[dict] | dict) -> None:
-        requests.post(
-            url=urljoin(self.base_url.strip("/"), f"/api/structure-runs/{self.structure_run_id}/events"),
-            json=json,
-            headers=self.headers,
-        ).raise_for_status()
+        url = urljoin(self.base_url.strip("/"), f"/api/structure-runs/{self.structure_run_id}/events")
+
+        if self.event_encoder is None:
+            requests.post(url=url, json=json, headers=self.headers).raise_for_status()
+        else:
+            requests.post(
+                url=url,
+                data=self.event_encoder.encode(json),
+                headers={"Content-Type": self.event_encoder.content_type, **self.headers},
+            ).raise_for_status()
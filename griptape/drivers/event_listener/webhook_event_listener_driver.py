@@ -12,9 +12,18 @@ class WebhookEventListenerDriver(BaseEventListenerDriver):
     headers: dict = field(default=None, kw_only=True)
 
     def try_publish_event_payload(self, event_payload: dict) -> None:
-        response = requests.post(url=self.webhook_url, json=event_payload, headers=self.headers)
-        response.raise_for_status()
+        self._post_event(event_payload)
 
     def try_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> None:
-        response = requests.post(url=self.webhook_url, json=event_payload_batch, headers=self.headers)
+        self._post_event(event_payload_batch)
+
+    def _post_event(self, json: list[dict] | dict) -> None:
+        if self.event_encoder is None:
+            response = requests.post(url=self.webhook_url, json=json, headers=self.headers)
+        else:
+            response = requests.post(
+                url=self.webhook_url,
+                data=self.event_encoder.encode(json),
+                headers={"Content-Type": self.event_encoder.content_type, **(self.headers or {})},
+            )
         response.raise_for_status()
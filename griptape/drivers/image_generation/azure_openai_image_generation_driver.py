@@ -6,6 +6,7 @@ import openai
 from attrs import Factory, define, field
 
 from griptape.drivers.image_generation.openai import OpenAiImageGenerationDriver
+from griptape.utils import ClientRegistry
 from griptape.utils.decorators import lazy_property
 
 
@@ -39,7 +40,8 @@ class AzureOpenAiImageGenerationDriver(OpenAiImageGenerationDriver):
 
     @lazy_property()
     def client(self) -> openai.AzureOpenAI:
-        return openai.AzureOpenAI(
+        return ClientRegistry.get_client(
+            openai.AzureOpenAI,
             organization=self.organization,
             api_key=self.api_key,
             api_version=self.api_version,
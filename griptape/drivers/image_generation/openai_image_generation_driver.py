@@ -8,6 +8,7 @@ from attrs import define, field
 
 from griptape.artifacts import ImageArtifact
 from griptape.drivers.image_generation import BaseImageGenerationDriver
+from griptape.utils import ClientRegistry
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -57,7 +58,9 @@ class OpenAiImageGenerationDriver(BaseImageGenerationDriver):
 
     @lazy_property()
     def client(self) -> openai.OpenAI:
-        return openai.OpenAI(api_key=self.api_key, base_url=self.base_url, organization=self.organization)
+        return ClientRegistry.get_client(
+            openai.OpenAI, api_key=self.api_key, base_url=self.base_url, organization=self.organization
+        )
 
     def try_text_to_image(self, prompts: list[str], negative_prompts: Optional[list[str]] = None) -> ImageArtifact:
         prompt = ", ".join(prompts)
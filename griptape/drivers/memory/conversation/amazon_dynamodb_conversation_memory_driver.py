@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
 
@@ -18,6 +18,25 @@ if TYPE_CHECKING:
 
 @define
 class AmazonDynamoDbConversationMemoryDriver(BaseConversationMemoryDriver):
+    """A Conversation Memory Driver for Amazon DynamoDB.
+
+    The conversation's metadata is stored in the item identified by the partition key value and the optional sort key
+    value, along with its number of Runs. Each Run is stored in an item of its own, whose partition key value is
+    suffixed with the Run's number, so that appending a Run only writes that Run, and Runs beyond `max_runs` are
+    deleted as new ones are appended.
+
+    Attributes:
+        session: The boto3 Session.
+        table_name: The name of the table.
+        partition_key: The name of the table's partition key.
+        value_attribute_key: The name of the attribute holding the serialized conversation and Runs.
+        partition_key_value: The partition key value of the conversation.
+        sort_key: The name of the table's sort key, for tables with a composite primary key.
+        sort_key_value: The sort key value of the conversation.
+    """
+
+    BATCH_GET_ITEM_SIZE = 100
+
     session: boto3.Session = field(default=Factory(lambda: import_optional_dependency("boto3").Session()), kw_only=True)
     table_name: str = field(kw_only=True, metadata={"serializable": True})
     partition_key: str = field(kw_only=True, metadata={"serializable": True})
@@ -31,27 +50,130 @@ class AmazonDynamoDbConversationMemoryDriver(BaseConversationMemoryDriver):
     def table(self) -> Table:
         return self.session.resource("dynamodb").Table(self.table_name)
 
+    @property
+    def run_count_attribute_key(self) -> str:
+        return f"{self.value_attribute_key}_run_count"
+
     def store(self, runs: list[Run], metadata: dict) -> None:
+        stored_run_numbers = self._get_stored_run_numbers()
+
+        with self.table.batch_writer() as batch:
+            for run_number, run in enumerate(runs):
+                batch.put_item(Item={**self._get_key(run_number), self.value_attribute_key: run.to_json()})
+
+            # Deletes the items of Runs beyond the new conversation, so that they aren't loaded or left behind.
+            for run_number in stored_run_numbers:
+                if run_number >= len(runs):
+                    batch.delete_item(Key=self._get_key(run_number))
+
         self.table.update_item(
             Key=self._get_key(),
-            UpdateExpression="set #attr = :value",
-            ExpressionAttributeNames={"#attr": self.value_attribute_key},
+            UpdateExpression="set #attr = :value, #run_count = :run_count",
+            ExpressionAttributeNames={"#attr": self.value_attribute_key, "#run_count": self.run_count_attribute_key},
             ExpressionAttributeValues={
-                ":value": json.dumps(self._to_params_dict(runs, metadata)),
+                ":value": json.dumps(self._to_params_dict([], metadata)),
+                ":run_count": len(runs),
             },
         )
 
+    def append(
+        self, runs: list[Run], metadata: dict[str, Any], *, max_runs: Optional[int] = None, all_runs: bool = False
+    ) -> None:
+        response = self.table.update_item(
+            Key=self._get_key(),
+            UpdateExpression="set #attr = :value add #run_count :one",
+            ExpressionAttributeNames={"#attr": self.value_attribute_key, "#run_count": self.run_count_attribute_key},
+            ExpressionAttributeValues={
+                ":value": json.dumps({**self._to_params_dict([], metadata), "max_runs": max_runs}),
+                ":one": 1,
+            },
+            ReturnValues="UPDATED_NEW",
+        )
+        run_number = int(response["Attributes"][self.run_count_attribute_key]) - 1  # pyright: ignore[reportArgumentType]
+
+        with self.table.batch_writer() as batch:
+            batch.put_item(Item={**self._get_key(run_number), self.value_attribute_key: runs[-1].to_json()})
+
+            if max_runs and run_number >= max_runs:
+                batch.delete_item(Key=self._get_key(run_number - max_runs))
+
     def load(self) -> tuple[list[Run], dict[str, Any]]:
+        return self._load(lambda first_run_number, run_count: range(first_run_number, run_count))
+
+    def load_last_runs(self, count: int, *, offset: int = 0) -> tuple[list[Run], dict[str, Any]]:
+        def get_run_numbers(first_run_number: int, run_count: int) -> range:
+            end = max(run_count - offset, first_run_number)
+
+            return range(max(end - max(count, 0), first_run_number), end)
+
+        return self._load(get_run_numbers)
+
+    def _load(self, get_run_numbers: Callable[[int, int], range]) -> tuple[list[Run], dict[str, Any]]:
         response = self.table.get_item(Key=self._get_key())
 
         if "Item" in response and self.value_attribute_key in response["Item"]:
             memory_dict = json.loads(response["Item"][self.value_attribute_key])
-            return self._from_params_dict(memory_dict)
+            runs, metadata = self._from_params_dict(memory_dict)
+
+            if runs:
+                # Conversations stored before Runs had items of their own are moved to them.
+                self.store(runs, metadata)
+                run_count = len(runs)
+                max_runs = None
+            else:
+                run_count = int(response["Item"].get(self.run_count_attribute_key, 0))  # pyright: ignore[reportArgumentType]
+                max_runs = memory_dict.get("max_runs")
+
+            # Runs beyond `max_runs` were deleted.
+            first_run_number = max(run_count - max_runs, 0) if max_runs else 0
+
+            return self._load_runs(get_run_numbers(first_run_number, run_count)), metadata
         else:
             return [], {}
 
-    def _get_key(self) -> dict[str, str | int]:
-        key: dict[str, str | int] = {self.partition_key: self.partition_key_value}
+    def _get_stored_run_numbers(self) -> range:
+        response = self.table.get_item(Key=self._get_key())
+
+        if "Item" in response:
+            run_count = int(response["Item"].get(self.run_count_attribute_key, 0))  # pyright: ignore[reportArgumentType]
+            max_runs = json.loads(response["Item"].get(self.value_attribute_key, "{}")).get("max_runs")  # pyright: ignore[reportArgumentType]
+
+            return range(max(run_count - max_runs, 0) if max_runs else 0, run_count)
+        else:
+            return range(0)
+
+    def _load_runs(self, run_numbers: range) -> list[Run]:
+        from griptape.memory.structure import Run
+
+        # The table's client is used, so that Runs are loaded from the same table they're written to. As the client of a
+        # resource, it serializes and deserializes attribute values like the table does.
+        client = self.table.meta.client
+        table_name = self.table.name
+        items = {}
+
+        for i in range(0, len(run_numbers), self.BATCH_GET_ITEM_SIZE):
+            request_items = {
+                table_name: {"Keys": [self._get_key(n) for n in run_numbers[i : i + self.BATCH_GET_ITEM_SIZE]]}
+            }
+
+            while request_items:
+                response = client.batch_get_item(RequestItems=request_items)  # pyright: ignore[reportArgumentType]
+
+                for item in response["Responses"].get(table_name, []):
+                    items[item[self.partition_key]] = item
+                request_items = response.get("UnprocessedKeys")
+
+        return [
+            Run.from_json(items[key][self.value_attribute_key])  # pyright: ignore[reportArgumentType]
+            for n in run_numbers
+            if (key := self._get_key(n)[self.partition_key]) in items
+        ]
+
+    def _get_key(self, run_number: Optional[int] = None) -> dict[str, str | int]:
+        partition_key_value = (
+            self.partition_key_value if run_number is None else f"{self.partition_key_value}#{run_number}"
+        )
+        key: dict[str, str | int] = {self.partition_key: partition_key_value}
 
         if self.sort_key is not None and self.sort_key_value is not None:
             key[self.sort_key] = self.sort_key_value
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from griptape.mixins.serializable_mixin import SerializableMixin
 
@@ -16,6 +16,47 @@ class BaseConversationMemoryDriver(SerializableMixin, ABC):
     @abstractmethod
     def load(self) -> tuple[list[Run], dict[str, Any]]: ...
 
+    def append(
+        self, runs: list[Run], metadata: dict[str, Any], *, max_runs: Optional[int] = None, all_runs: bool = False
+    ) -> None:
+        """Appends the last Run of a conversation to the stored conversation.
+
+        By default, the Runs are stored if they're the whole conversation. Otherwise, the stored conversation is loaded
+        and stored again with the Run. Drivers that can append the Run without rewriting the conversation override
+        this, so that each write costs the same regardless of the conversation's length.
+
+        Args:
+            runs: The conversation's most recent Runs, ending with the Run to append. Older Runs may not be loaded.
+            metadata: The conversation's metadata.
+            max_runs: Maximum number of Runs to keep, if any. Older Runs are dropped.
+            all_runs: Whether `runs` holds the whole conversation, so that it can be stored without loading the stored
+                conversation.
+        """
+        if all_runs:
+            stored_runs = list(runs)
+        else:
+            stored_runs, _ = self.load()
+            stored_runs.append(runs[-1])
+
+        self.store(stored_runs[-max_runs:] if max_runs else stored_runs, metadata)
+
+    def load_last_runs(self, count: int, *, offset: int = 0) -> tuple[list[Run], dict[str, Any]]:
+        """Loads the most recent Runs of the stored conversation.
+
+        By default, the whole conversation is loaded before keeping the requested Runs. Drivers that can load some of
+        the Runs override this, so that loading costs the same regardless of the conversation's length.
+
+        Args:
+            count: Maximum number of Runs to load.
+            offset: Number of most recent Runs to skip, for paging through older Runs.
+
+        Returns:
+            The Runs, oldest first, and the conversation's metadata.
+        """
+        runs, metadata = self.load()
+
+        return self._slice_last_runs(runs, count, offset), metadata
+
     def _to_params_dict(self, runs: list[Run], metadata: dict[str, Any]) -> dict:
         return {"runs": [run.to_dict() for run in runs], "metadata": metadata}
 
@@ -23,3 +64,8 @@ class BaseConversationMemoryDriver(SerializableMixin, ABC):
         from griptape.memory.structure import Run
 
         return [Run.from_dict(run) for run in params_dict.get("runs", [])], params_dict.get("metadata", {})
+
+    def _slice_last_runs(self, runs: list, count: int, offset: int) -> list:
+        end = max(len(runs) - offset, 0)
+
+        return runs[max(end - count, 0) : end]
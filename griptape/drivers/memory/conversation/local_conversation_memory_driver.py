@@ -15,21 +15,91 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class LocalConversationMemoryDriver(BaseConversationMemoryDriver):
+    """A Conversation Memory Driver for a local file.
+
+    The file holds a line of JSON with the whole conversation, followed by a line of JSON for each Run appended since.
+    With `max_runs`, the file is rewritten with only the kept Runs once as many Runs have been appended.
+
+    Attributes:
+        persist_file: Path of the file to persist the conversation to. If None, the conversation isn't persisted.
+    """
+
     persist_file: Optional[str] = field(default=None, metadata={"serializable": True})
+    _appended_runs_count: Optional[int] = field(default=None, init=False, eq=False)
 
     def store(self, runs: list[Run], metadata: dict[str, Any]) -> None:
         if self.persist_file is not None:
-            Path(self.persist_file).write_text(json.dumps(self._to_params_dict(runs, metadata)))
+            Path(self.persist_file).write_text(json.dumps(self._to_params_dict(runs, metadata)) + "\n")
+            self._appended_runs_count = 0
+
+    def append(
+        self, runs: list[Run], metadata: dict[str, Any], *, max_runs: Optional[int] = None, all_runs: bool = False
+    ) -> None:
+        if self.persist_file is None:
+            return
+
+        if self._appended_runs_count is None:
+            # Counts the Runs appended to the file so far.
+            self._read_records()
+
+        with Path(self.persist_file).open("a") as file:
+            file.write(json.dumps({"run": runs[-1].to_dict(), "metadata": metadata, "max_runs": max_runs}) + "\n")
+        self._appended_runs_count = (self._appended_runs_count or 0) + 1
+
+        if max_runs and self._appended_runs_count >= max_runs:
+            # The file holds Runs that were dropped, so it's rewritten with only the kept Runs.
+            self.store(*self.load())
 
     def load(self) -> tuple[list[Run], dict[str, Any]]:
+        run_dicts, metadata = self._read_records()
+
+        return self._runs_from_dicts(run_dicts), metadata
+
+    def load_last_runs(self, count: int, *, offset: int = 0) -> tuple[list[Run], dict[str, Any]]:
+        run_dicts, metadata = self._read_records()
+
+        # Only the requested Runs are deserialized.
+        return self._runs_from_dicts(self._slice_last_runs(run_dicts, count, offset)), metadata
+
+    def _read_records(self) -> tuple[list[dict], dict[str, Any]]:
         if (
             self.persist_file is not None
             and os.path.exists(self.persist_file)
             and (loaded_str := Path(self.persist_file).read_text()) is not None
         ):
             try:
-                return self._from_params_dict(json.loads(loaded_str))
+                return self._parse_records([json.loads(line) for line in loaded_str.splitlines() if line.strip()])
             except Exception as e:
                 raise ValueError(f"Unable to load data from {self.persist_file}") from e
 
         return [], {}
+
+    def _parse_records(self, records: list[dict]) -> tuple[list[dict], dict[str, Any]]:
+        run_dicts = []
+        metadata = {}
+        appended_runs_count = 0
+
+        for record in records:
+            if "run" in record:
+                run_dicts.append(record["run"])
+                appended_runs_count += 1
+            else:
+                # A line with the whole conversation.
+                run_dicts = list(record.get("runs", []))
+                appended_runs_count = 0
+            metadata = record.get("metadata", {})
+
+            if record.get("max_runs"):
+                run_dicts = run_dicts[-record["max_runs"] :]
+
+        self._appended_runs_count = appended_runs_count
+
+        return run_dicts, metadata
+
+    def _runs_from_dicts(self, run_dicts: list[dict]) -> list[Run]:
+        from griptape.memory.structure import Run
+
+        try:
+            return [Run.from_dict(run_dict) for run_dict in run_dicts]
+        except Exception as e:
+            raise ValueError(f"Unable to load data from {self.persist_file}") from e
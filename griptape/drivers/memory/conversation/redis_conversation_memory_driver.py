@@ -23,6 +23,9 @@ class RedisConversationMemoryDriver(BaseConversationMemoryDriver):
     retrieve, and query conversations in a structured manner.
     Proper setup of the Redis instance and RediSearch is necessary for the driver to function correctly.
 
+    The conversation's metadata is stored in the index's hash, and its Runs in a list, so that each new Run is appended
+    with `RPUSH`, and Runs beyond `max_runs` are dropped with `LTRIM`.
+
     Attributes:
         host: The host of the Redis instance.
         port: The port of the Redis instance.
@@ -52,11 +55,47 @@ class RedisConversationMemoryDriver(BaseConversationMemoryDriver):
         ),
     )
 
+    @property
+    def runs_key(self) -> str:
+        return f"{self.index}:{self.conversation_id}:runs"
+
     def store(self, runs: list[Run], metadata: dict[str, Any]) -> None:
-        self.client.hset(self.index, self.conversation_id, json.dumps(self._to_params_dict(runs, metadata)))
+        pipeline = self.client.pipeline()
+        pipeline.hset(self.index, self.conversation_id, json.dumps(self._to_params_dict([], metadata)))
+        pipeline.delete(self.runs_key)
+        if runs:
+            pipeline.rpush(self.runs_key, *[json.dumps(run.to_dict()) for run in runs])
+        pipeline.execute()
+
+    def append(
+        self, runs: list[Run], metadata: dict[str, Any], *, max_runs: Optional[int] = None, all_runs: bool = False
+    ) -> None:
+        pipeline = self.client.pipeline()
+        pipeline.hset(self.index, self.conversation_id, json.dumps(self._to_params_dict([], metadata)))
+        pipeline.rpush(self.runs_key, json.dumps(runs[-1].to_dict()))
+        if max_runs:
+            pipeline.ltrim(self.runs_key, -max_runs, -1)
+        pipeline.execute()
 
     def load(self) -> tuple[list[Run], dict[str, Any]]:
+        return self._load(0, -1)
+
+    def load_last_runs(self, count: int, *, offset: int = 0) -> tuple[list[Run], dict[str, Any]]:
+        # An empty range when no Runs are requested.
+        return self._load(-(offset + count), -(offset + 1)) if count > 0 else self._load(1, 0)
+
+    def _load(self, start: int, end: int) -> tuple[list[Run], dict[str, Any]]:
+        from griptape.memory.structure import Run
+
         memory_json = self.client.hget(self.index, self.conversation_id)
         if memory_json is not None:
-            return self._from_params_dict(json.loads(memory_json))  # pyright: ignore[reportArgumentType] https://github.com/redis/redis-py/issues/2399
+            runs, metadata = self._from_params_dict(json.loads(memory_json))  # pyright: ignore[reportArgumentType] https://github.com/redis/redis-py/issues/2399
+
+            if runs:
+                # Conversations stored before Runs were kept in a list are moved to one.
+                self.store(runs, metadata)
+
+            runs = [Run.from_dict(json.loads(run_json)) for run_json in self.client.lrange(self.runs_key, start, end)]  # pyright: ignore[reportGeneralTypeIssues]
+
+            return runs, metadata
         return [], {}
@@ -0,0 +1,3 @@
+from griptape.drivers.memory.conversation.sqlite_conversation_memory_driver import SqliteConversationMemoryDriver
+
+__all__ = ["SqliteConversationMemoryDriver"]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import closing, contextmanager
+from typing import TYPE_CHECKING, Any, Optional
+
+from attrs import Factory, define, field
+
+from griptape.drivers.memory.conversation import BaseConversationMemoryDriver
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from griptape.memory.structure import Run
+
+
+@define(kw_only=True)
+class SqliteConversationMemoryDriver(BaseConversationMemoryDriver):
+    """A Conversation Memory Driver for a SQLite database.
+
+    Each Run is stored in a row of its own, so appending a Run only inserts that row, and the most recent Runs are
+    loaded without reading the rest of the conversation. The database is used in WAL mode, which lets several
+    processes read and write the same conversations concurrently.
+
+    Attributes:
+        database: Path of the SQLite database file.
+        conversation_id: The id of the conversation.
+        timeout: Seconds to wait for another connection's write to finish.
+    """
+
+    database: str = field(metadata={"serializable": True})
+    conversation_id: str = field(default=Factory(lambda: uuid.uuid4().hex), metadata={"serializable": True})
+    timeout: float = field(default=30.0, metadata={"serializable": True})
+    _tables_created: bool = field(default=False, init=False, eq=False)
+
+    def store(self, runs: list[Run], metadata: dict[str, Any]) -> None:
+        with self._transaction() as connection:
+            self._store_metadata(connection, metadata)
+            connection.execute("DELETE FROM conversation_runs WHERE conversation_id = ?", (self.conversation_id,))
+            connection.executemany(
+                "INSERT INTO conversation_runs (conversation_id, run_id, created_at, run) VALUES (?, ?, ?, ?)",
+                [(self.conversation_id, run.id, time.time(), run.to_json()) for run in runs],
+            )
+
+    def append(
+        self, runs: list[Run], metadata: dict[str, Any], *, max_runs: Optional[int] = None, all_runs: bool = False
+    ) -> None:
+        with self._transaction() as connection:
+            self._store_metadata(connection, metadata)
+            connection.execute(
+                "INSERT INTO conversation_runs (conversation_id, run_id, created_at, run) VALUES (?, ?, ?, ?)",
+                (self.conversation_id, runs[-1].id, time.time(), runs[-1].to_json()),
+            )
+
+            if max_runs:
+                connection.execute(
+                    "DELETE FROM conversation_runs WHERE conversation_id = ? AND id <= ("
+                    "SELECT id FROM conversation_runs WHERE conversation_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?"
+                    ")",
+                    (self.conversation_id, self.conversation_id, max_runs),
+                )
+
+    def load(self) -> tuple[list[Run], dict[str, Any]]:
+        return self._load("SELECT run FROM conversation_runs WHERE conversation_id = ? ORDER BY id", ())
+
+    def load_last_runs(self, count: int, *, offset: int = 0) -> tuple[list[Run], dict[str, Any]]:
+        runs, metadata = self._load(
+            "SELECT run FROM conversation_runs WHERE conversation_id = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+            (max(count, 0), offset),
+        )
+
+        return runs[::-1], metadata
+
+    def _load(self, query: str, params: tuple) -> tuple[list[Run], dict[str, Any]]:
+        from griptape.memory.structure import Run
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT metadata FROM conversations WHERE conversation_id = ?", (self.conversation_id,)
+            ).fetchone()
+            if row is None:
+                return [], {}
+
+            rows = connection.execute(query, (self.conversation_id, *params)).fetchall()
+
+        return [Run.from_json(run_json) for (run_json,) in rows], json.loads(row[0])
+
+    def _store_metadata(self, connection: sqlite3.Connection, metadata: dict[str, Any]) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO conversations (conversation_id, metadata) VALUES (?, ?)",
+            (self.conversation_id, json.dumps(metadata)),
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as connection:
+            # Takes the write lock up front, so that concurrent writers wait for each other instead of failing.
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with closing(sqlite3.connect(self.database, timeout=self.timeout, isolation_level=None)) as connection:
+            if not self._tables_created:
+                self._create_tables(connection)
+
+            yield connection
+
+    def _create_tables(self, connection: sqlite3.Connection) -> None:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS conversations (conversation_id TEXT PRIMARY KEY, metadata TEXT NOT NULL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS conversation_runs ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "conversation_id TEXT NOT NULL, "
+            "run_id TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "run TEXT NOT NULL"
+            ")"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS conversation_runs_conversation_id ON conversation_runs (conversation_id, id)"
+        )
+        self._tables_created = True
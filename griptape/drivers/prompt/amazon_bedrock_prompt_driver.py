@@ -142,13 +142,13 @@ class AmazonBedrockPromptDriver(BasePromptDriver):
         return params
 
     def __to_bedrock_messages(self, messages: list[Message]) -> list[dict]:
-        return [
-            {
-                "role": self.__to_bedrock_role(message),
-                "content": [self.__to_bedrock_message_content(content) for content in message.content],
-            }
-            for message in messages
-        ]
+        return [self._convert_message(message, self.__to_bedrock_message) for message in messages]
+
+    def __to_bedrock_message(self, message: Message) -> dict:
+        return {
+            "role": self.__to_bedrock_role(message),
+            "content": [self.__to_bedrock_message_content(content) for content in message.content],
+        }
 
     def __to_bedrock_role(self, message: Message) -> str:
         if message.is_assistant():
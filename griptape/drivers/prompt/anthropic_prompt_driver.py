@@ -33,7 +33,7 @@ from griptape.common import (
 from griptape.configs import Defaults
 from griptape.drivers.prompt import BasePromptDriver
 from griptape.tokenizers import AnthropicTokenizer, BaseTokenizer
-from griptape.utils import import_optional_dependency
+from griptape.utils import ClientRegistry, import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -77,7 +77,7 @@ class AnthropicPromptDriver(BasePromptDriver):
 
     @lazy_property()
     def client(self) -> Client:
-        return import_optional_dependency("anthropic").Anthropic(api_key=self.api_key)
+        return ClientRegistry.get_client(import_optional_dependency("anthropic").Anthropic, api_key=self.api_key)
 
     @structured_output_strategy.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
     def validate_structured_output_strategy(self, _: Attribute, value: str) -> str:
@@ -144,10 +144,10 @@ class AnthropicPromptDriver(BasePromptDriver):
         return params
 
     def __to_anthropic_messages(self, messages: list[Message]) -> list[dict]:
-        return [
-            {"role": self.__to_anthropic_role(message), "content": self.__to_anthropic_content(message)}
-            for message in messages
-        ]
+        return [self._convert_message(message, self.__to_anthropic_message) for message in messages]
+
+    def __to_anthropic_message(self, message: Message) -> dict:
+        return {"role": self.__to_anthropic_role(message), "content": self.__to_anthropic_content(message)}
 
     def __to_anthropic_role(self, message: Message) -> str:
         if message.is_assistant():
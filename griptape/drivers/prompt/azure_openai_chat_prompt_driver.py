@@ -6,6 +6,7 @@ import openai
 from attrs import Factory, define, field
 
 from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.utils import ClientRegistry
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -42,7 +43,8 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
 
     @lazy_property()
     def client(self) -> openai.AzureOpenAI:
-        return openai.AzureOpenAI(
+        return ClientRegistry.get_client(
+            openai.AzureOpenAI,
             organization=self.organization,
             api_key=self.api_key,
             api_version=self.api_version,
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
+import threading
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Literal, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar
 
 from attrs import Factory, define, field
 
-from griptape.artifacts import BaseArtifact, TextArtifact
+from griptape.artifacts import BaseArtifact, BlobArtifact, ImageArtifact, TextArtifact
 from griptape.common import (
     ActionCallDeltaMessageContent,
     ActionCallMessageContent,
+    ActionResultMessageContent,
     BaseDeltaMessageContent,
     DeltaMessage,
     Message,
@@ -19,6 +25,8 @@ from griptape.common import (
 )
 from griptape.events import (
     ActionChunkEvent,
+    BaseChunkEvent,
+    ChunkEventCoalescer,
     EventBus,
     FinishPromptEvent,
     StartPromptEvent,
@@ -27,6 +35,7 @@ from griptape.events import (
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.rules.json_schema_rule import JsonSchemaRule
+from griptape.utils import SingleFlight, str_to_hash
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -35,6 +44,8 @@ if TYPE_CHECKING:
 
 StructuredOutputStrategy = Literal["native", "tool", "rule"]
 
+T = TypeVar("T")
+
 
 @define(kw_only=True)
 class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
@@ -50,6 +61,10 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         stream: Whether to stream the completion or not. `CompletionChunkEvent`s will be published to the `Structure` if one is provided.
         use_native_tools: Whether to use LLM's native function calling capabilities. Must be supported by the model.
         extra_params: Extra parameters to pass to the model.
+        chunk_event_coalescer: An optional `ChunkEventCoalescer` to publish fewer, larger Chunk Events when streaming.
+        message_cache_size: The number of converted Messages to keep so that unchanged Messages aren't converted to the
+            provider's format on every run. Set to 0 to disable.
+        single_flight: Whether concurrent identical runs should share one request. Streamed runs are never shared.
     """
 
     temperature: float = field(default=0.1, metadata={"serializable": True})
@@ -63,20 +78,28 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         default="rule", kw_only=True, metadata={"serializable": True}
     )
     extra_params: dict = field(factory=dict, kw_only=True, metadata={"serializable": True})
+    chunk_event_coalescer: Optional[ChunkEventCoalescer] = field(default=None, kw_only=True)
+    message_cache_size: int = field(default=256, kw_only=True)
+    single_flight: bool = field(default=False, kw_only=True)
+    _message_cache: OrderedDict[tuple, Any] = field(factory=OrderedDict, init=False, eq=False)
+    _message_cache_lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False)
+    _in_flight_runs: SingleFlight = field(factory=SingleFlight, init=False, eq=False)
 
     def before_run(self, prompt_stack: PromptStack) -> None:
         self._init_structured_output(prompt_stack)
-        EventBus.publish_event(StartPromptEvent(model=self.model, prompt_stack=prompt_stack))
+        if EventBus.has_listeners(StartPromptEvent):
+            EventBus.publish_event(StartPromptEvent(model=self.model, prompt_stack=prompt_stack))
 
     def after_run(self, result: Message) -> None:
-        EventBus.publish_event(
-            FinishPromptEvent(
-                model=self.model,
-                result=result.value,
-                input_token_count=result.usage.input_tokens,
-                output_token_count=result.usage.output_tokens,
-            ),
-        )
+        if EventBus.has_listeners(FinishPromptEvent):
+            EventBus.publish_event(
+                FinishPromptEvent(
+                    model=self.model,
+                    result=result.value,
+                    input_token_count=result.usage.input_tokens,
+                    output_token_count=result.usage.output_tokens,
+                ),
+            )
 
     @observable(tags=["PromptDriver.run()"])
     def run(self, prompt_input: PromptStack | BaseArtifact) -> Message:
@@ -97,6 +120,49 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         else:
             raise Exception("prompt driver failed after all retry attempts")
 
+    def request_hash(self, prompt_stack: PromptStack) -> str:
+        """Hashes the content of a Prompt Stack, so that equal requests have equal hashes.
+
+        Artifact ids are ignored since the Prompt Stack is rebuilt with new artifacts on every run. Blob Artifacts, such
+        as images and audio, are hashed by a digest of their value and their format.
+
+        Args:
+            prompt_stack: The Prompt Stack to hash.
+
+        Returns:
+            The hash.
+        """
+        request = {
+            "messages": [
+                {
+                    "role": message.role,
+                    "content": [
+                        {"type": type(content).__name__, "value": self._request_hash_value(content.artifact)}
+                        for content in message.content
+                    ],
+                }
+                for message in prompt_stack.messages
+            ],
+            "tools": [
+                tool.to_native_tool_name(activity) for tool in prompt_stack.tools for activity in tool.activities()
+            ],
+            "output_schema": (
+                prompt_stack.output_schema.json_schema("Output") if prompt_stack.output_schema is not None else None
+            ),
+        }
+
+        return str_to_hash(json.dumps(request, sort_keys=True, default=str))
+
+    def _request_hash_value(self, artifact: BaseArtifact) -> str | dict[str, Any]:
+        # The text of a Blob Artifact only describes its format and size, so its bytes are hashed instead.
+        if isinstance(artifact, BlobArtifact):
+            return {
+                "digest": hashlib.sha256(artifact.value).hexdigest(),
+                "format": getattr(artifact, "format", None),
+            }
+        else:
+            return artifact.to_text()
+
     def prompt_stack_to_string(self, prompt_stack: PromptStack) -> str:
         """Converts a Prompt Stack to a string for token counting or model prompt_input.
 
@@ -129,6 +195,55 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     @abstractmethod
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]: ...
 
+    def _convert_message(self, message: Message, converter: Callable[[Message], T]) -> T:
+        """Converts a Message to the provider's format, reusing the result of a previous conversion if unchanged.
+
+        Args:
+            message: The Message to convert.
+            converter: A function that converts a Message to the provider's format.
+
+        Returns:
+            The converted Message. Must not be modified, since it may be shared between runs.
+        """
+        key = self._message_cache_key(message)
+        if key is None or self.message_cache_size <= 0:
+            return converter(message)
+
+        key = (converter, *key)
+        with self._message_cache_lock:
+            if key in self._message_cache:
+                self._message_cache.move_to_end(key)
+
+                return self._message_cache[key]
+
+        converted_message = converter(message)
+
+        with self._message_cache_lock:
+            self._message_cache[key] = converted_message
+            while len(self._message_cache) > self.message_cache_size:
+                self._message_cache.popitem(last=False)
+
+        return converted_message
+
+    def _message_cache_key(self, message: Message) -> Optional[tuple]:
+        key: list = [message.role]
+
+        for content in message.content:
+            artifact = content.artifact
+            # Only cache Messages whose content can be cheaply compared.
+            if not isinstance(artifact.value, (str, bytes)):
+                return None
+
+            content_key = (type(content), type(artifact), artifact.value)
+            if isinstance(artifact, ImageArtifact):
+                content_key += (artifact.format,)
+            if isinstance(content, ActionResultMessageContent):
+                content_key += (content.action.tag, content.action.name, content.action.path)
+
+            key.append(content_key)
+
+        return tuple(key)
+
     def _init_structured_output(self, prompt_stack: PromptStack) -> None:
         from griptape.tools import StructuredOutputTool
 
@@ -158,35 +273,52 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
                     )
 
     def __process_run(self, prompt_stack: PromptStack) -> Message:
-        return self.try_run(prompt_stack)
+        if self.single_flight:
+            result, is_shared = self._in_flight_runs.do(
+                self.request_hash(prompt_stack), lambda: self.try_run(prompt_stack)
+            )
+
+            # Callers may modify the result, so each gets their own copy.
+            return copy.deepcopy(result) if is_shared else result
+        else:
+            return self.try_run(prompt_stack)
 
     def __process_stream(self, prompt_stack: PromptStack) -> Message:
         delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
         usage = DeltaMessage.Usage()
 
-        # Aggregate all content deltas from the stream
-        message_deltas = self.try_stream(prompt_stack)
-        for message_delta in message_deltas:
-            usage += message_delta.usage
-            content = message_delta.content
-
-            if content is not None:
-                if content.index in delta_contents:
-                    delta_contents[content.index].append(content)
-                else:
-                    delta_contents[content.index] = [content]
-                if isinstance(content, TextDeltaMessageContent):
-                    EventBus.publish_event(TextChunkEvent(token=content.text, index=content.index))
-                elif isinstance(content, ActionCallDeltaMessageContent):
-                    EventBus.publish_event(
-                        ActionChunkEvent(
+        def chunk_events() -> Iterator[BaseChunkEvent]:
+            nonlocal usage
+            publish_text_chunks = EventBus.has_listeners(TextChunkEvent)
+            publish_action_chunks = EventBus.has_listeners(ActionChunkEvent)
+
+            # Aggregate all content deltas from the stream
+            message_deltas = self.try_stream(prompt_stack)
+            for message_delta in message_deltas:
+                usage += message_delta.usage
+                content = message_delta.content
+
+                if content is not None:
+                    if content.index in delta_contents:
+                        delta_contents[content.index].append(content)
+                    else:
+                        delta_contents[content.index] = [content]
+                    if isinstance(content, TextDeltaMessageContent) and publish_text_chunks:
+                        yield TextChunkEvent(token=content.text, index=content.index)
+                    elif isinstance(content, ActionCallDeltaMessageContent) and publish_action_chunks:
+                        yield ActionChunkEvent(
                             partial_input=content.partial_input,
                             tag=content.tag,
                             name=content.name,
                             path=content.path,
                             index=content.index,
-                        ),
-                    )
+                        )
+
+        events = chunk_events()
+        if self.chunk_event_coalescer is not None:
+            events = self.chunk_event_coalescer.coalesce(events)
+        for event in events:
+            EventBus.publish_event(event)
 
         # Build a complete content from the content deltas
         return self.__build_message(list(delta_contents.values()), usage)
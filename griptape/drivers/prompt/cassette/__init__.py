@@ -0,0 +1,4 @@
+from griptape.drivers.prompt.recording_prompt_driver import RecordingPromptDriver
+from griptape.drivers.prompt.replay_prompt_driver import ReplayPromptDriver
+
+__all__ = ["RecordingPromptDriver", "ReplayPromptDriver"]
@@ -26,7 +26,7 @@ from griptape.common.prompt_stack.contents.action_call_delta_message_content imp
 from griptape.configs import Defaults
 from griptape.drivers.prompt import BasePromptDriver
 from griptape.tokenizers import BaseTokenizer, CohereTokenizer
-from griptape.utils import import_optional_dependency
+from griptape.utils import ClientRegistry, import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -60,7 +60,11 @@ class CoherePromptDriver(BasePromptDriver):
 
     @lazy_property()
     def client(self) -> ClientV2:
-        return import_optional_dependency("cohere").ClientV2(self.api_key, log_warning_experimental_features=False)
+        return ClientRegistry.get_client(
+            import_optional_dependency("cohere").ClientV2,
+            api_key=self.api_key,
+            log_warning_experimental_features=False,
+        )
 
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
@@ -123,48 +127,52 @@ class CoherePromptDriver(BasePromptDriver):
         return params
 
     def __to_cohere_messages(self, messages: list[Message]) -> list[dict]:
-        cohere_messages = []
-
-        for message in messages:
-            # If the message only contains textual content we can send it as a single content.
-            if message.is_text():
-                cohere_messages.append({"role": self.__to_cohere_role(message), "content": message.to_text()})
-            # Action results must be sent as separate messages.
-            elif message.has_any_content_type(ActionResultMessageContent):
-                cohere_messages.extend(
-                    {
-                        "role": self.__to_cohere_role(message, action_result),
-                        "content": self.__to_cohere_message_content(action_result),
-                        "tool_call_id": action_result.action.tag,
-                    }
-                    for action_result in message.get_content_type(ActionResultMessageContent)
-                )
+        return [
+            cohere_message
+            for message in messages
+            for cohere_message in self._convert_message(message, self.__to_cohere_message)
+        ]
 
-                if message.has_any_content_type(TextMessageContent):
-                    cohere_messages.append({"role": self.__to_cohere_role(message), "content": message.to_text()})
-            else:
-                cohere_message = {
-                    "role": self.__to_cohere_role(message),
-                    "content": [
-                        self.__to_cohere_message_content(content)
-                        for content in [
-                            content for content in message.content if not isinstance(content, ActionCallMessageContent)
-                        ]
-                    ],
+    def __to_cohere_message(self, message: Message) -> list[dict]:
+        # If the message only contains textual content we can send it as a single content.
+        if message.is_text():
+            return [{"role": self.__to_cohere_role(message), "content": message.to_text()}]
+        # Action results must be sent as separate messages.
+        elif message.has_any_content_type(ActionResultMessageContent):
+            cohere_messages = [
+                {
+                    "role": self.__to_cohere_role(message, action_result),
+                    "content": self.__to_cohere_message_content(action_result),
+                    "tool_call_id": action_result.action.tag,
                 }
+                for action_result in message.get_content_type(ActionResultMessageContent)
+            ]
 
-                # Action calls must be attached to the message, not sent as content.
-                action_call_content = [
-                    content for content in message.content if isinstance(content, ActionCallMessageContent)
-                ]
-                if action_call_content:
-                    cohere_message["tool_calls"] = [
-                        self.__to_cohere_message_content(action_call) for action_call in action_call_content
+            if message.has_any_content_type(TextMessageContent):
+                cohere_messages.append({"role": self.__to_cohere_role(message), "content": message.to_text()})
+
+            return cohere_messages
+        else:
+            cohere_message = {
+                "role": self.__to_cohere_role(message),
+                "content": [
+                    self.__to_cohere_message_content(content)
+                    for content in [
+                        content for content in message.content if not isinstance(content, ActionCallMessageContent)
                     ]
+                ],
+            }
 
-                cohere_messages.append(cohere_message)
+            # Action calls must be attached to the message, not sent as content.
+            action_call_content = [
+                content for content in message.content if isinstance(content, ActionCallMessageContent)
+            ]
+            if action_call_content:
+                cohere_message["tool_calls"] = [
+                    self.__to_cohere_message_content(action_call) for action_call in action_call_content
+                ]
 
-        return cohere_messages
+            return [cohere_message]
 
     def __to_cohere_message_content(self, content: BaseMessageContent) -> str | dict | list[dict]:
         if isinstance(content, ActionCallMessageContent):
@@ -172,19 +172,22 @@ class GooglePromptDriver(BasePromptDriver):
         return params
 
     def __to_google_messages(self, prompt_stack: PromptStack) -> ContentsType:
-        types = import_optional_dependency("google.generativeai.types")
-
         return [
-            types.ContentDict(
-                {
-                    "role": self.__to_google_role(message),
-                    "parts": [self.__to_google_message_content(content) for content in message.content],
-                },
-            )
+            self._convert_message(message, self.__to_google_message)
             for message in prompt_stack.messages
             if not message.is_system()
         ]
 
+    def __to_google_message(self, message: Message) -> ContentDict:
+        types = import_optional_dependency("google.generativeai.types")
+
+        return types.ContentDict(
+            {
+                "role": self.__to_google_role(message),
+                "parts": [self.__to_google_message_content(content) for content in message.content],
+            },
+        )
+
     def __to_google_role(self, message: Message) -> str:
         if message.is_assistant():
             return "model"
@@ -0,0 +1,3 @@
+from griptape.drivers.prompt.hedged_prompt_driver import HedgedPromptDriver
+
+__all__ = ["HedgedPromptDriver"]
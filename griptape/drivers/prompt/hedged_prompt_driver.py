@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from concurrent import futures
+from typing import TYPE_CHECKING, Callable, Optional
+
+from attrs import Attribute, Factory, define, field
+
+from griptape.common import observable
+from griptape.configs.defaults_config import Defaults
+from griptape.drivers.prompt import BasePromptDriver
+from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
+from griptape.utils import with_contextvars
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from griptape.common import DeltaMessage, Message, PromptStack
+    from griptape.tokenizers import BaseTokenizer
+
+logger = logging.getLogger(Defaults.logging_config.logger_name)
+
+
+@define(kw_only=True)
+class HedgedPromptDriver(BasePromptDriver, FuturesExecutorMixin):
+    """Prompt Driver that hedges slow requests and falls back on errors across an ordered list of Prompt Drivers.
+
+    The first Prompt Driver is the primary. When it takes longer than `hedge_percentile` of its recently observed
+    latencies, a duplicate request is sent to the next Prompt Driver and whichever finishes first is used.
+    When a Prompt Driver fails with one of `fallback_exception_types`, the next Prompt Driver is tried.
+    Streaming runs only fall back, and only if the failure happens before the first delta is received.
+
+    Attributes:
+        prompt_drivers: Ordered Prompt Drivers to try, starting with the primary.
+        model: The model name. Defaults to the primary Prompt Driver's model.
+        tokenizer: The tokenizer. Defaults to the primary Prompt Driver's tokenizer.
+        hedge_percentile: Percentile (0-100) of the primary's observed latencies after which a hedged request is sent.
+            Set to `None` to disable hedging.
+        hedge_delay: Delay, in seconds, before hedging while fewer than `min_latency_samples` latencies are observed.
+        min_latency_samples: Number of observed latencies required before `hedge_percentile` is used.
+        latency_window_size: Number of most recent primary latencies to compute the percentile from.
+        fallback_exception_types: Exception types that cause the next Prompt Driver to be tried.
+    """
+
+    prompt_drivers: list[BasePromptDriver] = field()
+    model: str = field(
+        default=Factory(lambda self: self.prompt_drivers[0].model, takes_self=True),
+        metadata={"serializable": True},
+    )
+    tokenizer: BaseTokenizer = field(default=Factory(lambda self: self.prompt_drivers[0].tokenizer, takes_self=True))
+    hedge_percentile: Optional[float] = field(default=95, metadata={"serializable": True})
+    hedge_delay: float = field(default=10, metadata={"serializable": True})
+    min_latency_samples: int = field(default=10, metadata={"serializable": True})
+    latency_window_size: int = field(default=100, metadata={"serializable": True})
+    fallback_exception_types: tuple[type[Exception], ...] = field(default=Factory(lambda: (Exception,)))
+    _latencies: deque[float] = field(
+        default=Factory(lambda self: deque(maxlen=self.latency_window_size), takes_self=True), init=False
+    )
+
+    @hedge_percentile.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_hedge_percentile(self, _: Attribute, hedge_percentile: Optional[float]) -> None:
+        if hedge_percentile is not None and not 0 <= hedge_percentile <= 100:
+            raise ValueError("has to be between 0 and 100")
+
+    @property
+    def current_hedge_delay(self) -> Optional[float]:
+        """Seconds to wait on a request before hedging, or `None` if hedging is disabled."""
+        if self.hedge_percentile is None:
+            return None
+        if len(self._latencies) < self.min_latency_samples:
+            return self.hedge_delay
+
+        latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self.hedge_percentile / 100))
+
+        return latencies[index]
+
+    @observable
+    def try_run(self, prompt_stack: PromptStack) -> Message:
+        executor = self.create_futures_executor()
+        remaining_drivers = list(self.prompt_drivers)
+        pending: dict[futures.Future[Message], BasePromptDriver] = {}
+        errors: list[Exception] = []
+
+        def submit_next() -> None:
+            if not remaining_drivers:
+                return
+
+            prompt_driver = remaining_drivers.pop(0)
+            future = executor.submit(with_contextvars(prompt_driver.try_run), prompt_stack)
+            if prompt_driver is self.prompt_drivers[0]:
+                future.add_done_callback(self._record_latency_callback(time.perf_counter()))
+            pending[future] = prompt_driver
+
+        try:
+            submit_next()
+
+            while pending:
+                timeout = self.current_hedge_delay if remaining_drivers else None
+                done, _ = futures.wait(pending, timeout=timeout, return_when=futures.FIRST_COMPLETED)
+
+                if not done:
+                    logger.debug("%s exceeded hedge delay of %ss, hedging", type(self).__name__, timeout)
+                    submit_next()
+                    continue
+
+                for future in done:
+                    prompt_driver = pending.pop(future)
+                    try:
+                        return future.result()
+                    except self.fallback_exception_types as e:
+                        logger.debug("%s failed, falling back: %s", type(prompt_driver).__name__, e)
+                        errors.append(e)
+
+                if not pending:
+                    submit_next()
+        finally:
+            # Losing requests can't be interrupted once started, so don't wait on them.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        raise errors[-1]
+
+    @observable
+    def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
+        errors: list[Exception] = []
+
+        for prompt_driver in self.prompt_drivers:
+            delta_messages = prompt_driver.try_stream(prompt_stack)
+            try:
+                first_delta_message = next(delta_messages)
+            except StopIteration:
+                return
+            except self.fallback_exception_types as e:
+                logger.debug("%s failed, falling back: %s", type(prompt_driver).__name__, e)
+                errors.append(e)
+                continue
+
+            yield first_delta_message
+            yield from delta_messages
+
+            return
+
+        raise errors[-1]
+
+    def _record_latency_callback(self, start_time: float) -> Callable[[futures.Future[Message]], None]:
+        def record_latency(future: futures.Future[Message]) -> None:
+            if not future.cancelled() and future.exception() is None:
+                self._latencies.append(time.perf_counter() - start_time)
+
+        return record_latency
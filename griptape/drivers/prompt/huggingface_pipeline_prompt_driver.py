@@ -10,7 +10,7 @@ from griptape.common import DeltaMessage, Message, PromptStack, TextMessageConte
 from griptape.configs import Defaults
 from griptape.drivers.prompt import BasePromptDriver
 from griptape.tokenizers import HuggingFaceTokenizer
-from griptape.utils import import_optional_dependency
+from griptape.utils import ModelRegistry, import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -56,11 +56,15 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
 
     @lazy_property()
     def pipeline(self) -> TextGenerationPipeline:
-        return import_optional_dependency("transformers").pipeline(
-            task="text-generation",
-            model=self.model,
-            max_new_tokens=self.max_tokens,
-            tokenizer=self.tokenizer.tokenizer,
+        # `max_new_tokens` is passed on every run, so Drivers with different `max_tokens` can share a pipeline.
+        return ModelRegistry.get_model(
+            ("text-generation", self.model, self.tokenizer.tokenizer),
+            lambda: import_optional_dependency("transformers").pipeline(
+                task="text-generation",
+                model=self.model,
+                tokenizer=self.tokenizer.tokenizer,
+            ),
+            owner=self,
         )
 
     @observable
@@ -27,6 +27,7 @@ from griptape.common import (
 from griptape.configs.defaults_config import Defaults
 from griptape.drivers.prompt import BasePromptDriver
 from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
+from griptape.utils import ClientRegistry
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -98,7 +99,8 @@ class OpenAiChatPromptDriver(BasePromptDriver):
 
     @lazy_property()
     def client(self) -> openai.OpenAI:
-        return openai.OpenAI(
+        return ClientRegistry.get_client(
+            openai.OpenAI,
             base_url=self.base_url,
             api_key=self.api_key,
             organization=self.organization,
@@ -193,51 +195,55 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         return params
 
     def __to_openai_messages(self, messages: list[Message]) -> list[dict]:
-        openai_messages = []
-
-        for message in messages:
-            # If the message only contains textual content we can send it as a single content.
-            if message.is_text():
-                openai_messages.append({"role": self.__to_openai_role(message), "content": message.to_text()})
-            # Action results must be sent as separate messages.
-            elif message.has_any_content_type(ActionResultMessageContent):
-                openai_messages.extend(
-                    {
-                        "role": self.__to_openai_role(message, action_result),
-                        "content": self.__to_openai_message_content(action_result),
-                        "tool_call_id": action_result.action.tag,
-                    }
-                    for action_result in message.get_content_type(ActionResultMessageContent)
-                )
+        return [
+            openai_message
+            for message in messages
+            for openai_message in self._convert_message(message, self.__to_openai_message)
+        ]
 
-                if message.has_any_content_type(TextMessageContent):
-                    openai_messages.append({"role": self.__to_openai_role(message), "content": message.to_text()})
-            else:
-                openai_message = {
-                    "role": self.__to_openai_role(message),
-                    "content": [
-                        self.__to_openai_message_content(content)
-                        for content in [
-                            content for content in message.content if not isinstance(content, ActionCallMessageContent)
-                        ]
-                    ],
+    def __to_openai_message(self, message: Message) -> list[dict]:
+        # If the message only contains textual content we can send it as a single content.
+        if message.is_text():
+            return [{"role": self.__to_openai_role(message), "content": message.to_text()}]
+        # Action results must be sent as separate messages.
+        elif message.has_any_content_type(ActionResultMessageContent):
+            openai_messages = [
+                {
+                    "role": self.__to_openai_role(message, action_result),
+                    "content": self.__to_openai_message_content(action_result),
+                    "tool_call_id": action_result.action.tag,
                 }
-                # Some OpenAi-compatible services don't accept an empty array for content
-                if not openai_message["content"]:
-                    openai_message["content"] = ""
+                for action_result in message.get_content_type(ActionResultMessageContent)
+            ]
 
-                # Action calls must be attached to the message, not sent as content.
-                action_call_content = [
-                    content for content in message.content if isinstance(content, ActionCallMessageContent)
-                ]
-                if action_call_content:
-                    openai_message["tool_calls"] = [
-                        self.__to_openai_message_content(action_call) for action_call in action_call_content
-                    ]
+            if message.has_any_content_type(TextMessageContent):
+                openai_messages.append({"role": self.__to_openai_role(message), "content": message.to_text()})
 
-                openai_messages.append(openai_message)
+            return openai_messages
+        else:
+            openai_message = {
+                "role": self.__to_openai_role(message),
+                "content": [
+                    self.__to_openai_message_content(content)
+                    for content in [
+                        content for content in message.content if not isinstance(content, ActionCallMessageContent)
+                    ]
+                ],
+            }
+            # Some OpenAi-compatible services don't accept an empty array for content
+            if not openai_message["content"]:
+                openai_message["content"] = ""
+
+            # Action calls must be attached to the message, not sent as content.
+            action_call_content = [
+                content for content in message.content if isinstance(content, ActionCallMessageContent)
+            ]
+            if action_call_content:
+                openai_message["tool_calls"] = [
+                    self.__to_openai_message_content(action_call) for action_call in action_call_content
+                ]
 
-        return openai_messages
+            return [openai_message]
 
     def __to_openai_role(self, message: Message, message_content: Optional[BaseMessageContent] = None) -> str:
         if message.is_system():
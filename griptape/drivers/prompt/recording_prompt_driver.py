@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from attrs import Factory, define, field
+
+from griptape.common import observable
+from griptape.drivers.prompt import BasePromptDriver
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from griptape.common import DeltaMessage, Message, PromptStack
+    from griptape.drivers.prompt.base_prompt_driver import StructuredOutputStrategy
+    from griptape.tokenizers import BaseTokenizer
+
+
+@define(kw_only=True)
+class RecordingPromptDriver(BasePromptDriver):
+    """Prompt Driver that records the requests and responses of another Prompt Driver to a cassette file.
+
+    Each response is appended to the cassette as a line of JSON, keyed by a hash of its request. Runs record the
+    response's latency, and streams record the delay before each delta. A `ReplayPromptDriver` can serve the responses
+    from the cassette.
+
+    Attributes:
+        prompt_driver: The Prompt Driver to record.
+        cassette_file: Path of the cassette file to append to.
+        model: The model name. Defaults to the recorded Prompt Driver's model.
+        tokenizer: The tokenizer. Defaults to the recorded Prompt Driver's tokenizer.
+    """
+
+    prompt_driver: BasePromptDriver = field()
+    cassette_file: str = field(metadata={"serializable": True})
+    model: str = field(
+        default=Factory(lambda self: self.prompt_driver.model, takes_self=True),
+        metadata={"serializable": True},
+    )
+    tokenizer: BaseTokenizer = field(default=Factory(lambda self: self.prompt_driver.tokenizer, takes_self=True))
+    stream: bool = field(
+        default=Factory(lambda self: self.prompt_driver.stream, takes_self=True),
+        metadata={"serializable": True},
+    )
+    use_native_tools: bool = field(
+        default=Factory(lambda self: self.prompt_driver.use_native_tools, takes_self=True),
+        metadata={"serializable": True},
+    )
+    structured_output_strategy: StructuredOutputStrategy = field(
+        default=Factory(lambda self: self.prompt_driver.structured_output_strategy, takes_self=True),
+        metadata={"serializable": True},
+    )
+    ignored_exception_types: tuple[type[Exception], ...] = field(
+        default=Factory(lambda self: self.prompt_driver.ignored_exception_types, takes_self=True)
+    )
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @observable
+    def try_run(self, prompt_stack: PromptStack) -> Message:
+        request_hash = self.request_hash(prompt_stack)
+        start_time = time.perf_counter()
+
+        message = self.prompt_driver.try_run(prompt_stack)
+
+        self._record(
+            {
+                "request_hash": request_hash,
+                "stream": False,
+                "latency": time.perf_counter() - start_time,
+                "message": message.to_dict(),
+            }
+        )
+
+        return message
+
+    @observable
+    def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
+        request_hash = self.request_hash(prompt_stack)
+        deltas = []
+        last_time = time.perf_counter()
+
+        for delta_message in self.prompt_driver.try_stream(prompt_stack):
+            deltas.append({"delay": time.perf_counter() - last_time, "delta_message": delta_message.to_dict()})
+
+            yield delta_message
+
+            # Time spent by the consumer isn't part of the provider's latency.
+            last_time = time.perf_counter()
+
+        self._record({"request_hash": request_hash, "stream": True, "deltas": deltas})
+
+    def _record(self, interaction: dict) -> None:
+        with self._lock, Path(self.cassette_file).open("a") as file:
+            file.write(json.dumps(interaction) + "\n")
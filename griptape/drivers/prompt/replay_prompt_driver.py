@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from attrs import Factory, define, field
+
+from griptape.common import DeltaMessage, Message, observable
+from griptape.drivers.prompt import BasePromptDriver
+from griptape.tokenizers import BaseTokenizer, SimpleTokenizer
+from griptape.utils.decorators import lazy_property
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from griptape.common import PromptStack
+
+
+@define(kw_only=True)
+class ReplayPromptDriver(BasePromptDriver):
+    """Prompt Driver that replays responses from a cassette file recorded by a `RecordingPromptDriver`.
+
+    Responses are looked up by a hash of the request and replayed with their recorded latency. Requests recorded more
+    than once are replayed in the order they were recorded, starting over after the last one. To match the recorded
+    requests, configure `stream`, `use_native_tools`, and `structured_output_strategy` like the recorded Prompt Driver.
+
+    Attributes:
+        cassette_file: Path of the cassette file to replay.
+        latency_scale: Factor applied to the recorded latencies. Set to 0 to replay without delay.
+        model: The model name.
+        tokenizer: The tokenizer. Use the recorded Prompt Driver's tokenizer for realistic token counts.
+        max_attempts: Replays are deterministic, so failed requests aren't retried by default.
+    """
+
+    cassette_file: str = field(metadata={"serializable": True})
+    latency_scale: float = field(default=1.0, metadata={"serializable": True})
+    model: str = field(default="replay", metadata={"serializable": True})
+    tokenizer: BaseTokenizer = field(
+        default=Factory(
+            lambda: SimpleTokenizer(
+                characters_per_token=4,
+                max_input_tokens=BaseTokenizer.DEFAULT_MAX_INPUT_TOKENS,
+                max_output_tokens=BaseTokenizer.DEFAULT_MAX_OUTPUT_TOKENS,
+            )
+        ),
+    )
+    max_attempts: int = field(default=1)
+    _interactions: Optional[dict[tuple[str, bool], list[dict]]] = field(default=None, init=False)
+    _interaction_indexes: dict[tuple[str, bool], int] = field(factory=lambda: defaultdict(int), init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @lazy_property()
+    def interactions(self) -> dict[tuple[str, bool], list[dict]]:
+        interactions = defaultdict(list)
+
+        with Path(self.cassette_file).open() as file:
+            for line in file:
+                if line.strip():
+                    interaction = json.loads(line)
+                    interactions[(interaction["request_hash"], interaction["stream"])].append(interaction)
+
+        return dict(interactions)
+
+    @observable
+    def try_run(self, prompt_stack: PromptStack) -> Message:
+        interaction = self._next_interaction(prompt_stack, stream=False)
+
+        self._sleep(interaction["latency"])
+
+        return Message.from_dict(interaction["message"])
+
+    @observable
+    def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
+        interaction = self._next_interaction(prompt_stack, stream=True)
+
+        for delta in interaction["deltas"]:
+            self._sleep(delta["delay"])
+
+            yield DeltaMessage.from_dict(delta["delta_message"])
+
+    def _next_interaction(self, prompt_stack: PromptStack, *, stream: bool) -> dict:
+        key = (self.request_hash(prompt_stack), stream)
+        interactions = self.interactions.get(key)
+
+        if not interactions:
+            raise ValueError(f"No {'streamed ' if stream else ''}response recorded for request {key[0]}")
+
+        with self._lock:
+            index = self._interaction_indexes[key]
+            self._interaction_indexes[key] = (index + 1) % len(interactions)
+
+        return interactions[index]
+
+    def _sleep(self, seconds: float) -> None:
+        if self.latency_scale > 0:
+            time.sleep(seconds * self.latency_scale)
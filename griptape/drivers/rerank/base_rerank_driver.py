@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import ABC
 from typing import TYPE_CHECKING
 
-from attrs import define
+from attrs import define, field
+
+from griptape.utils import SingleFlight
 
 if TYPE_CHECKING:
     from griptape.artifacts import TextArtifact
@@ -11,5 +13,33 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class BaseRerankDriver(ABC):
-    @abstractmethod
-    def run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]: ...
+    """Base Rerank Driver.
+
+    Subclasses implement `try_run`, which `run` calls with `single_flight`. Subclasses that implement `run` instead
+    keep working, but don't support `single_flight`.
+
+    Attributes:
+        single_flight: Whether concurrent requests to rerank the same query and artifacts should share one request.
+    """
+
+    single_flight: bool = field(default=False)
+    _in_flight_reranks: SingleFlight = field(factory=SingleFlight, init=False, eq=False)
+
+    def run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]:
+        if self.single_flight:
+            result, is_shared = self._in_flight_reranks.do(
+                (query, tuple(artifact.to_text() for artifact in artifacts)), lambda: self.try_run(query, artifacts)
+            )
+
+            if is_shared:
+                # The result holds the other caller's artifacts, so return this caller's artifacts with the same text.
+                artifacts_by_text = {artifact.to_text(): artifact for artifact in artifacts}
+
+                return [artifacts_by_text[artifact.to_text()] for artifact in result]
+            else:
+                return result
+        else:
+            return self.try_run(query, artifacts)
+
+    def try_run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]:
+        raise NotImplementedError(f"{self.__class__.__name__} must implement try_run or run.")
@@ -23,7 +23,7 @@ class CohereRerankDriver(BaseRerankDriver):
         default=Factory(lambda self: import_optional_dependency("cohere").Client(self.api_key), takes_self=True),
     )
 
-    def run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]:
+    def try_run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]:
         # Cohere errors out if passed "empty" documents or no documents at all
         artifacts_dict = {str(hash(a.to_text())): a for a in artifacts if a}
 
@@ -7,6 +7,7 @@ from attrs import define, field
 
 from griptape.artifacts.audio_artifact import AudioArtifact
 from griptape.drivers.text_to_speech import BaseTextToSpeechDriver
+from griptape.utils import ClientRegistry
 from griptape.utils.decorators import lazy_property
 
 
@@ -28,7 +29,8 @@ class OpenAiTextToSpeechDriver(BaseTextToSpeechDriver):
 
     @lazy_property()
     def client(self) -> openai.OpenAI:
-        return openai.OpenAI(
+        return ClientRegistry.get_client(
+            openai.OpenAI,
             api_key=self.api_key,
             base_url=self.base_url,
             organization=self.organization,
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import define, field
@@ -14,6 +13,8 @@ from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from griptape.drivers.embedding import BaseEmbeddingDriver
 
 
@@ -21,13 +22,13 @@ if TYPE_CHECKING:
 class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
     DEFAULT_QUERY_COUNT = 5
 
-    @dataclass
+    @define
     class Entry:
-        id: str
-        vector: Optional[list[float]] = None
-        score: Optional[float] = None
-        meta: Optional[dict] = None
-        namespace: Optional[str] = None
+        id: str = field()
+        vector: Optional[list[float]] = field(default=None)
+        score: Optional[float] = field(default=None)
+        meta: Optional[dict] = field(default=None)
+        namespace: Optional[str] = field(default=None)
 
         @staticmethod
         def from_dict(data: dict[str, Any]) -> BaseVectorStoreDriver.Entry:
@@ -37,6 +38,9 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
             return BaseArtifact.from_json(self.meta["artifact"])  # pyright: ignore[reportOptionalSubscript]
 
     embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    _corpus_version: str = field(default="", init=False, eq=False)
+    _unnamespaced_corpus_version: str = field(default="", init=False, eq=False)
+    _namespace_corpus_versions: dict[str, str] = field(factory=dict, init=False, eq=False)
 
     def upsert_text_artifacts(
         self,
@@ -44,32 +48,60 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         *,
         meta: Optional[dict] = None,
         **kwargs,
+    ) -> list[str] | dict[str, list[str]]:
+        # Artifacts are upserted in batches of the Embedding Driver's batch size, so that each batch is embedded in one
+        # request and written with one bulk upsert.
+        batch_size = max(self.embedding_driver.batch_size, 1)
+
+        try:
+            return self._upsert_text_artifacts(artifacts, batch_size=batch_size, meta=meta, **kwargs)
+        finally:
+            for namespace in artifacts if isinstance(artifacts, dict) else [None]:
+                self.bump_corpus_version(namespace)
+
+    def _upsert_text_artifacts(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        batch_size: int,
+        meta: Optional[dict] = None,
+        **kwargs,
     ) -> list[str] | dict[str, list[str]]:
         with self.create_futures_executor() as futures_executor:
             if isinstance(artifacts, list):
-                return utils.execute_futures_list(
+                batch_results = utils.execute_futures_list(
                     [
                         futures_executor.submit(
-                            with_contextvars(self.upsert_text_artifact), a, namespace=None, meta=meta, **kwargs
+                            with_contextvars(self._upsert_text_artifacts_batch),
+                            artifacts[i : i + batch_size],
+                            namespace=None,
+                            meta=meta,
+                            **kwargs,
                         )
-                        for a in artifacts
+                        for i in range(0, len(artifacts), batch_size)
                     ],
                 )
+
+                return [vector_id for vector_ids in batch_results for vector_id in vector_ids]
             else:
                 futures_dict = {}
 
                 for namespace, artifact_list in artifacts.items():
-                    for a in artifact_list:
-                        if not futures_dict.get(namespace):
-                            futures_dict[namespace] = []
-
-                        futures_dict[namespace].append(
-                            futures_executor.submit(
-                                with_contextvars(self.upsert_text_artifact), a, namespace=namespace, meta=meta, **kwargs
-                            )
+                    futures_dict[namespace] = [
+                        futures_executor.submit(
+                            with_contextvars(self._upsert_text_artifacts_batch),
+                            artifact_list[i : i + batch_size],
+                            namespace=namespace,
+                            meta=meta,
+                            **kwargs,
                         )
+                        for i in range(0, len(artifact_list), batch_size)
+                    ]
 
-                return utils.execute_futures_list_dict(futures_dict)
+                return {
+                    namespace: [vector_id for vector_ids in batch_results for vector_id in vector_ids]
+                    for namespace, batch_results in utils.execute_futures_list_dict(futures_dict).items()
+                }
 
     def upsert_text_artifact(
         self,
@@ -83,8 +115,7 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         meta = {} if meta is None else meta
 
         if vector_id is None:
-            value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
-            vector_id = self._get_default_vector_id(value)
+            vector_id = self._get_default_artifact_vector_id(artifact)
 
         if self.does_entry_exist(vector_id, namespace=namespace):
             return vector_id
@@ -93,7 +124,10 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
 
             vector = artifact.embedding or artifact.generate_embedding(self.embedding_driver)
 
-            return self.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
+            try:
+                return self.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
+            finally:
+                self.bump_corpus_version(namespace)
 
     def upsert_text(
         self,
@@ -123,6 +157,68 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
     @abstractmethod
     def delete_vector(self, vector_id: str) -> None: ...
 
+    @property
+    def supports_namespace_deletion(self) -> bool:
+        """Whether `delete_namespace` deletes the vectors of a namespace, and so frees their storage."""
+        return True
+
+    def delete_namespace(self, namespace: str) -> None:
+        """Deletes every vector in a namespace.
+
+        Args:
+            namespace: The namespace to delete.
+
+        Raises:
+            NotImplementedError: If the Driver doesn't support deletion.
+        """
+        # Checked before loading the namespace's entries, which may be costly, to delete them one at a time.
+        if not self.supports_namespace_deletion:
+            raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+
+        try:
+            for entry in self.load_entries(namespace=namespace):
+                self.delete_vector(entry.id)
+        finally:
+            self.bump_corpus_version(namespace)
+
+    def get_corpus_version(self, namespace: Optional[str] = None) -> Optional[str]:
+        """Returns a token that changes whenever the vectors a query in a namespace searches are written.
+
+        The token changes on writes made through this Driver, and on calls to `bump_corpus_version`. Writes made by
+        other processes aren't tracked, so the version is unknown until the namespace is written or versioned here.
+
+        Args:
+            namespace: The namespace. If None, the token changes on writes to any namespace.
+
+        Returns:
+            The corpus version token, or None if it's unknown.
+        """
+        if namespace is None:
+            return self._corpus_version or None
+        else:
+            namespace_version = self._namespace_corpus_versions.get(namespace, "")
+
+            if self._unnamespaced_corpus_version or namespace_version:
+                return f"{self._unnamespaced_corpus_version}:{namespace_version}"
+            else:
+                return None
+
+    def bump_corpus_version(self, namespace: Optional[str] = None, *, version: Optional[str] = None) -> None:
+        """Changes the corpus version token of a namespace, such as after writing vectors to it directly.
+
+        Args:
+            namespace: The namespace. If None, the tokens of every namespace change.
+            version: The new token, such as an id of the ingestion shared between the processes that use the vector
+                store. If None, a random token that's only known to this process.
+        """
+        version = uuid.uuid4().hex if version is None else version
+
+        self._corpus_version = version
+        if namespace is None:
+            self._unnamespaced_corpus_version = version
+        else:
+            self._namespace_corpus_versions[namespace] = version
+
     @abstractmethod
     def upsert_vector(
         self,
@@ -134,6 +230,39 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         **kwargs,
     ) -> str: ...
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[Sequence[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[Sequence[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Upserts several vectors into the same namespace.
+
+        Drivers whose data stores support bulk writes should override this to write the vectors in one request.
+
+        Args:
+            vectors: The vectors to upsert.
+            vector_ids: The ids of the vectors, in the order of the vectors.
+            namespace: The namespace of the vectors.
+            metas: The metadata of the vectors, in the order of the vectors.
+            kwargs: Additional keyword arguments to pass to `upsert_vector`.
+
+        Returns:
+            The ids of the upserted vectors.
+        """
+        try:
+            return [
+                self.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
+                for vector, vector_id, meta in zip(
+                    vectors, vector_ids or [None] * len(vectors), metas or [None] * len(vectors)
+                )
+            ]
+        finally:
+            self.bump_corpus_version(namespace)
+
     @abstractmethod
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[Entry]: ...
 
@@ -164,5 +293,54 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         vector = self.embedding_driver.embed_string(query)
         return self.query_vector(vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
 
+    def _upsert_text_artifacts_batch(
+        self,
+        artifacts: list[TextArtifact],
+        *,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str]:
+        # Subclasses that customize `upsert_text_artifact` keep upserting each Artifact with it.
+        if type(self).upsert_text_artifact is not BaseVectorStoreDriver.upsert_text_artifact:
+            return [
+                self.upsert_text_artifact(artifact, namespace=namespace, meta=dict(meta or {}), **kwargs)
+                for artifact in artifacts
+            ]
+
+        vector_ids = [self._get_default_artifact_vector_id(artifact) for artifact in artifacts]
+        new_artifacts = {
+            vector_id: artifact
+            for vector_id, artifact in zip(vector_ids, artifacts)
+            if not self.does_entry_exist(vector_id, namespace=namespace)
+        }
+
+        if new_artifacts:
+            metas = [{**(meta or {}), "artifact": artifact.to_json()} for artifact in new_artifacts.values()]
+            unembedded_artifacts = [artifact for artifact in new_artifacts.values() if not artifact.embedding]
+            embeddings = self.embedding_driver.embed_strings([str(artifact.value) for artifact in unembedded_artifacts])
+
+            for artifact, embedding in zip(unembedded_artifacts, embeddings):
+                artifact.embedding = embedding
+
+            upserted_vector_ids = self.upsert_vectors(
+                [artifact.embedding for artifact in new_artifacts.values()],  # pyright: ignore[reportArgumentType]
+                vector_ids=list(new_artifacts.keys()),
+                namespace=namespace,
+                metas=metas,
+                **kwargs,
+            )
+            vector_ids = [
+                dict(zip(new_artifacts.keys(), upserted_vector_ids)).get(vector_id, vector_id)
+                for vector_id in vector_ids
+            ]
+
+        return vector_ids
+
+    def _get_default_artifact_vector_id(self, artifact: TextArtifact) -> str:
+        value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
+
+        return self._get_default_vector_id(value)
+
     def _get_default_vector_id(self, value: str) -> str:
         return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
@@ -62,6 +62,15 @@ class GriptapeCloudVectorStoreDriver(BaseVectorStoreDriver):
     ) -> str:
         raise NotImplementedError(f"{self.__class__.__name__} does not support text artifact upsert.")
 
+    def upsert_text_artifacts(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str] | dict[str, list[str]]:
+        raise NotImplementedError(f"{self.__class__.__name__} does not support text artifact upsert.")
+
     def upsert_text(
         self,
         string: str,
@@ -116,5 +125,9 @@ class GriptapeCloudVectorStoreDriver(BaseVectorStoreDriver):
         entries = response.get("entries", [])
         return [BaseVectorStoreDriver.Entry.from_dict(entry) for entry in entries]
 
+    @property
+    def supports_namespace_deletion(self) -> bool:
+        return False
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
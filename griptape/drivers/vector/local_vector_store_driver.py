@@ -1,19 +1,22 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import operator
 import os
 import threading
-from dataclasses import asdict
-from typing import Callable, NoReturn, Optional, TextIO
+from typing import TYPE_CHECKING, Callable, NoReturn, Optional, TextIO
 
-from attrs import Factory, define, field
+from attrs import Factory, asdict, define, field
 from numpy import dot
 from numpy.linalg import norm
 
 from griptape import utils
 from griptape.drivers.vector import BaseVectorStoreDriver
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 @define(kw_only=True)
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
@@ -21,6 +24,7 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
     persist_file: Optional[str] = field(default=None)
     calculate_relatedness: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)))
     thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _persist_file_version: Optional[str] = field(default=None, init=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
         if self.persist_file is not None:
@@ -39,6 +43,10 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
                 else:
                     self.__save_entries_to_file(file)
 
+            # Versions the loaded entries by their content, so that processes that load the same file share a version.
+            with open(self.persist_file, "rb") as file:
+                self._persist_file_version = hashlib.sha256(file.read()).hexdigest()
+
     def load_entries_from_file(self, json_file: TextIO) -> dict[str, BaseVectorStoreDriver.Entry]:
         with self.thread_lock:
             data = json.load(json_file)
@@ -54,23 +62,44 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         meta: Optional[dict] = None,
         **kwargs,
     ) -> str:
-        vector_id = vector_id or utils.str_to_hash(str(vector))
+        return self.upsert_vectors([vector], vector_ids=[vector_id], namespace=namespace, metas=[meta], **kwargs)[0]
+
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[Sequence[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[Sequence[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        upserted_vector_ids = [
+            vector_id or utils.str_to_hash(str(vector))
+            for vector, vector_id in zip(vectors, vector_ids or [None] * len(vectors))
+        ]
 
         with self.thread_lock:
-            self.entries[self.__namespaced_vector_id(vector_id, namespace=namespace)] = self.Entry(
-                id=vector_id,
-                vector=vector,
-                meta=meta,
-                namespace=namespace,
-            )
+            for vector, vector_id, meta in zip(vectors, upserted_vector_ids, metas or [None] * len(vectors)):
+                self.entries[self.__namespaced_vector_id(vector_id, namespace=namespace)] = self.Entry(
+                    id=vector_id,
+                    vector=vector,
+                    meta=meta,
+                    namespace=namespace,
+                )
+        self.bump_corpus_version(namespace)
 
         if self.persist_file is not None:
             # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
-            #  every time a new vector is inserted
+            #  every time new vectors are inserted
             with open(self.persist_file, "w") as file:
                 self.__save_entries_to_file(file)
 
-        return vector_id
+        return upserted_vector_ids
+
+    def get_corpus_version(self, namespace: Optional[str] = None) -> Optional[str]:
+        version = super().get_corpus_version(namespace)
+
+        return self._persist_file_version if version is None else version
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         return self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
@@ -116,6 +145,15 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
 
+    def delete_namespace(self, namespace: str) -> None:
+        with self.thread_lock:
+            self.entries = {key: entry for key, entry in self.entries.items() if entry.namespace != namespace}
+        self.bump_corpus_version(namespace)
+
+        if self.persist_file is not None:
+            with open(self.persist_file, "w") as file:
+                self.__save_entries_to_file(file)
+
     def __save_entries_to_file(self, json_file: TextIO) -> None:
         with self.thread_lock:
             serialized_data = {k: asdict(v) for k, v in self.entries.items()}
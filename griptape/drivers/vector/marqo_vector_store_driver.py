@@ -65,6 +65,7 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             doc["namespace"] = namespace
 
         response = self.client.index(self.index).add_documents([doc], tensor_fields=["Description"])
+        self.bump_corpus_version(namespace)
         if isinstance(response, dict) and "items" in response and response["items"]:
             return response["items"][0]["_id"]
         else:
@@ -91,19 +92,36 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             str: The ID of the artifact that was added.
         """
-        artifact_json = artifact.to_json()
-        vector_id = utils.str_to_hash(artifact.value) if vector_id is None else vector_id
+        return self._add_text_artifact_documents([artifact], namespace=namespace, vector_ids=[vector_id])[0]
 
-        doc = {
-            "_id": vector_id,
-            "Description": artifact.value,  # Description will be treated as tensor field
-            "artifact": str(artifact_json),
-            "namespace": namespace,
-        }
+    def _upsert_text_artifacts_batch(
+        self,
+        artifacts: list[TextArtifact],
+        *,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str]:
+        # Marqo embeds the documents itself, so the whole batch is added in one request.
+        return self._add_text_artifact_documents(artifacts, namespace=namespace, vector_ids=[None] * len(artifacts))
+
+    def _add_text_artifact_documents(
+        self, artifacts: list[TextArtifact], *, namespace: Optional[str], vector_ids: list[Optional[str]]
+    ) -> list[str]:
+        docs = [
+            {
+                "_id": utils.str_to_hash(artifact.value) if vector_id is None else vector_id,
+                "Description": artifact.value,  # Description will be treated as tensor field
+                "artifact": str(artifact.to_json()),
+                "namespace": namespace,
+            }
+            for artifact, vector_id in zip(artifacts, vector_ids)
+        ]
 
-        response = self.client.index(self.index).add_documents([doc], tensor_fields=["Description", "artifact"])
+        response = self.client.index(self.index).add_documents(docs, tensor_fields=["Description", "artifact"])
+        self.bump_corpus_version(namespace)
         if isinstance(response, dict) and "items" in response and response["items"]:
-            return response["items"][0]["_id"]
+            return [item["_id"] for item in response["items"]]
         else:
             raise ValueError(f"Failed to upsert text: {response}")
 
@@ -254,5 +272,9 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         """
         raise NotImplementedError(f"{self.__class__.__name__} does not support upserting a vector.")
 
+    @property
+    def supports_namespace_deletion(self) -> bool:
+        return False
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
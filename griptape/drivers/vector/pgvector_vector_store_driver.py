@@ -224,5 +224,9 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
 
         return VectorModel
 
+    @property
+    def supports_namespace_deletion(self) -> bool:
+        return False
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
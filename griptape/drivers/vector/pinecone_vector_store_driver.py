@@ -137,5 +137,9 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
             **kwargs,
         )
 
+    @property
+    def supports_namespace_deletion(self) -> bool:
+        return False
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -163,5 +163,9 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """Get the document prefix based on the provided namespace."""
         return f"{namespace}:" if namespace else ""
 
+    @property
+    def supports_namespace_deletion(self) -> bool:
+        return False
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -0,0 +1,5 @@
+from .base_rag_cache import BaseRagCache
+from .in_memory_rag_cache import InMemoryRagCache
+from .disk_rag_cache import DiskRagCache
+
+__all__ = ["BaseRagCache", "InMemoryRagCache", "DiskRagCache"]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from attrs import Factory, define, field
+
+if TYPE_CHECKING:
+    from griptape.engines.rag import RagContext
+    from griptape.engines.rag.stages import BaseRagStage
+
+
+@define(kw_only=True)
+class BaseRagCache(ABC):
+    """Caches the results of RAG Stages, keyed by the Stage's input context and configuration.
+
+    Attributes:
+        normalize_query: Normalizes the query and query variants before they're added to the key, so that queries
+            that only differ in whitespace or case share a cache entry.
+    """
+
+    normalize_query: Callable[[str], str] = field(
+        default=Factory(lambda self: self.default_normalize_query, takes_self=True)
+    )
+
+    def get_key(self, stage: BaseRagStage, context: RagContext) -> str:
+        """Returns the cache key of running a Stage on a context.
+
+        Args:
+            stage: The Stage.
+            context: The context the Stage runs on.
+
+        Returns:
+            The cache key.
+        """
+        context_dict = context.to_dict()
+
+        # Module configs are added to the key by the modules they configure, and outputs are never read by a Stage.
+        context_dict.pop("module_configs", None)
+        context_dict.pop("outputs", None)
+        context_dict["query"] = self.normalize_query(context.query)
+        context_dict["queries"] = [self.normalize_query(query) for query in context.queries]
+
+        params = {"context": context_dict, "stage": stage.get_cache_params(context)}
+
+        return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+    def default_normalize_query(self, query: str) -> str:
+        return " ".join(query.split()).casefold()
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        """Loads a cached Stage result.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached context fields, or None if the key isn't cached.
+        """
+        ...
+
+    @abstractmethod
+    def store(self, key: str, value: dict[str, Any]) -> None:
+        """Caches a Stage result.
+
+        Args:
+            key: The cache key.
+            value: The serialized context fields that the Stage outputs.
+        """
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every cached result."""
+        ...
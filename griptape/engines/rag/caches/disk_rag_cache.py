@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from attrs import define, field
+
+from griptape.engines.rag.caches import BaseRagCache
+
+
+@define(kw_only=True)
+class DiskRagCache(BaseRagCache):
+    """Caches the results of RAG Stages as JSON files in a directory, so that they're shared between processes.
+
+    Attributes:
+        directory: Directory to store the results in. Created if it doesn't exist.
+    """
+
+    directory: str = field()
+
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        try:
+            return json.loads(self._get_path(key).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def store(self, key: str, value: dict[str, Any]) -> None:
+        path = self._get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Writes to a temporary file first, so that concurrent readers never load a partially written result.
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as file:
+            json.dump(value, file)
+        os.replace(file.name, path)
+
+    def clear(self) -> None:
+        for path in Path(self.directory).glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _get_path(self, key: str) -> Path:
+        return Path(self.directory) / f"{key}.json"
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from attrs import define, field
+
+from griptape.engines.rag.caches import BaseRagCache
+
+
+@define(kw_only=True)
+class InMemoryRagCache(BaseRagCache):
+    """Caches the results of RAG Stages in memory, evicting the least recently used ones.
+
+    Attributes:
+        max_entries: Maximum number of results to cache. If None, results are never evicted.
+    """
+
+    max_entries: Optional[int] = field(default=1024)
+    _entries: OrderedDict[str, dict[str, Any]] = field(factory=OrderedDict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False)
+
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+
+            if value is not None:
+                self._entries.move_to_end(key)
+
+            return value
+
+    def store(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from griptape.engines.rag import RagContext
 
 
-@define(kw_only=True)
+@define(slots=False, kw_only=True)
 class BaseRagModule(FuturesExecutorMixin, ABC):
     name: str = field(
         default=Factory(lambda self: f"{self.__class__.__name__}-{uuid.uuid4().hex}", takes_self=True), kw_only=True
@@ -29,6 +29,35 @@ class BaseRagModule(FuturesExecutorMixin, ABC):
 
         return PromptStack(messages=messages)
 
+    def is_cacheable(self, context: RagContext) -> bool:
+        """Returns whether the results of running the module on a context can be cached.
+
+        Args:
+            context: The context the module runs on.
+
+        Returns:
+            False if the module's results depend on state that the cache key can't capture.
+        """
+        return True
+
+    def get_cache_params(self, context: RagContext) -> dict[str, Any]:
+        """Returns the configuration of the module that its results depend on, for the cache key of its stage.
+
+        Modules are identified by their name, so modules with generated names don't share cache entries between
+        processes. Subclasses add the configuration that changes their results.
+
+        Args:
+            context: The context the module runs on.
+
+        Returns:
+            JSON-serializable parameters that are added to the cache key.
+        """
+        return {
+            "type": self.__class__.__name__,
+            "name": self.name,
+            "module_configs": context.module_configs.get(self.name, {}),
+        }
+
     def get_context_param(self, context: RagContext, key: str) -> Optional[Any]:
         return context.module_configs.get(self.name, {}).get(key)
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from attrs import Factory, define, field
 
@@ -28,5 +28,8 @@ class TranslateQueryRagModule(BaseQueryRagModule):
 
         return context
 
+    def get_cache_params(self, context: RagContext) -> dict[str, Any]:
+        return {**super().get_cache_params(context), "model": self.prompt_driver.model, "language": self.language}
+
     def default_generate_user_template(self, query: str, language: str) -> str:
         return J2("engines/rag/modules/query/translate/user.j2").render(query=query, language=language)
@@ -53,6 +53,17 @@ class PromptResponseRagModule(BaseResponseRagModule, RuleMixin):
         else:
             raise ValueError("Prompt driver did not return a TextArtifact")
 
+    def get_cache_params(self, context: RagContext) -> dict[str, Any]:
+        return {
+            **super().get_cache_params(context),
+            "model": self.prompt_driver.model,
+            "prompt_driver": self.prompt_driver.to_dict(),
+            "answer_token_offset": self.answer_token_offset,
+            "metadata": self.metadata,
+            "rules": [[rule.to_text() for rule in ruleset.rules] for ruleset in self.rulesets],
+            "generate_system_template": getattr(self.generate_system_template, "__qualname__", None),
+        }
+
     def default_generate_system_template(self, context: RagContext, artifacts: list[TextArtifact]) -> str:
         params: dict[str, Any] = {"text_chunks": [c.to_text() for c in artifacts]}
 
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from typing import Any
 
 from attrs import define, field
 
@@ -15,3 +16,6 @@ class BaseRerankRagModule(BaseRagModule, ABC):
 
     @abstractmethod
     def run(self, context: RagContext) -> Sequence[BaseArtifact]: ...
+
+    def get_cache_params(self, context: RagContext) -> dict[str, Any]:
+        return {**super().get_cache_params(context), "rerank_driver": self.rerank_driver.__class__.__name__}
@@ -25,6 +25,8 @@ class TextLoaderRetrievalRagModule(BaseRetrievalRagModule):
     vector_store_driver: BaseVectorStoreDriver = field()
     source: Any = field()
     query_params: dict[str, Any] = field(factory=dict)
+    # Whether the source's content never changes, so that results can be cached by source.
+    static_source: bool = field(default=False)
     process_query_output: Callable[[list[BaseVectorStoreDriver.Entry]], Sequence[TextArtifact]] = field(
         default=Factory(lambda: lambda es: [e.to_artifact() for e in es]),
     )
@@ -44,3 +46,10 @@ class TextLoaderRetrievalRagModule(BaseRetrievalRagModule):
         self.vector_store_driver.upsert_text_artifacts({namespace: chunks})
 
         return self.process_query_output(self.vector_store_driver.query(context.query, **query_params))
+
+    def is_cacheable(self, context: RagContext) -> bool:
+        # The source is loaded again on every run, and its content may have changed since.
+        return self.static_source
+
+    def get_cache_params(self, context: RagContext) -> dict[str, Any]:
+        return {**super().get_cache_params(context), "source": self.source, "query_params": self.query_params}
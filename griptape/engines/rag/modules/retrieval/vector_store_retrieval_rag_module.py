@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
 
@@ -30,3 +30,21 @@ class VectorStoreRetrievalRagModule(BaseRetrievalRagModule):
         query_params = utils.dict_merge(self.query_params, self.get_context_param(context, "query_params"))
 
         return self.process_query_output(self.vector_store_driver.query(context.query, **query_params))
+
+    def is_cacheable(self, context: RagContext) -> bool:
+        # Without a known corpus version, the namespace may have been re-ingested by another process.
+        return self._get_corpus_version(context) is not None
+
+    def get_cache_params(self, context: RagContext) -> dict[str, Any]:
+        return {
+            **super().get_cache_params(context),
+            "query_params": self.query_params,
+            "vector_store_driver": self.vector_store_driver.to_dict(),
+            # Changes when the namespace is written, so that results cached before re-ingestion aren't reused.
+            "corpus_version": self._get_corpus_version(context),
+        }
+
+    def _get_corpus_version(self, context: RagContext) -> Optional[str]:
+        query_params = utils.dict_merge(self.query_params, self.get_context_param(context, "query_params"))
+
+        return self.vector_store_driver.get_corpus_version(query_params.get("namespace"))
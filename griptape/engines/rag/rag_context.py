@@ -18,6 +18,7 @@ class RagContext(SerializableMixin):
 
     Attributes:
         query: Query provided by the user.
+        queries: Variants of the query, such as rewrites generated by query modules. Retrieval modules retrieve text chunks for the query and for each variant.
         module_configs: Dictionary of module configs. First key should be a module name and the second a dictionary of configs parameters.
         before_query: An optional list of strings to add before the query in response modules.
         after_query: An optional list of strings to add after the query in response modules.
@@ -26,6 +27,7 @@ class RagContext(SerializableMixin):
     """
 
     query: str = field(metadata={"serializable": True})
+    queries: list[str] = field(factory=list, metadata={"serializable": True})
     module_configs: dict[str, dict] = field(factory=dict, metadata={"serializable": True})
     before_query: list[str] = field(factory=list, metadata={"serializable": True})
     after_query: list[str] = field(factory=list, metadata={"serializable": True})
@@ -38,12 +38,12 @@ class RagEngine:
 
     def process(self, context: RagContext) -> RagContext:
         if self.query_stage:
-            context = self.query_stage.run(context)
+            context = self.query_stage.run_cached(context)
 
         if self.retrieval_stage:
-            context = self.retrieval_stage.run(context)
+            context = self.retrieval_stage.run_cached(context)
 
         if self.response_stage:
-            context = self.response_stage.run(context)
+            context = self.response_stage.run_cached(context)
 
         return context
@@ -1,18 +1,82 @@
+from __future__ import annotations
+
+import logging
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional
 
-from attrs import define
+from attrs import define, field
 
 from griptape.engines.rag import RagContext
-from griptape.engines.rag.modules import BaseRagModule
 from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from griptape.engines.rag.caches import BaseRagCache
+    from griptape.engines.rag.modules import BaseRagModule
+
 
 @define(kw_only=True)
 class BaseRagStage(FuturesExecutorMixin, ABC):
+    """Base class for the stages of a RagEngine.
+
+    Attributes:
+        cache: Cache of the stage's results. When set, `run_cached` restores the context fields the stage outputs from
+            the cache instead of running the stage's modules again. Results are only cached if every module is
+            cacheable.
+    """
+
+    cache: Optional[BaseRagCache] = field(default=None)
+
     @abstractmethod
     def run(self, context: RagContext) -> RagContext: ...
 
     @property
     @abstractmethod
     def modules(self) -> Sequence[BaseRagModule]: ...
+
+    @property
+    def cached_fields(self) -> list[str]:
+        """The context fields that the stage outputs, and that are stored in the cache."""
+        return ["query", "queries", "before_query", "after_query", "text_chunks", "outputs"]
+
+    def get_cache_params(self, context: RagContext) -> dict[str, Any]:
+        """Returns the configuration of the stage and its modules that the stage's results depend on.
+
+        Args:
+            context: The context the stage runs on.
+
+        Returns:
+            JSON-serializable parameters that are added to the cache key.
+        """
+        return {"type": self.__class__.__name__, "modules": [m.get_cache_params(context) for m in self.modules]}
+
+    def run_cached(self, context: RagContext) -> RagContext:
+        """Runs the stage, or restores its result from `cache`.
+
+        Args:
+            context: The context to run the stage on.
+
+        Returns:
+            The context, updated with the stage's result.
+        """
+        if self.cache is None or not all(m.is_cacheable(context) for m in self.modules):
+            return self.run(context)
+
+        key = self.cache.get_key(self, context)
+        cached_value = self.cache.load(key)
+
+        if cached_value is None:
+            context = self.run(context)
+            context_dict = context.to_dict()
+
+            self.cache.store(key, {name: context_dict[name] for name in self.cached_fields})
+        else:
+            logging.info("%s: restoring result from cache", self.__class__.__name__)
+
+            cached_context = RagContext.from_dict({**context.to_dict(), **cached_value})
+
+            for name in self.cached_fields:
+                setattr(context, name, getattr(cached_context, name))
+
+        return context
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
-from attrs import define, field
+import attrs
+from attrs import Factory, define, field
 
+from griptape import utils
 from griptape.engines.rag.stages import BaseRagStage
+from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -16,15 +19,72 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class QueryRagStage(BaseRagStage):
-    query_modules: list[BaseQueryRagModule] = field()
+    """Modifies the query, and generates variants of it for the retrieval stage.
+
+    Attributes:
+        query_modules: Modules that run sequentially, each on the context modified by the previous one.
+        parallel_query_modules: Modules that run in parallel after `query_modules`, each on its own copy of the
+            context. The queries they generate are merged into the context's query variants with `merge_queries`.
+        merge_queries: Merges the contexts that `parallel_query_modules` output into the context's query variants.
+            By default, adds each new query and query variant once.
+    """
+
+    query_modules: list[BaseQueryRagModule] = field(factory=list)
+    parallel_query_modules: list[BaseQueryRagModule] = field(factory=list)
+    merge_queries: Callable[[RagContext, list[RagContext]], list[str]] = field(
+        default=Factory(lambda self: self.default_merge_queries, takes_self=True)
+    )
 
     @property
     def modules(self) -> Sequence[BaseRagModule]:
-        return self.query_modules
+        return [*self.query_modules, *self.parallel_query_modules]
+
+    @property
+    def cached_fields(self) -> list[str]:
+        return ["query", "queries"]
+
+    def get_cache_params(self, context: RagContext) -> dict[str, Any]:
+        return {
+            **super().get_cache_params(context),
+            "parallel_module_count": len(self.parallel_query_modules),
+            "merge_queries": getattr(self.merge_queries, "__qualname__", None),
+        }
 
     def run(self, context: RagContext) -> RagContext:
         logging.info("QueryRagStage: running %s query generation modules sequentially", len(self.query_modules))
 
         [qm.run(context) for qm in self.query_modules]
 
+        if self.parallel_query_modules:
+            logging.info(
+                "QueryRagStage: running %s query generation modules in parallel", len(self.parallel_query_modules)
+            )
+
+            with self.create_futures_executor() as futures_executor:
+                module_contexts = utils.execute_futures_list(
+                    [
+                        futures_executor.submit(
+                            with_contextvars(qm.run),
+                            attrs.evolve(
+                                context,
+                                queries=list(context.queries),
+                                module_configs={name: dict(config) for name, config in context.module_configs.items()},
+                            ),
+                        )
+                        for qm in self.parallel_query_modules
+                    ]
+                )
+
+            context.queries = self.merge_queries(context, module_contexts)
+
         return context
+
+    def default_merge_queries(self, context: RagContext, module_contexts: list[RagContext]) -> list[str]:
+        queries = [*context.queries]
+
+        for module_context in module_contexts:
+            for query in [module_context.query, *module_context.queries]:
+                if query != context.query and query not in queries:
+                    queries.append(query)
+
+        return queries
@@ -29,6 +29,10 @@ class ResponseRagStage(BaseRagStage):
 
         return ms
 
+    @property
+    def cached_fields(self) -> list[str]:
+        return ["outputs"]
+
     def run(self, context: RagContext) -> RagContext:
         logging.info("ResponseRagStage: running %s retrieval modules in parallel", len(self.response_modules))
 
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import itertools
 import logging
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+import attrs
 from attrs import define, field
 
 from griptape import utils
@@ -33,12 +34,30 @@ class RetrievalRagStage(BaseRagStage):
 
         return ms
 
+    @property
+    def cached_fields(self) -> list[str]:
+        return ["text_chunks"]
+
+    def get_cache_params(self, context: RagContext) -> dict[str, Any]:
+        return {**super().get_cache_params(context), "max_chunks": self.max_chunks}
+
     def run(self, context: RagContext) -> RagContext:
-        logging.info("RetrievalRagStage: running %s retrieval modules in parallel", len(self.retrieval_modules))
+        logging.info(
+            "RetrievalRagStage: running %s retrieval modules in parallel for %s queries",
+            len(self.retrieval_modules),
+            1 + len(context.queries),
+        )
+
+        # Each module retrieves text chunks for the query, and for each query variant.
+        query_contexts = [context, *(attrs.evolve(context, query=query) for query in context.queries)]
 
         with self.create_futures_executor() as futures_executor:
             results = utils.execute_futures_list(
-                [futures_executor.submit(with_contextvars(r.run), context) for r in self.retrieval_modules]
+                [
+                    futures_executor.submit(with_contextvars(r.run), query_context)
+                    for r in self.retrieval_modules
+                    for query_context in query_contexts
+                ]
             )
 
         # flatten the list of lists
@@ -13,6 +13,8 @@ from .finish_structure_run_event import FinishStructureRunEvent
 from .base_chunk_event import BaseChunkEvent
 from .text_chunk_event import TextChunkEvent
 from .action_chunk_event import ActionChunkEvent
+from .chunk_event_coalescer import ChunkEventCoalescer
+from .compact_event_encoder import CompactEventEncoder
 from .event_listener import EventListener
 from .start_image_generation_event import StartImageGenerationEvent
 from .finish_image_generation_event import FinishImageGenerationEvent
@@ -42,6 +44,8 @@ __all__ = [
     "BaseChunkEvent",
     "TextChunkEvent",
     "ActionChunkEvent",
+    "ChunkEventCoalescer",
+    "CompactEventEncoder",
     "EventListener",
     "StartImageGenerationEvent",
     "FinishImageGenerationEvent",
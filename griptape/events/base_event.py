@@ -3,15 +3,28 @@ from __future__ import annotations
 import time
 import uuid
 from abc import ABC
-from typing import Any
+from typing import Any, Optional
 
 from attrs import Factory, define, field
 
-from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.mixins.serializable_mixin import SlottedSerializableMixin
 
 
 @define
-class BaseEvent(SerializableMixin, ABC):
+class BaseEvent(SlottedSerializableMixin, ABC):
     id: str = field(default=Factory(lambda: uuid.uuid4().hex), kw_only=True, metadata={"serializable": True})
     timestamp: float = field(default=Factory(lambda: time.time()), kw_only=True, metadata={"serializable": True})
-    meta: dict[str, Any] = field(factory=dict, kw_only=True, metadata={"serializable": True})
+    _meta: Optional[dict[str, Any]] = field(
+        default=None, kw_only=True, alias="meta", eq=lambda meta: meta or {}, metadata={"serializable": True}
+    )
+
+    @property
+    def meta(self) -> dict[str, Any]:
+        if self._meta is None:
+            self._meta = {}
+
+        return self._meta
+
+    @meta.setter
+    def meta(self, value: dict[str, Any]) -> None:
+        self._meta = value
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from attrs import define, field
+
+from griptape.events.action_chunk_event import ActionChunkEvent
+from griptape.events.text_chunk_event import TextChunkEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from griptape.events.base_chunk_event import BaseChunkEvent
+
+# Returned by the receive function of `ChunkEventCoalescer.coalesce` once the stream ends.
+_END_OF_STREAM = object()
+
+
+@define(kw_only=True)
+class ChunkEventCoalescer:
+    """Coalesces consecutive Chunk Events from a stream into fewer, larger Chunk Events.
+
+    Consecutive `TextChunkEvent`s with the same index are joined, as are consecutive `ActionChunkEvent`s that only
+    carry `partial_input` for the same action. A new action, a different index, or a different kind of event flushes
+    the buffer first, so ordering is preserved.
+
+    With `max_delay`, the stream is read on a background thread, so that the buffer is flushed on time even while the
+    stream stalls.
+
+    Attributes:
+        max_delay: Maximum number of seconds a chunk is buffered before the buffer is flushed.
+        max_bytes: Size of the buffered content, in UTF-8 bytes, at which the buffer is flushed.
+    """
+
+    max_delay: Optional[float] = field(default=0.1)
+    max_bytes: Optional[int] = field(default=1024)
+
+    def coalesce(self, events: Iterable[BaseChunkEvent]) -> Iterator[BaseChunkEvent]:
+        receive = self._get_receive(events)
+        buffer: list[BaseChunkEvent] = []
+        buffer_bytes = 0
+        flush_at = 0.0
+
+        while (event := receive(flush_at if buffer else None)) is not _END_OF_STREAM:
+            # No event arrived before the buffer had to be flushed.
+            if event is None:
+                yield self._merge(buffer)
+                buffer = []
+                continue
+
+            if buffer and not self._can_merge(buffer[0], event):
+                yield self._merge(buffer)
+                buffer = []
+
+            if not buffer:
+                buffer_bytes = 0
+                flush_at = time.perf_counter() + (self.max_delay or 0.0)
+
+            buffer.append(event)
+            buffer_bytes += len(self._content(event).encode())
+
+            if (self.max_bytes is not None and buffer_bytes >= self.max_bytes) or (
+                self.max_delay is not None and time.perf_counter() >= flush_at
+            ):
+                yield self._merge(buffer)
+                buffer = []
+
+        if buffer:
+            yield self._merge(buffer)
+
+    def _get_receive(self, events: Iterable[BaseChunkEvent]) -> Callable[[Optional[float]], Any]:
+        """Returns a function that receives the next event, waiting until at most the time passed to it.
+
+        The function returns None if the time passes first, and `_END_OF_STREAM` once the stream ends.
+        """
+        if self.max_delay is None:
+            iterator = iter(events)
+
+            return lambda _: next(iterator, _END_OF_STREAM)
+
+        from griptape.utils import with_contextvars
+
+        received: queue.Queue[tuple[Any, Optional[Exception]]] = queue.Queue()
+
+        def read_events() -> None:
+            try:
+                for event in events:
+                    received.put((event, None))
+            except Exception as e:
+                received.put((_END_OF_STREAM, e))
+            else:
+                received.put((_END_OF_STREAM, None))
+
+        def receive(flush_at: Optional[float]) -> Any:
+            try:
+                event, error = received.get(
+                    timeout=None if flush_at is None else max(flush_at - time.perf_counter(), 0.0)
+                )
+            except queue.Empty:
+                return None
+
+            if error is not None:
+                raise error
+
+            return event
+
+        threading.Thread(target=with_contextvars(read_events), daemon=True, name="ChunkEventCoalescer").start()
+
+        return receive
+
+    def _can_merge(self, first_event: BaseChunkEvent, event: BaseChunkEvent) -> bool:
+        if type(first_event) is not type(event) or first_event.index != event.index:
+            return False
+
+        if isinstance(event, ActionChunkEvent):
+            # A tag, name, or path marks the start of a new action.
+            return event.tag is None and event.name is None and event.path is None
+
+        return isinstance(event, TextChunkEvent)
+
+    def _content(self, event: BaseChunkEvent) -> str:
+        if isinstance(event, TextChunkEvent):
+            return event.token
+        elif isinstance(event, ActionChunkEvent):
+            return event.partial_input or ""
+        else:
+            return ""
+
+    def _merge(self, events: list[BaseChunkEvent]) -> BaseChunkEvent:
+        first_event = events[0]
+
+        if len(events) == 1:
+            return first_event
+
+        if isinstance(first_event, TextChunkEvent):
+            return TextChunkEvent(
+                token="".join(self._content(event) for event in events),
+                index=first_event.index,
+                meta=first_event.meta,
+            )
+        elif isinstance(first_event, ActionChunkEvent):
+            partial_inputs = [
+                event.partial_input
+                for event in events
+                if isinstance(event, ActionChunkEvent) and event.partial_input is not None
+            ]
+
+            return ActionChunkEvent(
+                partial_input="".join(partial_inputs) if partial_inputs else None,
+                tag=first_event.tag,
+                name=first_event.name,
+                path=first_event.path,
+                index=first_event.index,
+                meta=first_event.meta,
+            )
+        else:
+            raise ValueError(f"Unsupported Chunk Event type: {type(first_event)}")
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import bz2
+import gzip
+import json
+import lzma
+import zlib
+from typing import Any, Literal, Optional, Union
+
+from attrs import define, field
+
+from griptape.schemas import FastSerializer
+
+Compression = Literal["gzip", "zlib", "bz2", "lzma"]
+
+FORMAT_VERSION = 1
+# Keys of delta encoded events. Interned keys are always digits, so these can't collide with them.
+DELTA_BASE_KEY = "^"
+DELTA_REMOVED_KEY = "-"
+
+_COMPRESSORS = {
+    "gzip": gzip.compress,
+    "zlib": zlib.compress,
+    "bz2": bz2.compress,
+    "lzma": lzma.compress,
+}
+# Compressed data is recognized by its magic bytes.
+_DECOMPRESSORS = (
+    (b"\x1f\x8b", gzip.decompress),
+    (b"BZh", bz2.decompress),
+    (b"\xfd7zXZ\x00", lzma.decompress),
+    (b"\x78", zlib.decompress),
+)
+
+
+@define(kw_only=True)
+class CompactEventEncoder:
+    """Encodes event payloads into a compact wire format, and decodes them back.
+
+    Field names are interned: they're listed once per message, and every dict refers to its keys by their index in the
+    list. In a batch, events of `delta_event_types` only carry the fields that differ from the previous event of the
+    same type, which leaves little more than the content of consecutive Chunk Events. The encoded JSON can then be
+    compressed with one of the standard library's compression formats.
+
+    Receivers decode messages with `decode`, which detects the compression of the message, so an encoder with any
+    configuration can decode them.
+
+    Attributes:
+        compression: Compression format of encoded messages. Defaults to no compression.
+        compression_level: Compression level, between 1 and 9. Defaults to the compression format's default.
+        delta_event_types: Types of the events to delta encode.
+    """
+
+    compression: Optional[Compression] = field(default=None)
+    compression_level: Optional[int] = field(default=None)
+    delta_event_types: set[str] = field(factory=lambda: {"TextChunkEvent", "ActionChunkEvent"})
+
+    @property
+    def content_type(self) -> str:
+        return "application/json" if self.compression is None else "application/octet-stream"
+
+    def encode(self, payload: Union[dict, list[dict]]) -> bytes:
+        """Encodes an event payload, or a batch of them.
+
+        Args:
+            payload: An event payload, or a list of event payloads.
+
+        Returns:
+            The encoded message.
+        """
+        keys: dict[str, int] = {}
+
+        if isinstance(payload, list):
+            encoded_payload = self._encode_batch(payload, keys)
+        else:
+            encoded_payload = self._encode_value(payload, keys)
+
+        data = FastSerializer.dumps({"v": FORMAT_VERSION, "k": list(keys), "p": encoded_payload}).encode()
+
+        return self._compress(data)
+
+    def encode_text(self, payload: Union[dict, list[dict]]) -> str:
+        """Encodes an event payload, or a batch of them, for transports that only carry text.
+
+        Args:
+            payload: An event payload, or a list of event payloads.
+
+        Returns:
+            The encoded message. Compressed messages are base64 encoded.
+        """
+        data = self.encode(payload)
+
+        return data.decode() if self.compression is None else base64.b64encode(data).decode()
+
+    def decode(self, data: Union[bytes, str]) -> Union[dict, list[dict]]:
+        """Decodes a message encoded by `encode` or `encode_text`.
+
+        Args:
+            data: The encoded message.
+
+        Returns:
+            The event payload, or list of event payloads, that was encoded.
+        """
+        data = data.encode() if isinstance(data, str) else data
+
+        if not data.lstrip().startswith(b"{"):
+            data = self._decompress(data)
+
+        message = json.loads(data)
+        if message.get("v") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported compact event format version: {message.get('v')}")
+
+        keys = message["k"]
+        payload = message["p"]
+
+        if isinstance(payload, list):
+            return self._decode_batch(payload, keys)
+        else:
+            return self._decode_value(payload, keys)
+
+    def _encode_batch(self, payloads: list[dict], keys: dict[str, int]) -> list:
+        encoded_payloads = []
+        last_indexes: dict[str, int] = {}
+
+        for index, payload in enumerate(payloads):
+            event_type = payload.get("type") if isinstance(payload, dict) else None
+
+            if event_type in self.delta_event_types and event_type in last_indexes:
+                base_index = last_indexes[event_type]
+                encoded_payloads.append(self._encode_delta(payloads[base_index], payload, index - base_index, keys))
+            else:
+                encoded_payloads.append(self._encode_value(payload, keys))
+
+            if isinstance(event_type, str):
+                last_indexes[event_type] = index
+
+        return encoded_payloads
+
+    def _encode_delta(self, base_payload: dict, payload: dict, offset: int, keys: dict[str, int]) -> dict:
+        delta: dict[str, Any] = {DELTA_BASE_KEY: offset}
+
+        for key, value in payload.items():
+            if key not in base_payload or base_payload[key] != value:
+                delta[self._intern(key, keys)] = self._encode_value(value, keys)
+
+        removed_keys = [int(self._intern(key, keys)) for key in base_payload if key not in payload]
+        if removed_keys:
+            delta[DELTA_REMOVED_KEY] = removed_keys
+
+        return delta
+
+    def _encode_value(self, value: Any, keys: dict[str, int]) -> Any:
+        if isinstance(value, dict):
+            return {self._intern(key, keys): self._encode_value(item, keys) for key, item in value.items()}
+        elif isinstance(value, (list, tuple)):
+            return [self._encode_value(item, keys) for item in value]
+        else:
+            return value
+
+    def _intern(self, key: str, keys: dict[str, int]) -> str:
+        if key not in keys:
+            keys[key] = len(keys)
+
+        return str(keys[key])
+
+    def _decode_batch(self, encoded_payloads: list, keys: list[str]) -> list[dict]:
+        payloads = []
+
+        for index, encoded_payload in enumerate(encoded_payloads):
+            if isinstance(encoded_payload, dict) and DELTA_BASE_KEY in encoded_payload:
+                payload = dict(payloads[index - encoded_payload[DELTA_BASE_KEY]])
+
+                for key_index in encoded_payload.get(DELTA_REMOVED_KEY, []):
+                    del payload[keys[key_index]]
+                for key, value in encoded_payload.items():
+                    if key not in (DELTA_BASE_KEY, DELTA_REMOVED_KEY):
+                        payload[keys[int(key)]] = self._decode_value(value, keys)
+
+                payloads.append(payload)
+            else:
+                payloads.append(self._decode_value(encoded_payload, keys))
+
+        return payloads
+
+    def _decode_value(self, value: Any, keys: list[str]) -> Any:
+        if isinstance(value, dict):
+            return {keys[int(key)]: self._decode_value(item, keys) for key, item in value.items()}
+        elif isinstance(value, list):
+            return [self._decode_value(item, keys) for item in value]
+        else:
+            return value
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression is None:
+            return data
+
+        compress = _COMPRESSORS[self.compression]
+        if self.compression_level is None:
+            return compress(data)
+        elif self.compression == "lzma":
+            return lzma.compress(data, preset=self.compression_level)
+        else:
+            return compress(data, self.compression_level)
+
+    def _decompress(self, data: bytes) -> bytes:
+        if not any(data.startswith(magic) for magic, _ in _DECOMPRESSORS):
+            # Compressed messages encoded with `encode_text`.
+            try:
+                data = base64.b64decode(data, validate=True)
+            except binascii.Error as e:
+                raise ValueError("Unrecognized compact event message") from e
+
+        for magic, decompress in _DECOMPRESSORS:
+            if data.startswith(magic):
+                return decompress(data)
+
+        raise ValueError("Unrecognized compact event message")
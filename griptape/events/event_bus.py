@@ -15,6 +15,11 @@ if TYPE_CHECKING:
 # Also, in-place modifications do not trigger the context var's `set` method
 # so we must reassign the context var with the new value when adding or removing event listeners.
 _event_listeners: ContextVar[Optional[list[EventListener]]] = ContextVar("event_listeners", default=None)
+# Event listeners by the event type they listen for, filled as events are published.
+# Reset whenever the event listeners are reassigned.
+_event_listeners_by_type: ContextVar[Optional[dict[type[BaseEvent], list[EventListener]]]] = ContextVar(
+    "event_listeners_by_type", default=None
+)
 
 
 @define
@@ -30,6 +35,7 @@ class _EventBus(SingletonMixin):
     @event_listeners.setter
     def event_listeners(self, event_listeners: list[EventListener]) -> None:
         _event_listeners.set(event_listeners)
+        _event_listeners_by_type.set({})
 
     def add_event_listeners(self, event_listeners: list[EventListener]) -> list[EventListener]:
         return [self.add_event_listener(event_listener) for event_listener in event_listeners]
@@ -48,12 +54,47 @@ class _EventBus(SingletonMixin):
         if event_listener in self.event_listeners:
             self.event_listeners = [listener for listener in self.event_listeners if listener != event_listener]
 
+    def has_listeners(self, event_type: type[BaseEvent]) -> bool:
+        """Checks whether any event listener listens for an event type.
+
+        Useful for skipping building events that are costly to build when nothing would receive them.
+
+        Args:
+            event_type: The event type.
+
+        Returns:
+            Whether an event of `event_type` would be published to any event listener.
+        """
+        return bool(self._event_listeners_for_type(event_type))
+
     def publish_event(self, event: BaseEvent, *, flush: bool = False) -> None:
-        for event_listener in self.event_listeners:
+        # Every event listener has to flush, including those that don't listen for this event type.
+        event_listeners = self.event_listeners if flush else self._event_listeners_for_type(type(event))
+
+        for event_listener in event_listeners:
             event_listener.publish_event(event, flush=flush)
 
     def clear_event_listeners(self) -> None:
         self.event_listeners = []
 
+    def _event_listeners_for_type(self, event_type: type[BaseEvent]) -> list[EventListener]:
+        event_listeners = self.event_listeners
+        event_listeners_by_type = _event_listeners_by_type.get()
+        if event_listeners_by_type is None:
+            event_listeners_by_type = {}
+            _event_listeners_by_type.set(event_listeners_by_type)
+
+        if event_type not in event_listeners_by_type:
+            event_listeners_by_type[event_type] = [
+                event_listener
+                for event_listener in event_listeners
+                if event_listener.event_types is None
+                or any(
+                    issubclass(event_type, listener_event_type) for listener_event_type in event_listener.event_types
+                )
+            ]
+
+        return event_listeners_by_type[event_type]
+
 
 EventBus = _EventBus()
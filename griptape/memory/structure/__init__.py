@@ -2,6 +2,13 @@ from .run import Run
 from .base_conversation_memory import BaseConversationMemory
 from .conversation_memory import ConversationMemory
 from .summary_conversation_memory import SummaryConversationMemory
+from .vector_store_conversation_memory import VectorStoreConversationMemory
 
 
-__all__ = ["Run", "BaseConversationMemory", "ConversationMemory", "SummaryConversationMemory"]
+__all__ = [
+    "Run",
+    "BaseConversationMemory",
+    "ConversationMemory",
+    "SummaryConversationMemory",
+    "VectorStoreConversationMemory",
+]
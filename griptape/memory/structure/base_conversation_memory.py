@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
 
@@ -24,12 +24,15 @@ class BaseConversationMemory(SerializableMixin, ABC):
     runs: list[Run] = field(factory=list, kw_only=True, metadata={"serializable": True})
     meta: dict[str, Any] = field(factory=dict, kw_only=True, metadata={"serializable": True})
     autoload: bool = field(default=True, kw_only=True)
+    autoload_last_n: Optional[int] = field(default=None, kw_only=True)
     autoprune: bool = field(default=True, kw_only=True)
     max_runs: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    _runs_stored: bool = field(default=False, init=False, eq=False)
+    _all_runs_loaded: bool = field(default=True, init=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
         if self.autoload:
-            self.load_runs()
+            self.load_runs(self.autoload_last_n)
 
     def before_add_run(self) -> None:
         pass
@@ -45,7 +48,15 @@ class BaseConversationMemory(SerializableMixin, ABC):
         if self.max_runs:
             while len(self.runs) > self.max_runs:
                 self.runs.pop(0)
-        self.conversation_memory_driver.store(self.runs, self.meta)
+
+        # Once the stored conversation matches the Runs, only the new Run needs to be written.
+        if self._runs_stored:
+            self.conversation_memory_driver.append(
+                self.runs, self.meta, max_runs=self.max_runs, all_runs=self._all_runs_loaded
+            )
+        else:
+            self.conversation_memory_driver.store(self.runs, self.meta)
+            self._runs_stored = True
 
     @abstractmethod
     def try_add_run(self, run: Run) -> None: ...
@@ -53,13 +64,42 @@ class BaseConversationMemory(SerializableMixin, ABC):
     @abstractmethod
     def to_prompt_stack(self, last_n: Optional[int] = None) -> PromptStack: ...
 
-    def load_runs(self) -> list[Run]:
-        runs, meta = self.conversation_memory_driver.load()
+    def load_runs(self, last_n: Optional[int] = None) -> list[Run]:
+        """Loads the stored conversation.
+
+        Args:
+            last_n: Number of most recent Runs to load. Defaults to all Runs. Older Runs can be loaded with
+                `load_older_runs`.
+
+        Returns:
+            The Runs.
+        """
+        if last_n is None:
+            runs, meta = self.conversation_memory_driver.load()
+        else:
+            runs, meta = self.conversation_memory_driver.load_last_runs(last_n)
+        self._runs_stored = not self.runs
+        self._all_runs_loaded = last_n is None or len(runs) < last_n
         self.runs.extend(runs)
         self.meta = dict_merge(self.meta, meta)
 
         return self.runs
 
+    def load_older_runs(self, count: int) -> list[Run]:
+        """Loads stored Runs older than the loaded ones, and inserts them before the loaded ones.
+
+        Args:
+            count: Maximum number of Runs to load.
+
+        Returns:
+            The loaded Runs. Fewer than `count` Runs are returned once the oldest stored Runs are loaded.
+        """
+        runs, _ = self.conversation_memory_driver.load_last_runs(count, offset=len(self.runs))
+        self.runs[0:0] = runs
+        self._all_runs_loaded = len(runs) < count
+
+        return runs
+
     def add_to_prompt_stack(
         self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack, index: Optional[int] = None
     ) -> PromptStack:
@@ -74,36 +114,44 @@ class BaseConversationMemory(SerializableMixin, ABC):
             index: Optional index to insert the Conversation Memory runs at.
                    Defaults to appending to the end of the Prompt Stack.
         """
-        num_runs_to_fit_in_prompt = len(self.runs)
-
-        if self.autoprune:
-            should_prune = True
-            temp_stack = PromptStack()
+        return self._add_runs_to_prompt_stack(prompt_driver, prompt_stack, index, len(self.runs), self.to_prompt_stack)
+
+    def _add_runs_to_prompt_stack(
+        self,
+        prompt_driver: BasePromptDriver,
+        prompt_stack: PromptStack,
+        index: Optional[int],
+        run_count: int,
+        to_prompt_stack: Callable[[int], PromptStack],
+    ) -> PromptStack:
+        num_runs_to_fit_in_prompt = run_count
 
-            # Try to determine how many Conversation Memory runs we can
-            # fit into the Prompt Stack without exceeding the token limit.
-            while should_prune and num_runs_to_fit_in_prompt > 0:
-                temp_stack.messages = prompt_stack.messages.copy()
+        if self.autoprune and run_count > 0:
 
-                # Add n runs from Conversation Memory.
+            def fits_in_prompt(num_runs: int) -> bool:
                 # Where we insert into the Prompt Stack doesn't matter here
                 # since we only care about the total token count.
-                memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
-                temp_stack.messages.extend(memory_inputs)
+                temp_stack = PromptStack(messages=[*prompt_stack.messages, *to_prompt_stack(num_runs).messages])
 
-                # Convert the Prompt Stack into tokens left.
-                tokens_left = prompt_driver.tokenizer.count_input_tokens_left(
-                    prompt_driver.prompt_stack_to_string(temp_stack),
+                return (
+                    prompt_driver.tokenizer.count_input_tokens_left(prompt_driver.prompt_stack_to_string(temp_stack))
+                    > 0
                 )
-                if tokens_left > 0:
-                    # There are still tokens left, no need to prune.
-                    should_prune = False
-                else:
-                    # There were not any tokens left, prune one run and try again.
-                    num_runs_to_fit_in_prompt -= 1
+
+            # Each Run only adds tokens, so the number of Runs that fit is found by bisection,
+            # counting the tokens of the Prompt Stack a logarithmic number of times rather than once per pruned Run.
+            if not fits_in_prompt(run_count):
+                low, high = 0, run_count - 1
+                while low < high:
+                    mid = (low + high + 1) // 2
+                    if fits_in_prompt(mid):
+                        low = mid
+                    else:
+                        high = mid - 1
+                num_runs_to_fit_in_prompt = low
 
         if num_runs_to_fit_in_prompt:
-            memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
+            memory_inputs = to_prompt_stack(num_runs_to_fit_in_prompt).messages
             if index is None:
                 prompt_stack.messages.extend(memory_inputs)
             else:
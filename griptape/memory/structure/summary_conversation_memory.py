@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Optional
+import threading
+from concurrent import futures
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
 from griptape.common import Message, PromptStack
 from griptape.configs import Defaults
 from griptape.memory.structure.base_conversation_memory import BaseConversationMemory
-from griptape.utils import J2
+from griptape.utils import J2, with_contextvars
 
 if TYPE_CHECKING:
     from griptape.drivers.prompt import BasePromptDriver
@@ -17,6 +19,21 @@ if TYPE_CHECKING:
 
 @define
 class SummaryConversationMemory(BaseConversationMemory):
+    """Conversation Memory that progressively summarizes the Runs older than the last `offset` Runs.
+
+    With `background_summarization`, Runs are summarized on a background thread, so adding a Run doesn't wait on the
+    Prompt Driver. Until a summarization finishes, the Prompt Stack holds the previous summary followed by all the
+    unsummarized Runs, so no Run is left out. Runs are stored with the Conversation Memory Driver as they're added,
+    independently of the summary, and the summary and summary index are always updated together.
+
+    Attributes:
+        offset: Number of most recent Runs to leave unsummarized.
+        prompt_driver: Prompt Driver used to summarize the Runs.
+        summary: Summary of the Runs before `summary_index`.
+        summary_index: Index of the first unsummarized Run.
+        background_summarization: Whether to summarize Runs on a background thread.
+    """
+
     offset: int = field(default=1, kw_only=True, metadata={"serializable": True})
     prompt_driver: BasePromptDriver = field(
         kw_only=True, default=Factory(lambda: Defaults.drivers_config.prompt_driver)
@@ -28,13 +45,25 @@ class SummaryConversationMemory(BaseConversationMemory):
         default=Factory(lambda: J2("memory/conversation/summarize_conversation.j2")),
         kw_only=True,
     )
+    background_summarization: bool = field(default=False, kw_only=True)
+    _summary_lock: threading.RLock = field(factory=threading.RLock, init=False, eq=False)
+    _summary_executor: Optional[futures.Executor] = field(default=None, init=False, eq=False)
+    _summary_future: Optional[futures.Future] = field(default=None, init=False, eq=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._summary_lock:
+            return super().to_dict()
 
     def to_prompt_stack(self, last_n: Optional[int] = None) -> PromptStack:
+        with self._summary_lock:
+            summary = self.summary
+            unsummarized_runs = self.unsummarized_runs(last_n)
+
         stack = PromptStack()
-        if self.summary:
-            stack.add_user_message(self.summary_get_template.render(summary=self.summary))
+        if summary:
+            stack.add_user_message(self.summary_get_template.render(summary=summary))
 
-        for r in self.unsummarized_runs(last_n):
+        for r in unsummarized_runs:
             stack.add_user_message(r.input)
             stack.add_assistant_message(r.output)
 
@@ -54,14 +83,48 @@ class SummaryConversationMemory(BaseConversationMemory):
             return summary_index_runs
 
     def try_add_run(self, run: Run) -> None:
-        self.runs.append(run)
-        unsummarized_runs = self.unsummarized_runs()
-        runs_to_summarize = unsummarized_runs[: max(0, len(unsummarized_runs) - self.offset)]
+        with self._summary_lock:
+            self.runs.append(run)
+
+            if self.background_summarization:
+                # A running summarization picks up the new Run once it's done with the previous ones.
+                if self._summary_future is None and self._runs_to_summarize():
+                    if self._summary_executor is None:
+                        self._summary_executor = futures.ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="SummaryConversationMemory"
+                        )
+                    self._summary_future = self._summary_executor.submit(
+                        with_contextvars(self._summarize_in_background)
+                    )
+
+                return
+
+        runs_to_summarize = self._runs_to_summarize()
 
         if len(runs_to_summarize) > 0:
             self.summary = self.summarize_runs(self.summary, runs_to_summarize)
             self.summary_index = 1 + self.runs.index(runs_to_summarize[-1])
 
+    def load_older_runs(self, count: int) -> list[Run]:
+        with self._summary_lock:
+            runs = super().load_older_runs(count)
+            # The older Runs are inserted before the summarized ones, which moves them.
+            self.summary_index += len(runs)
+
+        return runs
+
+    def wait_for_summarization(self, timeout: Optional[float] = None) -> None:
+        """Waits for the background summarization of the added Runs to finish.
+
+        Args:
+            timeout: Maximum number of seconds to wait. Defaults to no limit.
+        """
+        with self._summary_lock:
+            future = self._summary_future
+
+        if future is not None:
+            future.result(timeout=timeout)
+
     def summarize_runs(self, previous_summary: str | None, runs: list[Run]) -> str | None:
         try:
             if len(runs) > 0:
@@ -75,3 +138,33 @@ class SummaryConversationMemory(BaseConversationMemory):
             logging.exception("Error summarizing memory: %s(%s)", type(e).__name__, e)
 
             return previous_summary
+
+    def _runs_to_summarize(self) -> list[Run]:
+        unsummarized_runs = self.unsummarized_runs()
+
+        return unsummarized_runs[: max(0, len(unsummarized_runs) - self.offset)]
+
+    def _summarize_in_background(self) -> None:
+        try:
+            while True:
+                with self._summary_lock:
+                    runs_to_summarize = self._runs_to_summarize()
+
+                    if not runs_to_summarize:
+                        self._summary_future = None
+                        return
+
+                    previous_summary = self.summary
+
+                summary = self.summarize_runs(previous_summary, runs_to_summarize)
+
+                with self._summary_lock:
+                    self.summary = summary
+                    # Runs may have been dropped by `max_runs` since, which moves the summarized Runs.
+                    self.summary_index = next(
+                        (i + 1 for i, run in enumerate(self.runs) if run is runs_to_summarize[-1]), 0
+                    )
+        except Exception:
+            with self._summary_lock:
+                self._summary_future = None
+            raise
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, Optional
+
+from attrs import Factory, define, field
+
+from griptape.common import PromptStack
+from griptape.configs import Defaults
+from griptape.memory.structure import BaseConversationMemory, Run
+
+if TYPE_CHECKING:
+    from griptape.drivers.prompt import BasePromptDriver
+    from griptape.drivers.vector import BaseVectorStoreDriver
+
+
+@define
+class VectorStoreConversationMemory(BaseConversationMemory):
+    """Conversation Memory that retrieves the earlier Runs relevant to the current input from a Vector Store.
+
+    Runs are indexed in the Vector Store Driver as they're added or loaded. When added to a Prompt Stack, the memory holds the
+    `retrieval_count` earlier Runs most relevant to the Prompt Stack's first user message, followed by the last
+    `recent_count` Runs. Retrieved Runs are ordered from least to most relevant, so they're the first to be pruned.
+
+    Attributes:
+        vector_store_driver: Vector Store Driver that indexes the Runs.
+        namespace: Vector Store namespace of the conversation's Runs.
+        recent_count: Number of most recent Runs to always include.
+        retrieval_count: Maximum number of earlier Runs to retrieve.
+    """
+
+    vector_store_driver: BaseVectorStoreDriver = field(
+        default=Factory(lambda: Defaults.drivers_config.vector_store_driver), kw_only=True
+    )
+    namespace: str = field(
+        default=Factory(lambda: f"conversation-{uuid.uuid4().hex}"), kw_only=True, metadata={"serializable": True}
+    )
+    recent_count: int = field(default=3, kw_only=True, metadata={"serializable": True})
+    retrieval_count: int = field(default=3, kw_only=True, metadata={"serializable": True})
+
+    def try_add_run(self, run: Run) -> None:
+        self.runs.append(run)
+        self.index_runs([run])
+
+    def load_runs(self, last_n: Optional[int] = None) -> list[Run]:
+        runs = super().load_runs(last_n)
+        self.index_runs(runs)
+
+        return runs
+
+    def load_older_runs(self, count: int) -> list[Run]:
+        runs = super().load_older_runs(count)
+        self.index_runs(runs)
+
+        return runs
+
+    def index_runs(self, runs: list[Run]) -> None:
+        """Indexes Runs in the Vector Store, such as Runs loaded from a Conversation Memory Driver.
+
+        Args:
+            runs: The Runs to index. Runs that are already indexed are skipped.
+        """
+        for run in runs:
+            if self.vector_store_driver.does_entry_exist(run.id, namespace=self.namespace):
+                continue
+
+            self.vector_store_driver.upsert_text(
+                f"{run.input.to_text()}\n{run.output.to_text()}",
+                vector_id=run.id,
+                namespace=self.namespace,
+                meta={"run": run.to_json()},
+            )
+
+    def retrieve_runs(self, query: str, *, exclude: Optional[list[Run]] = None) -> list[Run]:
+        """Retrieves the indexed Runs most relevant to a query.
+
+        Args:
+            query: The query.
+            exclude: Runs to leave out of the results.
+
+        Returns:
+            Up to `retrieval_count` Runs, from most to least relevant.
+        """
+        if self.retrieval_count <= 0:
+            return []
+
+        excluded_ids = {run.id for run in exclude or []}
+        entries = self.vector_store_driver.query(
+            query, count=self.retrieval_count + len(excluded_ids), namespace=self.namespace
+        )
+        runs = [Run.from_json(entry.meta["run"]) for entry in entries if entry.meta and "run" in entry.meta]
+
+        return [run for run in runs if run.id not in excluded_ids][: self.retrieval_count]
+
+    def to_prompt_stack(self, last_n: Optional[int] = None) -> PromptStack:
+        return self._runs_to_prompt_stack(self.runs[-last_n:] if last_n else self.runs)
+
+    def add_to_prompt_stack(
+        self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack, index: Optional[int] = None
+    ) -> PromptStack:
+        recent_runs = self.runs[-self.recent_count :] if self.recent_count > 0 else []
+        query = next((message.to_text() for message in prompt_stack.messages if message.is_user()), None)
+        retrieved_runs = self.retrieve_runs(query, exclude=recent_runs) if query else []
+        runs = [*reversed(retrieved_runs), *recent_runs]
+
+        return self._add_runs_to_prompt_stack(
+            prompt_driver, prompt_stack, index, len(runs), lambda last_n: self._runs_to_prompt_stack(runs[-last_n:])
+        )
+
+    def _runs_to_prompt_stack(self, runs: list[Run]) -> PromptStack:
+        prompt_stack = PromptStack()
+
+        for run in runs:
+            prompt_stack.add_user_message(run.input)
+            prompt_stack.add_assistant_message(run.output)
+
+        return prompt_stack
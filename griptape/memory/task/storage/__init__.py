@@ -1,5 +1,6 @@
 from .base_artifact_storage import BaseArtifactStorage
 from .text_artifact_storage import TextArtifactStorage
 from .blob_artifact_storage import BlobArtifactStorage
+from .spilling_blob_artifact_storage import SpillingBlobArtifactStorage
 
-__all__ = ["BaseArtifactStorage", "TextArtifactStorage", "BlobArtifactStorage"]
+__all__ = ["BaseArtifactStorage", "TextArtifactStorage", "BlobArtifactStorage", "SpillingBlobArtifactStorage"]
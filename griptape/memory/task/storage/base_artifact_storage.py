@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 from attrs import define
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from griptape.artifacts import BaseArtifact, ListArtifact
 
 
@@ -14,8 +16,15 @@ class BaseArtifactStorage(ABC):
     @abstractmethod
     def store_artifact(self, namespace: str, artifact: BaseArtifact) -> None: ...
 
+    def store_artifacts(self, namespace: str, artifacts: Sequence[BaseArtifact]) -> None:
+        for artifact in artifacts:
+            self.store_artifact(namespace, artifact)
+
     @abstractmethod
     def load_artifacts(self, namespace: str) -> ListArtifact: ...
 
+    def delete_artifacts(self, namespace: str) -> None:
+        raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+
     @abstractmethod
     def can_store(self, artifact: BaseArtifact) -> bool: ...
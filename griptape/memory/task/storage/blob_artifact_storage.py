@@ -24,3 +24,6 @@ class BlobArtifactStorage(BaseArtifactStorage):
 
     def load_artifacts(self, namespace: str) -> ListArtifact:
         return ListArtifact(next((blobs for key, blobs in self.blobs.items() if key == namespace), []))
+
+    def delete_artifacts(self, namespace: str) -> None:
+        self.blobs.pop(namespace, None)
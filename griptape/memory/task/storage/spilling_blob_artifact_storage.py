@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import attrs
+from attrs import define, field
+
+from griptape.artifacts import BaseArtifact, BlobArtifact, ListArtifact
+from griptape.memory.task.storage import BaseArtifactStorage
+
+
+@define(kw_only=True)
+class SpillingBlobArtifactStorage(BaseArtifactStorage):
+    """Stores Blob Artifacts in memory up to a byte budget, and spills the least recently used ones to disk.
+
+    Spilled Blob Artifacts are reloaded from disk by `load_artifacts`, and held in memory again as the budget allows.
+
+    Attributes:
+        max_memory_bytes: Maximum number of bytes of Blob Artifact values to hold in memory.
+        spill_directory: Directory to spill Blob Artifacts to. If None, a temporary directory is created on the first
+            spill, and removed along with the storage.
+    """
+
+    max_memory_bytes: int = field(default=64 * 1024 * 1024)
+    spill_directory: Optional[str] = field(default=None)
+    _keys: dict[str, list[str]] = field(factory=dict, init=False)
+    _memory_blobs: OrderedDict[str, BlobArtifact] = field(factory=OrderedDict, init=False)
+    _memory_bytes: int = field(default=0, init=False)
+    _spilled_keys: set[str] = field(factory=set, init=False)
+    _temporary_directory: Optional[tempfile.TemporaryDirectory] = field(default=None, init=False)
+    _lock: threading.RLock = field(factory=threading.RLock, init=False, eq=False)
+
+    @property
+    def memory_bytes(self) -> int:
+        """The number of bytes of Blob Artifact values held in memory."""
+        return self._memory_bytes
+
+    def can_store(self, artifact: BaseArtifact) -> bool:
+        return isinstance(artifact, BlobArtifact)
+
+    def store_artifact(self, namespace: str, artifact: BaseArtifact) -> None:
+        if isinstance(artifact, BlobArtifact):
+            with self._lock:
+                key = uuid.uuid4().hex
+
+                self._keys.setdefault(namespace, []).append(key)
+                self._hold_blob(key, artifact)
+                self._spill_blobs()
+        else:
+            raise ValueError("Artifact must be of instance BlobArtifact")
+
+    def load_artifacts(self, namespace: str) -> ListArtifact:
+        with self._lock:
+            blobs = []
+
+            for key in self._keys.get(namespace, []):
+                blob = self._memory_blobs.get(key)
+
+                if blob is None:
+                    blob = self._read_blob(key)
+                    self._hold_blob(key, blob)
+                else:
+                    self._memory_blobs.move_to_end(key)
+                blobs.append(blob)
+
+            self._spill_blobs()
+
+            return ListArtifact(blobs)
+
+    def delete_artifacts(self, namespace: str) -> None:
+        with self._lock:
+            for key in self._keys.pop(namespace, []):
+                blob = self._memory_blobs.pop(key, None)
+
+                if blob is not None:
+                    self._memory_bytes -= len(blob.value)
+                if key in self._spilled_keys:
+                    self._spilled_keys.remove(key)
+                    directory = self._get_spill_directory()
+                    (directory / f"{key}.bin").unlink(missing_ok=True)
+                    (directory / f"{key}.json").unlink(missing_ok=True)
+
+    def _hold_blob(self, key: str, blob: BlobArtifact) -> None:
+        self._memory_blobs[key] = blob
+        self._memory_bytes += len(blob.value)
+
+    def _spill_blobs(self) -> None:
+        while self._memory_bytes > self.max_memory_bytes and self._memory_blobs:
+            key, blob = self._memory_blobs.popitem(last=False)
+            self._memory_bytes -= len(blob.value)
+
+            # Blob Artifacts are only written once, since reloaded ones are already on disk.
+            if key not in self._spilled_keys:
+                self._write_blob(key, blob)
+                self._spilled_keys.add(key)
+
+    def _write_blob(self, key: str, blob: BlobArtifact) -> None:
+        directory = self._get_spill_directory()
+
+        # The value is written raw, and the rest of the Artifact as JSON, to avoid base64-encoding the value.
+        # The encoding fields are not serializable, so they are written alongside the Artifact.
+        blob_dict = {
+            **attrs.evolve(blob, value=b"").to_dict(),
+            "encoding": blob.encoding,
+            "encoding_error_handler": blob.encoding_error_handler,
+        }
+
+        (directory / f"{key}.bin").write_bytes(blob.value)
+        (directory / f"{key}.json").write_text(json.dumps(blob_dict))
+
+    def _read_blob(self, key: str) -> BlobArtifact:
+        directory = self._get_spill_directory()
+        blob_dict = json.loads((directory / f"{key}.json").read_text())
+        encoding = blob_dict.pop("encoding", None)
+        encoding_error_handler = blob_dict.pop("encoding_error_handler", None)
+        blob = BaseArtifact.from_dict(blob_dict)
+
+        if isinstance(blob, BlobArtifact):
+            blob.value = (directory / f"{key}.bin").read_bytes()
+            if encoding is not None:
+                blob.encoding = encoding
+            if encoding_error_handler is not None:
+                blob.encoding_error_handler = encoding_error_handler
+
+            return blob
+        else:
+            raise ValueError(f"Unable to load Blob Artifact from {directory}")
+
+    def _get_spill_directory(self) -> Path:
+        if self.spill_directory is None:
+            self._temporary_directory = tempfile.TemporaryDirectory(prefix="griptape-blobs-")
+            self.spill_directory = self._temporary_directory.name
+            directory = Path(self._temporary_directory.name)
+        else:
+            directory = Path(self.spill_directory)
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+        return directory
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
@@ -9,23 +11,145 @@ from griptape.configs import Defaults
 from griptape.memory.task.storage import BaseArtifactStorage
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from griptape.drivers.vector import BaseVectorStoreDriver
 
 
 @define(kw_only=True)
 class TextArtifactStorage(BaseArtifactStorage):
+    """Stores Text Artifacts in a Vector Store.
+
+    Attributes:
+        vector_store_driver: Vector Store Driver that stores the Artifacts.
+        defer_embedding: Whether to hold the Artifacts of a namespace without embedding them until the namespace is
+            searched with `query`. Loading the Artifacts doesn't embed them. Held Artifacts are only in the Vector Store
+            once embedded, so searching `vector_store_driver` directly, such as with a `VectorStoreTool` or a
+            `VectorStoreRetrievalRagModule` that share it, doesn't find them.
+        lexical_prefilter_count: With `defer_embedding`, the maximum number of held Artifacts to embed for a query,
+            chosen by the number of the query's words they contain. Artifacts that contain none of the query's words
+            aren't embedded, and are held until a later query. If None, every held Artifact is embedded.
+    """
+
     vector_store_driver: BaseVectorStoreDriver = field(
         default=Factory(lambda: Defaults.drivers_config.vector_store_driver)
     )
+    defer_embedding: bool = field(default=False)
+    lexical_prefilter_count: Optional[int] = field(default=None)
+    _unembedded_artifacts: dict[str, list[TextArtifact]] = field(factory=dict, init=False)
+    _embedding_artifacts: dict[str, list[TextArtifact]] = field(factory=dict, init=False)
+    _unembedded_artifacts_lock: threading.Condition = field(factory=threading.Condition, init=False, eq=False)
 
     def can_store(self, artifact: BaseArtifact) -> bool:
         return isinstance(artifact, TextArtifact)
 
     def store_artifact(self, namespace: str, artifact: BaseArtifact) -> None:
-        if isinstance(artifact, TextArtifact):
-            self.vector_store_driver.upsert_text_artifact(artifact, namespace=namespace)
-        else:
+        self.store_artifacts(namespace, [artifact])
+
+    def store_artifacts(self, namespace: str, artifacts: Sequence[BaseArtifact]) -> None:
+        text_artifacts = [artifact for artifact in artifacts if isinstance(artifact, TextArtifact)]
+
+        if len(text_artifacts) != len(artifacts):
             raise ValueError("Artifact must be of instance TextArtifact")
 
+        if self.defer_embedding:
+            with self._unembedded_artifacts_lock:
+                self._unembedded_artifacts.setdefault(namespace, []).extend(text_artifacts)
+        else:
+            # Upserts the Artifacts in batches, with an embedding request and a vector write for each batch.
+            self.vector_store_driver.upsert_text_artifacts({namespace: text_artifacts})
+
     def load_artifacts(self, namespace: str) -> ListArtifact:
-        return self.vector_store_driver.load_artifacts(namespace=namespace)
+        with self._unembedded_artifacts_lock:
+            unembedded_artifacts = [
+                *self._embedding_artifacts.get(namespace, []),
+                *self._unembedded_artifacts.get(namespace, []),
+            ]
+
+        if unembedded_artifacts:
+            artifacts = self.vector_store_driver.load_artifacts(namespace=namespace).value
+            # Artifacts being embedded may already be partly upserted.
+            artifact_ids = {artifact.id for artifact in artifacts}
+
+            return ListArtifact(
+                [*artifacts, *(artifact for artifact in unembedded_artifacts if artifact.id not in artifact_ids)]
+            )
+        else:
+            return self.vector_store_driver.load_artifacts(namespace=namespace)
+
+    def delete_artifacts(self, namespace: str) -> None:
+        with self._unembedded_artifacts_lock:
+            # Waits for the namespace's Artifacts being embedded, so that they're not upserted after the deletion.
+            self._unembedded_artifacts_lock.wait_for(lambda: namespace not in self._embedding_artifacts)
+            self._unembedded_artifacts.pop(namespace, None)
+
+        self.vector_store_driver.delete_namespace(namespace)
+
+    def query(self, namespace: str, query: str, *, count: Optional[int] = None, **kwargs: Any) -> ListArtifact:
+        """Searches the Artifacts of a namespace, embedding the held Artifacts first.
+
+        Args:
+            namespace: The namespace to search.
+            query: The query.
+            count: Maximum number of Artifacts to return.
+            kwargs: Additional keyword arguments to pass to the Vector Store Driver's `query`.
+
+        Returns:
+            The Artifacts most relevant to the query.
+        """
+        self.embed_artifacts(namespace, query=query)
+
+        entries = self.vector_store_driver.query(query, count=count, namespace=namespace, **kwargs)
+
+        return ListArtifact([entry.to_artifact() for entry in entries])
+
+    def embed_artifacts(self, namespace: str, *, query: Optional[str] = None) -> None:
+        """Embeds and upserts the held Artifacts of a namespace.
+
+        If the upsert fails, the Artifacts are held again.
+
+        Args:
+            namespace: The namespace.
+            query: If provided with `lexical_prefilter_count`, only the Artifacts that best match the query are embedded.
+        """
+        with self._unembedded_artifacts_lock:
+            # Waits for the namespace's Artifacts already being embedded, so that they're in the Vector Store once this
+            # returns.
+            self._unembedded_artifacts_lock.wait_for(lambda: namespace not in self._embedding_artifacts)
+            artifacts = self._unembedded_artifacts.pop(namespace, [])
+
+            if query is not None and self.lexical_prefilter_count is not None:
+                candidates = self._lexical_candidates(artifacts, query)
+                candidate_ids = {id(artifact) for artifact in candidates}
+                remaining_artifacts = [artifact for artifact in artifacts if id(artifact) not in candidate_ids]
+
+                if remaining_artifacts:
+                    self._unembedded_artifacts[namespace] = remaining_artifacts
+                artifacts = candidates
+
+            if not artifacts:
+                return
+
+            # The Artifacts are upserted without holding the lock, and are loaded from here until they're upserted.
+            self._embedding_artifacts[namespace] = artifacts
+
+        try:
+            self.vector_store_driver.upsert_text_artifacts({namespace: artifacts})
+        except Exception:
+            with self._unembedded_artifacts_lock:
+                self._unembedded_artifacts[namespace] = [*artifacts, *self._unembedded_artifacts.get(namespace, [])]
+            raise
+        finally:
+            with self._unembedded_artifacts_lock:
+                del self._embedding_artifacts[namespace]
+                self._unembedded_artifacts_lock.notify_all()
+
+    def _lexical_candidates(self, artifacts: list[TextArtifact], query: str) -> list[TextArtifact]:
+        query_words = set(re.findall(r"\w+", query.lower()))
+        scored_artifacts = [
+            (len(query_words.intersection(re.findall(r"\w+", artifact.to_text().lower()))), artifact)
+            for artifact in artifacts
+        ]
+        scored_artifacts.sort(key=lambda scored_artifact: scored_artifact[0], reverse=True)
+
+        return [artifact for score, artifact in scored_artifacts[: self.lexical_prefilter_count] if score > 0]
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Optional
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
 
 from attrs import Attribute, Factory, define, field
 
 from griptape.artifacts import BaseArtifact, BlobArtifact, ErrorArtifact, InfoArtifact, ListArtifact, TextArtifact
+from griptape.configs import Defaults
 from griptape.memory.meta import ActionSubtaskMetaEntry
 from griptape.memory.task.storage import BlobArtifactStorage, TextArtifactStorage
 from griptape.mixins.activity_mixin import ActivityMixin
@@ -14,9 +18,36 @@ if TYPE_CHECKING:
     from griptape.memory.task.storage import BaseArtifactStorage
     from griptape.tasks import ActionsSubtask
 
+logger = logging.getLogger(Defaults.logging_config.logger_name)
+
 
 @define
 class TaskMemory(ActivityMixin, SerializableMixin):
+    """Stores the Artifacts that Tools output in namespaces.
+
+    Namespaces can be evicted once they expire or once Task Memory holds too many, which deletes their Artifacts
+    from the Artifact Storages.
+
+    Attributes:
+        name: The name of the Task Memory.
+        artifact_storages: The Artifact Storage for each type of Artifact.
+        namespace_storage: The Artifact Storage of each namespace.
+        namespace_metadata: The metadata of each namespace.
+        namespace_ttl: Seconds after which a namespace that hasn't been stored to or loaded is evicted.
+        max_namespaces: Maximum number of namespaces to hold.
+        max_artifacts: Maximum number of Artifacts to hold across namespaces.
+        eviction_policy: Which namespaces to evict first once a limit is exceeded: the least recently used ("lru"),
+            or the first stored ("oldest").
+        eviction_metrics: Counts of the namespaces evicted so far, and of the Artifacts deleted from the Artifact Storages
+            by evicting them.
+    """
+
+    @define
+    class EvictionMetrics:
+        expired_namespaces: int = field(default=0)
+        evicted_namespaces: int = field(default=0)
+        evicted_artifacts: int = field(default=0)
+
     name: str = field(
         default=Factory(lambda self: self.__class__.__name__, takes_self=True),
         kw_only=True,
@@ -35,6 +66,13 @@ class TaskMemory(ActivityMixin, SerializableMixin):
         factory=dict, kw_only=True, metadata={"serializable": True}
     )
     namespace_metadata: dict[str, Any] = field(factory=dict, kw_only=True, metadata={"serializable": True})
+    namespace_ttl: Optional[float] = field(default=None, kw_only=True)
+    max_namespaces: Optional[int] = field(default=None, kw_only=True)
+    max_artifacts: Optional[int] = field(default=None, kw_only=True)
+    eviction_policy: Literal["lru", "oldest"] = field(default="lru", kw_only=True)
+    eviction_metrics: TaskMemory.EvictionMetrics = field(factory=lambda: TaskMemory.EvictionMetrics(), init=False)
+    _namespace_usage: dict[str, _NamespaceUsage] = field(factory=dict, init=False)
+    _namespace_usage_lock: threading.RLock = field(factory=threading.RLock, init=False, eq=False)
 
     @artifact_storages.validator  # pyright: ignore[reportAttributeAccessIssue]
     def validate_artifact_storages(self, _: Attribute, artifact_storage: dict[type, BaseArtifactStorage]) -> None:
@@ -109,16 +147,17 @@ class TaskMemory(ActivityMixin, SerializableMixin):
         else:
             if storage:
                 if isinstance(artifact, ListArtifact):
-                    for a in artifact.value:
-                        storage.store_artifact(namespace, a)
+                    storage.store_artifacts(namespace, artifact.value)
 
                     self.namespace_storage[namespace] = storage
+                    self._track_namespace(namespace, len(artifact.value))
 
                     return None
                 elif isinstance(artifact, BaseArtifact):
                     storage.store_artifact(namespace, artifact)
 
                     self.namespace_storage[namespace] = storage
+                    self._track_namespace(namespace, 1)
 
                     return None
                 else:
@@ -127,15 +166,117 @@ class TaskMemory(ActivityMixin, SerializableMixin):
                 return ErrorArtifact("error storing tool output in memory")
 
     def load_artifacts(self, namespace: str) -> ListArtifact:
+        self.evict_namespaces()
+
         storage = self.namespace_storage.get(namespace)
 
         if storage:
+            self._track_namespace(namespace, 0)
+
             return storage.load_artifacts(namespace)
         else:
             return ListArtifact()
 
+    def evict_namespaces(self, *, keep: Optional[str] = None) -> list[str]:
+        """Evicts the namespaces that expired, and then the namespaces beyond the limits, per the eviction policy.
+
+        Args:
+            keep: A namespace not to evict for exceeding the limits, such as the namespace just stored to.
+
+        Returns:
+            The evicted namespaces.
+        """
+        if self.namespace_ttl is None and self.max_namespaces is None and self.max_artifacts is None:
+            return []
+
+        with self._namespace_usage_lock:
+            expired_before = time.time() - self.namespace_ttl if self.namespace_ttl is not None else None
+            expired_namespaces = [
+                namespace
+                for namespace, usage in self._namespace_usage.items()
+                if expired_before is not None and usage.accessed_at < expired_before
+            ]
+            evicted_namespaces = [*expired_namespaces]
+            remaining_namespaces = sorted(
+                (namespace for namespace in self._namespace_usage if namespace not in expired_namespaces),
+                key=lambda namespace: (
+                    self._namespace_usage[namespace].accessed_at
+                    if self.eviction_policy == "lru"
+                    else self._namespace_usage[namespace].created_at
+                ),
+            )
+            artifact_count = sum(self._namespace_usage[namespace].artifact_count for namespace in remaining_namespaces)
+
+            for namespace in [namespace for namespace in remaining_namespaces if namespace != keep]:
+                if (self.max_namespaces is None or len(remaining_namespaces) <= self.max_namespaces) and (
+                    self.max_artifacts is None or artifact_count <= self.max_artifacts
+                ):
+                    break
+
+                evicted_namespaces.append(namespace)
+                remaining_namespaces.remove(namespace)
+                artifact_count -= self._namespace_usage[namespace].artifact_count
+
+            self.eviction_metrics.expired_namespaces += len(expired_namespaces)
+            self.eviction_metrics.evicted_namespaces += len(evicted_namespaces)
+            artifact_counts = {
+                namespace: self._namespace_usage.pop(namespace).artifact_count for namespace in evicted_namespaces
+            }
+
+        # Artifacts are deleted outside of the lock, so that storing to other namespaces isn't blocked.
+        for namespace in evicted_namespaces:
+            # Only the Artifacts that the Artifact Storage deleted are counted.
+            if self.delete_namespace(namespace):
+                with self._namespace_usage_lock:
+                    self.eviction_metrics.evicted_artifacts += artifact_counts[namespace]
+
+        return evicted_namespaces
+
+    def delete_namespace(self, namespace: str) -> bool:
+        """Deletes a namespace and its Artifacts.
+
+        The namespace is removed from Task Memory even if its Artifact Storage doesn't support deleting its Artifacts.
+
+        Args:
+            namespace: The namespace to delete.
+
+        Returns:
+            Whether the namespace's Artifacts were deleted from its Artifact Storage.
+        """
+        with self._namespace_usage_lock:
+            self._namespace_usage.pop(namespace, None)
+            storage = self.namespace_storage.pop(namespace, None)
+            self.namespace_metadata.pop(namespace, None)
+
+        if storage is not None:
+            try:
+                storage.delete_artifacts(namespace)
+
+                return True
+            except NotImplementedError as e:
+                logger.warning("Unable to delete the Artifacts of namespace %s: %s", namespace, e)
+
+        return False
+
     def find_input_memory(self, memory_name: str) -> Optional[TaskMemory]:
         if memory_name == self.name:
             return self
         else:
             return None
+
+    def _track_namespace(self, namespace: str, artifact_count: int) -> None:
+        with self._namespace_usage_lock:
+            now = time.time()
+            usage = self._namespace_usage.setdefault(namespace, _NamespaceUsage(created_at=now, accessed_at=now))
+            usage.accessed_at = now
+            usage.artifact_count += artifact_count
+
+        if artifact_count:
+            self.evict_namespaces(keep=namespace)
+
+
+@define
+class _NamespaceUsage:
+    created_at: float = field()
+    accessed_at: float = field()
+    artifact_count: int = field(default=0)
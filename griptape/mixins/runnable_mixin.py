@@ -9,7 +9,7 @@ from attrs import define, field
 T = TypeVar("T", bound="RunnableMixin")
 
 
-@define()
+@define(slots=False)
 class RunnableMixin(ABC, Generic[T]):
     """Mixin for classes that can be "run".
 
@@ -8,15 +8,25 @@ from typing import TYPE_CHECKING, Generic, Optional, TypeVar, cast
 from attrs import Factory, define, field
 
 from griptape.schemas.base_schema import BaseSchema
+from griptape.schemas.fast_serializer import FastSerializer
 
 if TYPE_CHECKING:
     from marshmallow import Schema
 
-T = TypeVar("T", bound="SerializableMixin")
+T = TypeVar("T", bound="SlottedSerializableMixin")
 
+# Classes imported by `SlottedSerializableMixin._import_cls_rec`, by module name and class name.
+_imported_classes: dict[tuple[str, str], type] = {}
+
+
+@define
+class SlottedSerializableMixin(Generic[T]):
+    """Serializable mixin without an instance `__dict__`.
+
+    Used by the classes that are created in large numbers, such as Artifacts, Messages, and Events, to save memory.
+    Their instances reject attributes that aren't declared as fields. Other classes use `SerializableMixin`.
+    """
 
-@define(slots=False)
-class SerializableMixin(Generic[T]):
     type: str = field(
         default=Factory(lambda self: self.__class__.__name__, takes_self=True),
         kw_only=True,
@@ -64,6 +74,10 @@ class SerializableMixin(Generic[T]):
         return json.dumps(self.to_dict())
 
     def to_dict(self) -> dict:
+        serialized = FastSerializer.to_dict(self)
+        if serialized is not None:
+            return serialized
+
         schema = BaseSchema.from_attrs_cls(self.__class__)
 
         return dict(schema().dump(self))
@@ -73,7 +87,7 @@ class SerializableMixin(Generic[T]):
         """Imports a class given a module name and class name.
 
         Will recursively traverse up the module's path until it finds a
-        package that it can import `class_name` from.
+        package that it can import `class_name` from. Imported classes are cached.
 
         Args:
             module_name: The module name.
@@ -82,6 +96,10 @@ class SerializableMixin(Generic[T]):
         Returns:
             The imported class if found. Raises `ValueError` if not found.
         """
+        imported_cls = _imported_classes.get((module_name, class_name))
+        if imported_cls is not None:
+            return imported_cls
+
         try:
             module = import_module(module_name)
             test = getattr(module, class_name, None)
@@ -90,10 +108,19 @@ class SerializableMixin(Generic[T]):
 
         if test is None:
             module_dirs = module_name.split(".")[:-1]
-            module_name = ".".join(module_dirs)
+            parent_module_name = ".".join(module_dirs)
 
             if not len(module_dirs):
                 raise ValueError(f"Unable to import class: {class_name}")
-            return cls._import_cls_rec(module_name, class_name)
+            imported_cls = cls._import_cls_rec(parent_module_name, class_name)
         else:
-            return test
+            imported_cls = test
+
+        _imported_classes[(module_name, class_name)] = imported_cls
+
+        return imported_cls
+
+
+@define(slots=False)
+class SerializableMixin(SlottedSerializableMixin[T]):
+    pass
@@ -6,5 +6,7 @@ from .bytes_field import Bytes
 
 from .union_field import Union
 
+from .fast_serializer import FastSerializer
 
-__all__ = ["BaseSchema", "PolymorphicSchema", "Bytes", "Union"]
+
+__all__ = ["BaseSchema", "PolymorphicSchema", "Bytes", "Union", "FastSerializer"]
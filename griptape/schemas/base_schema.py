@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC
 from collections.abc import Sequence
 from enum import Enum
-from typing import Any, Literal, TypeVar, Union, _SpecialForm, get_args, get_origin
+from typing import Any, Literal, Optional, TypeVar, Union, _SpecialForm, get_args, get_origin
 
 import attrs
 from marshmallow import INCLUDE, Schema, fields
@@ -11,6 +11,11 @@ from marshmallow import INCLUDE, Schema, fields
 from griptape.schemas.bytes_field import Bytes
 from griptape.schemas.union_field import Union as UnionField
 
+# Schema classes generated by `BaseSchema.from_attrs_cls`, by Schema class and attrs class.
+_schema_classes: dict[tuple[type, type], type] = {}
+# Namespace that `BaseSchema._resolve_types` resolves types in.
+_resolve_types_localns: Optional[dict[str, Any]] = None
+
 
 class BaseSchema(Schema):
     class Meta:
@@ -22,19 +27,31 @@ class BaseSchema(Schema):
     def from_attrs_cls(cls, attrs_cls: type) -> type:
         """Generate a Schema from an attrs class.
 
+        Schemas are generated once per attrs class and reused for the rest of the process.
+
         Args:
             attrs_cls: An attrs class.
         """
+        schema_cls = _schema_classes.get((cls, attrs_cls))
+
+        if schema_cls is None:
+            schema_cls = cls._generate_schema_cls(attrs_cls)
+            _schema_classes[(cls, attrs_cls)] = schema_cls
+
+        return schema_cls
+
+    @classmethod
+    def _generate_schema_cls(cls, attrs_cls: type) -> type:
         from marshmallow import post_load
 
-        from griptape.mixins.serializable_mixin import SerializableMixin
+        from griptape.mixins.serializable_mixin import SlottedSerializableMixin
 
         class SubSchema(cls):
             @post_load
             def make_obj(self, data: Any, **kwargs) -> Any:
                 return attrs_cls(**data)
 
-        if issubclass(attrs_cls, SerializableMixin):
+        if issubclass(attrs_cls, SlottedSerializableMixin):
             cls._resolve_types(attrs_cls)
             return SubSchema.from_dict(
                 {
@@ -152,6 +169,19 @@ class BaseSchema(Schema):
         Args:
             attrs_cls: An attrs class.
         """
+        attrs.resolve_types(attrs_cls, localns=cls._get_resolve_types_localns())
+
+    @classmethod
+    def _get_resolve_types_localns(cls) -> dict[str, Any]:
+        """Get the namespace that types in attrs classes are resolved in.
+
+        Built once, on first use, since it imports most of the framework.
+        """
+        global _resolve_types_localns
+
+        if _resolve_types_localns is not None:
+            return _resolve_types_localns
+
         from collections.abc import Sequence
         from typing import Any
 
@@ -189,60 +219,59 @@ class BaseSchema(Schema):
         from griptape.tools import BaseTool
         from griptape.utils import import_optional_dependency, is_dependency_installed
 
-        attrs.resolve_types(
-            attrs_cls,
-            localns={
-                "Any": Any,
-                "BasePromptDriver": BasePromptDriver,
-                "BaseEmbeddingDriver": BaseEmbeddingDriver,
-                "BaseVectorStoreDriver": BaseVectorStoreDriver,
-                "BaseTextToSpeechDriver": BaseTextToSpeechDriver,
-                "BaseAudioTranscriptionDriver": BaseAudioTranscriptionDriver,
-                "BaseConversationMemoryDriver": BaseConversationMemoryDriver,
-                "BaseRulesetDriver": BaseRulesetDriver,
-                "BaseImageGenerationDriver": BaseImageGenerationDriver,
-                "BaseMultiModelImageGenerationDriver": BaseMultiModelImageGenerationDriver,
-                "BaseImageGenerationModelDriver": BaseImageGenerationModelDriver,
-                "BaseArtifact": BaseArtifact,
-                "PromptStack": PromptStack,
-                "EventListener": EventListener,
-                "BaseMessageContent": BaseMessageContent,
-                "BaseDeltaMessageContent": BaseDeltaMessageContent,
-                "BaseTool": BaseTool,
-                "BaseTask": BaseTask,
-                "TextArtifact": TextArtifact,
-                "Usage": Message.Usage,
-                "Structure": Structure,
-                "BaseTokenizer": BaseTokenizer,
-                "ToolAction": ToolAction,
-                "Reference": Reference,
-                "Run": Run,
-                "Sequence": Sequence,
-                "TaskMemory": TaskMemory,
-                "State": BaseTask.State,
-                "BaseConversationMemory": BaseConversationMemory,
-                "BaseArtifactStorage": BaseArtifactStorage,
-                "BaseRule": BaseRule,
-                "Ruleset": Ruleset,
-                "StructuredOutputStrategy": StructuredOutputStrategy,
-                "RagContext": RagContext,
-                # Third party modules
-                "Client": import_optional_dependency("cohere").Client if is_dependency_installed("cohere") else Any,
-                "ClientV2": import_optional_dependency("cohere").ClientV2 if is_dependency_installed("cohere") else Any,
-                "GenerativeModel": import_optional_dependency("google.generativeai").GenerativeModel
-                if is_dependency_installed("google.generativeai")
-                else Any,
-                "boto3": import_optional_dependency("boto3") if is_dependency_installed("boto3") else Any,
-                "Anthropic": import_optional_dependency("anthropic").Anthropic
-                if is_dependency_installed("anthropic")
-                else Any,
-                "BedrockClient": import_optional_dependency("mypy_boto3_bedrock").BedrockClient
-                if is_dependency_installed("mypy_boto3_bedrock")
-                else Any,
-                "voyageai": import_optional_dependency("voyageai") if is_dependency_installed("voyageai") else Any,
-                "Schema": Schema,
-            },
-        )
+        _resolve_types_localns = {
+            "Any": Any,
+            "BasePromptDriver": BasePromptDriver,
+            "BaseEmbeddingDriver": BaseEmbeddingDriver,
+            "BaseVectorStoreDriver": BaseVectorStoreDriver,
+            "BaseTextToSpeechDriver": BaseTextToSpeechDriver,
+            "BaseAudioTranscriptionDriver": BaseAudioTranscriptionDriver,
+            "BaseConversationMemoryDriver": BaseConversationMemoryDriver,
+            "BaseRulesetDriver": BaseRulesetDriver,
+            "BaseImageGenerationDriver": BaseImageGenerationDriver,
+            "BaseMultiModelImageGenerationDriver": BaseMultiModelImageGenerationDriver,
+            "BaseImageGenerationModelDriver": BaseImageGenerationModelDriver,
+            "BaseArtifact": BaseArtifact,
+            "PromptStack": PromptStack,
+            "EventListener": EventListener,
+            "BaseMessageContent": BaseMessageContent,
+            "BaseDeltaMessageContent": BaseDeltaMessageContent,
+            "BaseTool": BaseTool,
+            "BaseTask": BaseTask,
+            "TextArtifact": TextArtifact,
+            "Usage": Message.Usage,
+            "Structure": Structure,
+            "BaseTokenizer": BaseTokenizer,
+            "ToolAction": ToolAction,
+            "Reference": Reference,
+            "Run": Run,
+            "Sequence": Sequence,
+            "TaskMemory": TaskMemory,
+            "State": BaseTask.State,
+            "BaseConversationMemory": BaseConversationMemory,
+            "BaseArtifactStorage": BaseArtifactStorage,
+            "BaseRule": BaseRule,
+            "Ruleset": Ruleset,
+            "StructuredOutputStrategy": StructuredOutputStrategy,
+            "RagContext": RagContext,
+            # Third party modules
+            "Client": import_optional_dependency("cohere").Client if is_dependency_installed("cohere") else Any,
+            "ClientV2": import_optional_dependency("cohere").ClientV2 if is_dependency_installed("cohere") else Any,
+            "GenerativeModel": import_optional_dependency("google.generativeai").GenerativeModel
+            if is_dependency_installed("google.generativeai")
+            else Any,
+            "boto3": import_optional_dependency("boto3") if is_dependency_installed("boto3") else Any,
+            "Anthropic": import_optional_dependency("anthropic").Anthropic
+            if is_dependency_installed("anthropic")
+            else Any,
+            "BedrockClient": import_optional_dependency("mypy_boto3_bedrock").BedrockClient
+            if is_dependency_installed("mypy_boto3_bedrock")
+            else Any,
+            "voyageai": import_optional_dependency("voyageai") if is_dependency_installed("voyageai") else Any,
+            "Schema": Schema,
+        }
+
+        return _resolve_types_localns
 
     @classmethod
     def _is_list_sequence(cls, field_type: type | _SpecialForm) -> bool:
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import attrs
+from marshmallow import fields
+
+from griptape.schemas.base_schema import BaseSchema
+from griptape.schemas.polymorphic_schema import PolymorphicSchema
+from griptape.schemas.union_field import Union as UnionField
+
+if TYPE_CHECKING:
+    from griptape.mixins.serializable_mixin import SlottedSerializableMixin
+
+Serializer = Callable[[Any], dict]
+FieldSerializer = Callable[[Any], Any]
+
+# Serializers of the fast serializable classes, by class. A class maps to None if it isn't fast serializable.
+_serializers: dict[type, Optional[Serializer]] = {}
+_fast_serializable_classes: Optional[set[type]] = None
+# The `orjson` module, or False if it isn't installed.
+_orjson: Any = None
+
+
+class FastSerializer:
+    """Serializes the hottest Serializable types without going through a marshmallow Schema on every call.
+
+    Each fast serializable class is compiled once into a list of field accessors, based on the fields of its Schema.
+    Fields of simple types are read and converted directly, and any other field is serialized by its Schema field, so
+    the result is identical to `Schema.dump`. Only exact instances of the fast serializable classes are serialized this
+    way, since subclasses may add fields.
+    """
+
+    @classmethod
+    def to_dict(cls, obj: SlottedSerializableMixin) -> Optional[dict]:
+        """Serializes an object, if its class is fast serializable.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            The serialized object, or None if its class isn't fast serializable.
+        """
+        serializer = cls.get_serializer(type(obj))
+        if serializer is None:
+            return None
+
+        try:
+            return serializer(obj)
+        except AttributeError:
+            # Schemas leave out missing attributes, so leave objects with missing attributes to them.
+            return None
+
+    @classmethod
+    def get_serializer(cls, serializable_cls: type) -> Optional[Serializer]:
+        """Gets the serializer of a class.
+
+        Args:
+            serializable_cls: A Serializable class.
+
+        Returns:
+            The class's serializer, or None if it isn't fast serializable.
+        """
+        if serializable_cls in _serializers:
+            return _serializers[serializable_cls]
+
+        if serializable_cls in cls._get_fast_serializable_classes():
+            serializer = cls._compile_serializer(serializable_cls)
+        else:
+            serializer = None
+        _serializers[serializable_cls] = serializer
+
+        return serializer
+
+    @classmethod
+    def dumps(cls, obj: Any) -> str:
+        """Encodes serialized objects as compact JSON.
+
+        Uses `orjson` if it's installed, and the standard library's `json` otherwise.
+
+        Args:
+            obj: The JSON serializable object to encode.
+
+        Returns:
+            The JSON.
+        """
+        global _orjson
+
+        if _orjson is None:
+            from griptape.utils import import_optional_dependency, is_dependency_installed
+
+            _orjson = import_optional_dependency("orjson") if is_dependency_installed("orjson") else False
+
+        if _orjson:
+            return _orjson.dumps(obj).decode()
+        else:
+            return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    @classmethod
+    def _get_fast_serializable_classes(cls) -> set[type]:
+        global _fast_serializable_classes
+
+        if _fast_serializable_classes is None:
+            from griptape.artifacts import TextArtifact
+            from griptape.common import Message, TextMessageContent
+            from griptape.events import ActionChunkEvent, TextChunkEvent
+
+            _fast_serializable_classes = {
+                TextArtifact,
+                TextChunkEvent,
+                ActionChunkEvent,
+                Message,
+                Message.Usage,
+                TextMessageContent,
+            }
+
+        return _fast_serializable_classes
+
+    @classmethod
+    def _compile_serializer(cls, serializable_cls: type) -> Serializer:
+        schema = BaseSchema.from_attrs_cls(serializable_cls)()
+        field_classes = {
+            a.alias or a.name: BaseSchema._get_field_type_info(a.type)[0] for a in attrs.fields(serializable_cls)
+        }
+        field_serializers = [
+            (key, cls._compile_field_serializer(key, field, field_classes.get(key)))
+            for key, field in schema.dump_fields.items()
+        ]
+
+        def serialize(obj: Any) -> dict:
+            return {key: field_serializer(obj) for key, field_serializer in field_serializers}
+
+        return serialize
+
+    @classmethod
+    def _compile_field_serializer(cls, key: str, field: fields.Field, field_class: Any) -> FieldSerializer:
+        attr = field.attribute or key
+
+        # Optional fields of a single type are Unions with a single candidate field.
+        if isinstance(field, UnionField) and len(field._candidate_fields) == 1:
+            field = field._candidate_fields[0]
+
+        if type(field) is fields.String:
+            return cls._compile_simple_field_serializer(attr, field, str)
+        elif type(field) is fields.Integer:
+            return cls._compile_simple_field_serializer(attr, field, int)
+        elif type(field) is fields.Float:
+            return cls._compile_simple_field_serializer(attr, field, float)
+        elif type(field) is fields.Boolean:
+            return cls._compile_simple_field_serializer(attr, field, bool)
+        elif type(field) is fields.Dict and field.key_field is None and field.value_field is None:
+            return lambda obj: None if (value := getattr(obj, attr)) is None else dict(value)
+        elif type(field) is fields.Raw:
+            return lambda obj: getattr(obj, attr)
+        elif type(field) is fields.Nested and not isinstance(field.nested, PolymorphicSchema):
+            return cls._compile_nested_field_serializer(attr, field, field_class)
+        elif (
+            type(field) is fields.List
+            and type(field.inner) is fields.Nested
+            and isinstance(field.inner.nested, PolymorphicSchema)
+        ):
+            return cls._compile_polymorphic_list_field_serializer(attr, field)
+        else:
+            return lambda obj: field.serialize(attr, obj)
+
+    @classmethod
+    def _compile_simple_field_serializer(cls, attr: str, field: fields.Field, value_type: type) -> FieldSerializer:
+        def serialize(obj: Any) -> Any:
+            value = getattr(obj, attr)
+
+            # Values of the field's type, and None, are serialized as is.
+            if value is None or type(value) is value_type:
+                return value
+            else:
+                return field._serialize(value, attr, obj)
+
+        return serialize
+
+    @classmethod
+    def _compile_nested_field_serializer(cls, attr: str, field: fields.Nested, field_class: Any) -> FieldSerializer:
+        def serialize(obj: Any) -> Any:
+            value = getattr(obj, attr)
+
+            # Nested fields are serialized with the Schema of the field's class, even for instances of subclasses.
+            if value is not None and type(value) is field_class and (serializer := cls.get_serializer(field_class)):
+                return serializer(value)
+            else:
+                return field.serialize(attr, obj)
+
+        return serialize
+
+    @classmethod
+    def _compile_polymorphic_list_field_serializer(cls, attr: str, field: fields.List) -> FieldSerializer:
+        def serialize_item(item: Any, obj: Any) -> Any:
+            serializer = cls.get_serializer(type(item))
+
+            if serializer is None:
+                return field.inner._serialize(item, attr, obj)
+            else:
+                serialized_item = serializer(item)
+                serialized_item[PolymorphicSchema.type_field] = type(item).__name__
+
+                return serialized_item
+
+        def serialize(obj: Any) -> Any:
+            value = getattr(obj, attr)
+
+            return None if value is None else [serialize_item(item, obj) for item in value]
+
+        return serialize
@@ -158,7 +158,7 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
 
         [task.reset() for task in self.tasks]
 
-        if self.input_task is not None:
+        if self.input_task is not None and EventBus.has_listeners(StartStructureRunEvent):
             EventBus.publish_event(
                 StartStructureRunEvent(
                     structure_id=self.id,
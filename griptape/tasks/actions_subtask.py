@@ -104,18 +104,19 @@ class ActionsSubtask(BaseTask[Union[ListArtifact, ErrorArtifact]]):
             self.output = ErrorArtifact(f"ToolAction input parsing error: {e}", exception=e)
 
     def before_run(self) -> None:
-        EventBus.publish_event(
-            StartActionsSubtaskEvent(
-                task_id=self.id,
-                task_parent_ids=self.parent_ids,
-                task_child_ids=self.child_ids,
-                task_input=self.input,
-                task_output=self.output,
-                subtask_parent_task_id=self.origin_task.id,
-                subtask_thought=self.thought,
-                subtask_actions=self.actions_to_dicts(),
-            ),
-        )
+        if EventBus.has_listeners(StartActionsSubtaskEvent):
+            EventBus.publish_event(
+                StartActionsSubtaskEvent(
+                    task_id=self.id,
+                    task_parent_ids=self.parent_ids,
+                    task_child_ids=self.child_ids,
+                    task_input=self.input,
+                    task_output=self.output,
+                    subtask_parent_task_id=self.origin_task.id,
+                    subtask_thought=self.thought,
+                    subtask_actions=self.actions_to_dicts(),
+                ),
+            )
 
         parts = [
             f"Subtask {self.id}",
@@ -170,18 +171,19 @@ class ActionsSubtask(BaseTask[Union[ListArtifact, ErrorArtifact]]):
     def after_run(self) -> None:
         response = self.output.to_text() if isinstance(self.output, BaseArtifact) else str(self.output)
 
-        EventBus.publish_event(
-            FinishActionsSubtaskEvent(
-                task_id=self.id,
-                task_parent_ids=self.parent_ids,
-                task_child_ids=self.child_ids,
-                task_input=self.input,
-                task_output=self.output,
-                subtask_parent_task_id=self.origin_task.id,
-                subtask_thought=self.thought,
-                subtask_actions=self.actions_to_dicts(),
-            ),
-        )
+        if EventBus.has_listeners(FinishActionsSubtaskEvent):
+            EventBus.publish_event(
+                FinishActionsSubtaskEvent(
+                    task_id=self.id,
+                    task_parent_ids=self.parent_ids,
+                    task_child_ids=self.child_ids,
+                    task_input=self.input,
+                    task_output=self.output,
+                    subtask_parent_task_id=self.origin_task.id,
+                    subtask_thought=self.thought,
+                    subtask_actions=self.actions_to_dicts(),
+                ),
+            )
         logger.info("Subtask %s\nResponse: %s", self.id, response)
 
     def actions_to_dicts(self) -> list[dict]:
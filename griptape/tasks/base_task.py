@@ -152,7 +152,7 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
 
     def before_run(self) -> None:
         super().before_run()
-        if self.structure is not None:
+        if self.structure is not None and EventBus.has_listeners(StartTaskEvent):
             EventBus.publish_event(
                 StartTaskEvent(
                     task_id=self.id,
@@ -183,7 +183,7 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
 
     def after_run(self) -> None:
         super().after_run()
-        if self.structure is not None:
+        if self.structure is not None and EventBus.has_listeners(FinishTaskEvent):
             EventBus.publish_event(
                 FinishTaskEvent(
                     task_id=self.id,
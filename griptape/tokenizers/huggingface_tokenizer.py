@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from attrs import Factory, define, field
 
 from griptape.tokenizers import BaseTokenizer
-from griptape.utils import import_optional_dependency
+from griptape.utils import ModelRegistry, import_optional_dependency
 
 if TYPE_CHECKING:
     from transformers import PreTrainedTokenizerBase
@@ -15,7 +15,11 @@ if TYPE_CHECKING:
 class HuggingFaceTokenizer(BaseTokenizer):
     tokenizer: PreTrainedTokenizerBase = field(
         default=Factory(
-            lambda self: import_optional_dependency("transformers").AutoTokenizer.from_pretrained(self.model),
+            lambda self: ModelRegistry.get_model(
+                ("tokenizer", self.model),
+                lambda: import_optional_dependency("transformers").AutoTokenizer.from_pretrained(self.model),
+                owner=self,
+            ),
             takes_self=True,
         ),
         kw_only=True,
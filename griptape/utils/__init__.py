@@ -18,6 +18,9 @@ from .structure_visualizer import StructureVisualizer
 from .reference_utils import references_from_artifacts
 from .file_utils import get_mime_type
 from .contextvars_utils import with_contextvars
+from .client_registry import ClientRegistry
+from .model_registry import ModelRegistry
+from .single_flight import SingleFlight
 
 
 def minify_json(value: str) -> str:
@@ -49,4 +52,7 @@ __all__ = [
     "references_from_artifacts",
     "get_mime_type",
     "with_contextvars",
+    "ClientRegistry",
+    "ModelRegistry",
+    "SingleFlight",
 ]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar
+
+from attrs import define, field
+
+from griptape.mixins.singleton_mixin import SingletonMixin
+
+T = TypeVar("T")
+
+# Names of the parameters that SDK clients take their httpx.Client as.
+HTTP_CLIENT_PARAMETERS = ("http_client", "httpx_client")
+
+
+@define
+class _ClientRegistry(SingletonMixin):
+    """Process-wide registry of provider SDK clients that can be shared across Drivers.
+
+    Drivers request their client through `get_client`. When the registry is enabled, Drivers configured with the same
+    client class and arguments (e.g. base URL and credentials) share one client, and therefore its keep-alive
+    connection pool. When disabled, a new client is created for every Driver.
+
+    Attributes:
+        enabled: Whether Drivers should share clients.
+        max_connections: Maximum number of connections in each shared HTTP connection pool.
+        max_keepalive_connections: Maximum number of idle connections kept alive in each shared HTTP connection pool.
+        keepalive_expiry: Seconds an idle connection is kept alive.
+        timeout: Request timeout in seconds for shared HTTP clients. Defaults to the provider SDK's timeout.
+        max_clients: Maximum number of shared clients. The least recently used client is removed beyond this, and
+            Drivers that already hold it keep using it.
+    """
+
+    enabled: bool = field(default=False, kw_only=True)
+    max_connections: Optional[int] = field(default=100, kw_only=True)
+    max_keepalive_connections: Optional[int] = field(default=20, kw_only=True)
+    keepalive_expiry: Optional[float] = field(default=5.0, kw_only=True)
+    timeout: Optional[float] = field(default=None, kw_only=True)
+    max_clients: int = field(default=64, kw_only=True)
+    _clients: OrderedDict[tuple, Any] = field(factory=OrderedDict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def get_client(self, client_class: Callable[..., T], **kwargs) -> T:
+        """Returns a client created with `client_class(**kwargs)`, shared with other callers if the registry is enabled.
+
+        Clients that accept an `http_client` (or, like Cohere's, an `httpx_client`) are given an `httpx.Client`
+        configured with the registry's pool limits and timeout, unless one is provided in `kwargs`.
+
+        Args:
+            client_class: The SDK client class, or any callable that creates the client.
+            kwargs: Arguments to create the client with. Together with `client_class`, these identify the client by
+                value. Clients created with arguments that can't be compared by value aren't shared.
+
+        Returns:
+            The client.
+        """
+        if not self.enabled:
+            return client_class(**kwargs)
+
+        key = self._client_key(client_class, kwargs)
+        if key is None:
+            return client_class(**kwargs)
+
+        with self._lock:
+            if key in self._clients:
+                self._clients.move_to_end(key)
+            else:
+                http_client_parameter = self._get_http_client_parameter(client_class)
+                if http_client_parameter is not None and http_client_parameter not in kwargs:
+                    kwargs[http_client_parameter] = self._create_http_client()
+
+                self._clients[key] = client_class(**kwargs)
+
+                while len(self._clients) > self.max_clients:
+                    self._clients.popitem(last=False)
+
+            return self._clients[key]
+
+    def clear_clients(self) -> None:
+        """Removes all shared clients. Drivers that already hold a client keep using it."""
+        with self._lock:
+            self._clients = OrderedDict()
+
+    def _client_key(self, client_class: Callable, kwargs: dict) -> Optional[tuple]:
+        try:
+            return (client_class, self._freeze(kwargs))
+        except TypeError:
+            return None
+
+    def _freeze(self, value: Any) -> Any:
+        # Builds a hashable copy that compares by value. The key holds the values, so they can't be garbage collected
+        # and have their ids reused while the client is shared.
+        if isinstance(value, dict):
+            return (dict, tuple(sorted(((key, self._freeze(item)) for key, item in value.items()), key=repr)))
+        elif isinstance(value, (list, tuple)):
+            return (type(value), tuple(self._freeze(item) for item in value))
+        elif isinstance(value, (set, frozenset)):
+            return (frozenset, frozenset(self._freeze(item) for item in value))
+        else:
+            hash(value)
+
+            return value
+
+    def _get_http_client_parameter(self, client_class: Callable) -> Optional[str]:
+        try:
+            parameters = inspect.signature(client_class).parameters
+        except (TypeError, ValueError):
+            return None
+
+        return next((parameter for parameter in HTTP_CLIENT_PARAMETERS if parameter in parameters), None)
+
+    def _create_http_client(self) -> Any:
+        import httpx
+
+        client_kwargs: dict[str, Any] = {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            )
+        }
+        if self.timeout is not None:
+            client_kwargs["timeout"] = self.timeout
+
+        return httpx.Client(**client_kwargs)
+
+
+ClientRegistry = _ClientRegistry()
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from attrs import define, field
+
+from griptape.mixins.singleton_mixin import SingletonMixin
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+T = TypeVar("T")
+
+
+@define
+class _RegisteredModel:
+    model: Any = field()
+    size: int = field()
+    references: int = field(default=0)
+
+
+@define
+class _ModelRegistry(SingletonMixin):
+    """Process-wide registry of locally loaded models, such as Hugging Face pipelines and tokenizers.
+
+    Drivers and Tokenizers request their model through `get_model`. When the registry is enabled, everything that
+    requests the same key shares one loaded copy of the model. A model is referenced by each of its owners until they
+    are garbage collected. Unreferenced models stay loaded for later owners until they are evicted, least recently used
+    first, to keep the registry within `max_memory`. When disabled, the model is loaded for every request.
+
+    Attributes:
+        enabled: Whether loaded models should be shared.
+        max_memory: Memory in bytes that unreferenced models may be evicted to stay within. Models that are still
+            referenced are never evicted. Defaults to no limit.
+    """
+
+    enabled: bool = field(default=False, kw_only=True)
+    max_memory: Optional[int] = field(default=None, kw_only=True)
+    _models: OrderedDict[Hashable, _RegisteredModel] = field(factory=OrderedDict, init=False)
+    _lock: threading.RLock = field(factory=threading.RLock, init=False)
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated memory in bytes used by the loaded models."""
+        with self._lock:
+            return sum(registered_model.size for registered_model in self._models.values())
+
+    def get_model(self, key: Hashable, loader: Callable[[], T], *, owner: Optional[object] = None) -> T:
+        """Returns the model for `key`, loading it with `loader` if it isn't loaded yet.
+
+        Args:
+            key: Identifies the model, e.g. the task and model name. Must include any config that affects loading.
+            loader: Loads the model.
+            owner: An optional object that references the model until it is garbage collected.
+
+        Returns:
+            The model.
+        """
+        if not self.enabled:
+            return loader()
+
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+            else:
+                model = loader()
+                self._models[key] = _RegisteredModel(model=model, size=self._model_size(model))
+
+            registered_model = self._models[key]
+            if owner is not None:
+                registered_model.references += 1
+                weakref.finalize(owner, self._release, key, registered_model)
+
+            self._evict()
+
+            return registered_model.model
+
+    def warm_up(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Loads the model for `key` without referencing it, so that later owners don't have to wait for it to load.
+
+        Args:
+            key: Identifies the model.
+            loader: Loads the model.
+
+        Returns:
+            The model.
+        """
+        return self.get_model(key, loader)
+
+    def clear_models(self) -> None:
+        """Removes all models. Owners that already hold a model keep using it."""
+        with self._lock:
+            self._models = OrderedDict()
+
+    def _release(self, key: Hashable, registered_model: _RegisteredModel) -> None:
+        with self._lock:
+            registered_model.references -= 1
+
+            if self._models.get(key) is registered_model:
+                self._evict()
+
+    def _evict(self) -> None:
+        if self.max_memory is None:
+            return
+
+        for key, registered_model in list(self._models.items()):
+            if self.memory_usage <= self.max_memory:
+                break
+
+            if registered_model.references <= 0:
+                del self._models[key]
+
+    def _model_size(self, model: Any) -> int:
+        # Pipelines wrap a model, and `transformers` models can report their own size.
+        get_memory_footprint = getattr(getattr(model, "model", model), "get_memory_footprint", None)
+        size = get_memory_footprint() if callable(get_memory_footprint) else 0
+
+        return size if isinstance(size, int) else 0
+
+
+ModelRegistry = _ModelRegistry()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+T = TypeVar("T")
+
+
+@define
+class SingleFlight:
+    """Deduplicates identical concurrent calls.
+
+    The first caller for a key runs the call, and callers with the same key that arrive while it is in flight wait for
+    its result instead of making their own call. Results are never kept once the call completes.
+    """
+
+    _calls: dict[Hashable, Future] = field(factory=dict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> tuple[T, bool]:
+        """Runs `func`, unless a call with the same key is already in flight, in which case its result is used.
+
+        Args:
+            key: Identifies the call.
+            func: The call.
+
+        Returns:
+            The result, and whether it was shared from another caller's call. Exceptions are shared too.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_shared = future is not None
+
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+
+        if is_shared:
+            return future.result(), True
+
+        try:
+            result = func()
+        except BaseException as e:
+            self._complete(key)
+            future.set_exception(e)
+
+            raise
+
+        self._complete(key)
+        future.set_result(result)
+
+        return result, False
+
+    def _complete(self, key: Hashable) -> None:
+        # Later callers make a new call rather than reuse a completed one.
+        with self._lock:
+            del self._calls[key]
@@ -0,0 +1,39 @@
+import tracemalloc
+
+from griptape.artifacts import TextArtifact
+from griptape.common import Message, TextMessageContent
+from griptape.drivers.vector import BaseVectorStoreDriver
+from griptape.events import TextChunkEvent
+
+COUNT = 10_000
+
+
+class TestMemoryBenchmark:
+    def measure(self, factory) -> float:
+        tracemalloc.start()
+        try:
+            start_size, _ = tracemalloc.get_traced_memory()
+            objects = [factory(i) for i in range(COUNT)]
+            end_size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(objects) == COUNT
+
+        return (end_size - start_size) / COUNT
+
+    def test_memory(self):
+        sizes = {
+            "artifact": self.measure(lambda i: TextArtifact(str(i))),
+            "message": self.measure(
+                lambda i: Message(content=[TextMessageContent(TextArtifact(str(i)))], role=Message.USER_ROLE)
+            ),
+            "chunk event": self.measure(lambda i: TextChunkEvent(token=str(i), index=0)),
+            "vector entry": self.measure(lambda i: BaseVectorStoreDriver.Entry(id=str(i), vector=[0.0])),
+        }
+
+        print("\n" + ", ".join(f"{size:.0f} bytes per {name}" for name, size in sizes.items()))  # noqa: T201
+
+        # Hot-path objects are slotted, and don't allocate an instance dict.
+        for obj in (TextArtifact("foo"), TextChunkEvent(token="foo", index=0), BaseVectorStoreDriver.Entry(id="foo")):
+            assert not hasattr(obj, "__dict__")
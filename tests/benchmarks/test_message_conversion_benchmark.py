@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from griptape.common import PromptStack
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+
+TURNS = 100
+
+
+class TestMessageConversionBenchmark:
+    @pytest.fixture(autouse=True)
+    def mock_client(self, mocker):
+        return mocker.patch("openai.OpenAI")
+
+    @pytest.fixture()
+    def converter(self, mocker):
+        return mocker.spy(OpenAiChatPromptDriver, "_OpenAiChatPromptDriver__to_openai_message")
+
+    def run_conversation(self, converter, message_cache_size: int) -> tuple[int, float]:
+        driver = OpenAiChatPromptDriver(model="gpt-4o", message_cache_size=message_cache_size)
+        converter.reset_mock()
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("You are a helpful assistant. " * 20)
+
+        start = time.perf_counter()
+        for turn in range(TURNS):
+            prompt_stack.add_user_message(f"User input {turn}. " * 50)
+            driver._base_params(prompt_stack)
+            prompt_stack.add_assistant_message(f"Assistant output {turn}. " * 50)
+        elapsed = time.perf_counter() - start
+
+        return converter.call_count, elapsed
+
+    def test_message_conversion(self, converter):
+        cached_conversions, cached_elapsed = self.run_conversation(converter, message_cache_size=256)
+        uncached_conversions, uncached_elapsed = self.run_conversation(converter, message_cache_size=0)
+
+        print(  # noqa: T201
+            f"\n{TURNS} turns: {cached_conversions} conversions in {cached_elapsed * 1000:.1f}ms with cache, "
+            f"{uncached_conversions} conversions in {uncached_elapsed * 1000:.1f}ms without"
+        )
+
+        # With the cache, each Message is converted once: the system Message, every user Message,
+        # and every assistant Message but the last, which is never sent.
+        assert cached_conversions == 1 + TURNS + (TURNS - 1)
+        assert uncached_conversions == sum(2 + 2 * turn for turn in range(TURNS))
@@ -0,0 +1,38 @@
+import math
+import time
+
+from griptape.artifacts import TextArtifact
+from griptape.common import PromptStack
+from griptape.memory.structure import ConversationMemory, Run
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
+
+RUNS = 1_000
+
+
+class TestPruneBenchmark:
+    def test_prune(self, mocker):
+        memory = ConversationMemory(
+            runs=[Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")) for i in range(RUNS)],
+            autoload=False,
+        )
+        # Fits about a quarter of the Runs.
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=10_000))
+        count_tokens = mocker.spy(MockTokenizer, "count_tokens")
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("You are a helpful assistant.")
+        prompt_stack.add_user_message("foo")
+
+        start = time.perf_counter()
+        memory.add_to_prompt_stack(prompt_driver, prompt_stack, 1)
+        elapsed = time.perf_counter() - start
+
+        fitted_runs = (len(prompt_stack.messages) - 2) // 2
+        print(  # noqa: T201
+            f"\n{RUNS} runs: {fitted_runs} fit after {count_tokens.call_count} token counts in {elapsed * 1000:.1f}ms, "
+            f"where pruning one Run at a time takes {RUNS - fitted_runs + 1} token counts"
+        )
+
+        assert 0 < fitted_runs < RUNS
+        assert count_tokens.call_count <= math.ceil(math.log2(RUNS)) + 1
+        assert prompt_stack.messages[-3].to_text() == f"input {RUNS - 1}"
@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.common import PromptStack
+from griptape.events import StartPromptEvent, TextChunkEvent
+from griptape.memory.structure import ConversationMemory, Run
+from griptape.mixins import serializable_mixin
+from griptape.schemas import BaseSchema, base_schema
+
+ITERATIONS = 200
+
+
+class TestSerializationBenchmark:
+    @pytest.fixture()
+    def generate_schema_cls(self, mocker):
+        return mocker.spy(BaseSchema, "_generate_schema_cls")
+
+    @pytest.fixture()
+    def events(self):
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("You are a helpful assistant.")
+        prompt_stack.add_user_message("Hello!")
+
+        return [TextChunkEvent(token="foo", index=0), StartPromptEvent(model="foo", prompt_stack=prompt_stack)]
+
+    @pytest.fixture()
+    def conversation_memory(self):
+        return ConversationMemory(
+            runs=[Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")) for i in range(10)],
+            autoload=False,
+        )
+
+    def clear_caches(self) -> None:
+        base_schema._schema_classes.clear()
+        base_schema._resolve_types_localns = None
+        serializable_mixin._imported_classes.clear()
+
+    def run_serialization(self, events, conversation_memory, *, cached: bool) -> float:
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            if not cached:
+                self.clear_caches()
+
+            for event in events:
+                type(event).from_dict(event.to_dict())
+            ConversationMemory.from_dict(conversation_memory.to_dict())
+
+        return time.perf_counter() - start
+
+    def test_serialization(self, generate_schema_cls, events, conversation_memory):
+        uncached_elapsed = self.run_serialization(events, conversation_memory, cached=False)
+        uncached_generations = generate_schema_cls.call_count
+        generate_schema_cls.reset_mock()
+        cached_elapsed = self.run_serialization(events, conversation_memory, cached=True)
+        cached_generations = generate_schema_cls.call_count
+
+        print(  # noqa: T201
+            f"\n{ITERATIONS} iterations: {ITERATIONS / cached_elapsed:.0f}/s with schema cache, "
+            f"{ITERATIONS / uncached_elapsed:.0f}/s without"
+        )
+
+        # Schemas are only generated by the first iteration with the cache, and by every iteration without.
+        assert cached_generations == 0
+        assert uncached_generations >= ITERATIONS * len(events)
+
+    def test_fast_serialization(self, events):
+        chunk_event = events[0]
+        schema = BaseSchema.from_attrs_cls(type(chunk_event))
+
+        start = time.perf_counter()
+        for _ in range(ITERATIONS * 10):
+            chunk_event.to_dict()
+        fast_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(ITERATIONS * 10):
+            dict(schema().dump(chunk_event))
+        schema_elapsed = time.perf_counter() - start
+
+        print(  # noqa: T201
+            f"\n{ITERATIONS * 10} Chunk Events: {ITERATIONS * 10 / fast_elapsed:.0f}/s with the fast serializer, "
+            f"{ITERATIONS * 10 / schema_elapsed:.0f}/s with its Schema"
+        )
+
+        assert chunk_event.to_dict() == dict(schema().dump(chunk_event))
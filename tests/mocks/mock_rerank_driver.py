@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from attrs import define, field
+
+from griptape.drivers.rerank import BaseRerankDriver
+
+if TYPE_CHECKING:
+    from griptape.artifacts import TextArtifact
+
+
+@define(kw_only=True)
+class MockRerankDriver(BaseRerankDriver):
+    mock_output: Callable[[str, list[TextArtifact]], list[TextArtifact]] = field(
+        default=lambda query, artifacts: list(reversed(artifacts))
+    )
+
+    def try_run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]:
+        return self.mock_output(query, artifacts)
@@ -66,3 +66,16 @@ class TestBaseArtifact:
         dict_value = {"type": "foo", "value": "foobar"}
         with pytest.raises(ValueError):
             BaseArtifact.from_dict(dict_value)
+
+    def test_meta(self):
+        artifact = TextArtifact("foo", id="foo")
+
+        assert artifact._meta is None
+        assert artifact == TextArtifact("foo", id="foo", meta={})
+        assert artifact.to_dict()["meta"] == {}
+
+        artifact.meta["foo"] = "bar"
+
+        assert artifact.meta == {"foo": "bar"}
+        assert artifact != TextArtifact("foo", id="foo")
+        assert TextArtifact("foo", meta={"foo": "bar"}).meta == {"foo": "bar"}
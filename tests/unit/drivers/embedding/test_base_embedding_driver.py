@@ -1,3 +1,5 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
@@ -41,3 +43,53 @@ class TestBaseEmbeddingDriver:
             driver.embed_string("foobar")
 
         assert e.value.args[0] == "nope"
+
+    def test_embed_string_with_single_flight(self):
+        calls = []
+
+        def mock_output(chunk: str) -> list[float]:
+            calls.append(chunk)
+            time.sleep(0.2)
+
+            return [0, 1]
+
+        driver = MockEmbeddingDriver(mock_output=mock_output, single_flight=True)
+
+        with ThreadPoolExecutor() as executor:
+            embeddings = list(executor.map(driver.embed_string, ["foobar", "foobar", "foobar", "baz"]))
+
+        assert sorted(calls) == ["baz", "foobar"]
+        assert embeddings == [[0, 1]] * 4
+        assert embeddings[0] is not embeddings[1]
+
+    def test_embed_strings(self):
+        batches = []
+
+        def try_embed_chunks(chunks: list[str]) -> list[list[float]]:
+            batches.append(chunks)
+
+            return [[len(chunk)] for chunk in chunks]
+
+        driver = MockEmbeddingDriver(batch_size=2)
+
+        with patch.object(MockEmbeddingDriver, "try_embed_chunks", side_effect=try_embed_chunks):
+            embeddings = driver.embed_strings(["a", "bb", "foobar" * 5000, "ccc", "dddd", "eeeee"])
+
+        assert batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+        assert embeddings == [[1], [2], [0, 1], [3], [4], [5]]
+
+    def test_embed_strings_max_batch_tokens(self):
+        batches = []
+
+        def try_embed_chunks(chunks: list[str]) -> list[list[float]]:
+            batches.append(chunks)
+
+            return [[len(chunk)] for chunk in chunks]
+
+        driver = MockEmbeddingDriver(batch_size=10, max_batch_tokens=6)
+
+        with patch.object(MockEmbeddingDriver, "try_embed_chunks", side_effect=try_embed_chunks):
+            embeddings = driver.embed_strings(["a", "bb", "ccc", "dddd", "eeeeeee", "f"])
+
+        assert batches == [["a", "bb", "ccc"], ["dddd"], ["eeeeeee"], ["f"]]
+        assert embeddings == [[1], [2], [3], [4], [7], [1]]
@@ -26,6 +26,10 @@ class TestOpenAiEmbeddingDriver:
     def test_try_embed_chunk(self):
         assert OpenAiEmbeddingDriver().try_embed_chunk("foobar") == [0, 1, 0]
 
+    def test_try_embed_chunks(self, mock_openai):
+        assert OpenAiEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0]]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
+
     @pytest.mark.parametrize("model", OpenAiTokenizer.EMBEDDING_MODELS)
     def test_try_embed_chunk_replaces_newlines_in_older_ada_models(self, model, mock_openai):
         OpenAiEmbeddingDriver(model=model).try_embed_chunk("foo\nbar")
@@ -18,3 +18,7 @@ class TestVoyageAiEmbeddingDriver:
 
     def test_try_embed_chunk(self):
         assert VoyageAiEmbeddingDriver().try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self, mock_client):
+        assert VoyageAiEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0]]
+        assert mock_client.return_value.embed.call_args.args[0] == ["foo", "bar"]
@@ -3,6 +3,7 @@ import pytest
 from moto import mock_aws
 
 from griptape.drivers.event_listener.amazon_sqs_event_listener_driver import AmazonSqsEventListenerDriver
+from griptape.events import CompactEventEncoder
 from tests.mocks.mock_event import MockEvent
 from tests.utils.aws import mock_aws_credentials
 
@@ -33,3 +34,12 @@ class TestAmazonSqsEventListenerDriver:
 
     def test_try_publish_event_payload_batch(self, driver):
         driver.try_publish_event_payload_batch([MockEvent().to_dict() for _ in range(3)])
+
+    def test_try_publish_event_payload_with_event_encoder(self, driver):
+        driver.event_encoder = CompactEventEncoder(compression="zlib")
+        event_payload = MockEvent().to_dict()
+
+        driver.try_publish_event_payload(event_payload)
+
+        messages = driver.client.receive_message(QueueUrl=driver.queue_url)["Messages"]
+        assert driver.event_encoder.decode(messages[0]["Body"]) == event_payload
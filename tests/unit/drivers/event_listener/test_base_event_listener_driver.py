@@ -1,58 +1,181 @@
-from unittest.mock import ANY, MagicMock
-
+import contextvars
+import gc
+import json
+import threading
+import time
+import weakref
+from unittest.mock import MagicMock, call
+
+from griptape.drivers.event_listener import base_event_listener_driver
 from tests.mocks.mock_event import MockEvent
 from tests.mocks.mock_event_listener_driver import MockEventListenerDriver
 
 
 class TestBaseEventListenerDriver:
     def test_publish_event_no_batched(self):
-        executor = MagicMock()
-        executor.__enter__.return_value = executor
-        driver = MockEventListenerDriver(batched=False, create_futures_executor=lambda: executor)
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=False, on_event_payload_publish=mock_fn)
         mock_event_payload = MockEvent().to_dict()
 
         driver.publish_event(mock_event_payload)
+        driver.flush_events()
 
-        executor.submit.assert_called_once_with(ANY, mock_event_payload)
+        mock_fn.assert_called_once_with(mock_event_payload)
 
     def test_publish_event_yes_batched(self):
-        executor = MagicMock()
-        executor.__enter__.return_value = executor
-        driver = MockEventListenerDriver(batched=True, create_futures_executor=lambda: executor)
-        mock_event_payload = MockEvent().to_dict()
+        mock_fn = MagicMock()
+        published = threading.Event()
+        mock_fn.side_effect = lambda _: published.set()
+        driver = MockEventListenerDriver(batched=True, linger_time=None, on_event_payload_batch_publish=mock_fn)
+        mock_event_payloads = [MockEvent().to_dict() for _ in range(10)]
 
         # Publish 9 events to fill the batch
-        mock_event_payloads = [mock_event_payload for _ in range(0, 9)]
-        for mock_event_payload in mock_event_payloads:
+        for mock_event_payload in mock_event_payloads[:9]:
             driver.publish_event(mock_event_payload)
 
-        assert len(driver._batch) == 9
-        executor.submit.assert_not_called()
+        assert not published.wait(0.1)
+        mock_fn.assert_not_called()
 
         # Publish the 10th event to trigger the batch publish
+        driver.publish_event(mock_event_payloads[9])
+
+        assert published.wait(1)
+        mock_fn.assert_called_once_with(mock_event_payloads)
+        assert driver.batch == []
+
+    def test_publish_event_linger_time(self):
+        mock_fn = MagicMock()
+        published = threading.Event()
+        mock_fn.side_effect = lambda _: published.set()
+        driver = MockEventListenerDriver(batched=True, linger_time=0.1, on_event_payload_batch_publish=mock_fn)
+        mock_event_payload = MockEvent().to_dict()
+
         driver.publish_event(mock_event_payload)
 
-        assert len(driver._batch) == 0
-        executor.submit.assert_called_once_with(ANY, [*mock_event_payloads, mock_event_payload])
+        assert published.wait(1)
+        mock_fn.assert_called_once_with([mock_event_payload])
+
+    def test_publish_event_max_batch_bytes(self):
+        mock_fn = MagicMock()
+        mock_event_payloads = [{"id": str(i)} for i in range(3)]
+        driver = MockEventListenerDriver(
+            batched=True,
+            linger_time=None,
+            max_batch_bytes=len(json.dumps(mock_event_payloads[0]).encode()) * 2,
+            on_event_payload_batch_publish=mock_fn,
+        )
+
+        for mock_event_payload in mock_event_payloads:
+            driver.publish_event(mock_event_payload)
+        driver.flush_events()
+
+        assert mock_fn.call_args_list == [call(mock_event_payloads[:2]), call(mock_event_payloads[2:])]
+
+    def test_publish_event_overflow_drop(self):
+        publishing = threading.Event()
+        unblock = threading.Event()
+        mock_fn = MagicMock(side_effect=lambda _: (publishing.set(), unblock.wait()))
+        driver = MockEventListenerDriver(
+            batched=False, max_queue_size=1, overflow_policy="drop", on_event_payload_publish=mock_fn
+        )
+        mock_event_payloads = [MockEvent().to_dict() for _ in range(3)]
+
+        driver.publish_event(mock_event_payloads[0])
+        publishing.wait(1)
+        driver.publish_event(mock_event_payloads[1])
+        driver.publish_event(mock_event_payloads[2])
+        unblock.set()
+        driver.flush_events()
+
+        assert mock_fn.call_args_list == [call(mock_event_payloads[0]), call(mock_event_payloads[1])]
+
+    def test_publish_event_restarts_publisher_thread(self, mocker):
+        mocker.patch("griptape.drivers.event_listener.base_event_listener_driver.PUBLISHER_IDLE_TIMEOUT", 0.01)
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=False, on_event_payload_publish=mock_fn)
+
+        driver.publish_event(MockEvent().to_dict())
+        driver.flush_events()
+        time.sleep(0.1)
+
+        assert driver._publisher_thread is None
+
+        driver.publish_event(MockEvent().to_dict())
+        driver.flush_events()
+
+        assert mock_fn.call_count == 2
 
     def test_flush_events(self):
-        executor = MagicMock()
-        executor.__enter__.return_value = executor
-        driver = MockEventListenerDriver(batched=True, create_futures_executor=lambda: executor)
-        driver.try_publish_event_payload_batch = MagicMock(side_effect=driver.try_publish_event_payload)
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=True, linger_time=None, on_event_payload_batch_publish=mock_fn)
 
         driver.flush_events()
-        driver.try_publish_event_payload_batch.assert_not_called()
+        mock_fn.assert_not_called()
         assert driver.batch == []
         mock_event_payloads = [MockEvent().to_dict() for _ in range(0, 3)]
         for mock_event_payload in mock_event_payloads:
             driver.publish_event(mock_event_payload)
-        assert len(driver.batch) == 3
 
         driver.flush_events()
-        executor.submit.assert_called_once_with(ANY, mock_event_payloads)
+        mock_fn.assert_called_once_with(mock_event_payloads)
         assert len(driver.batch) == 0
 
+    def test_flush_events_timeout(self):
+        driver = MockEventListenerDriver(
+            batched=True,
+            linger_time=None,
+            flush_timeout=0.05,
+            on_event_payload_batch_publish=lambda _: time.sleep(1),
+        )
+        driver.publish_event(MockEvent().to_dict())
+
+        start = time.perf_counter()
+        driver.flush_events()
+
+        assert time.perf_counter() - start < 0.5
+
+    def test_publish_event_contextvars(self):
+        var = contextvars.ContextVar("var", default=None)
+        values = []
+        driver = MockEventListenerDriver(batched=False, on_event_payload_publish=lambda _: values.append(var.get()))
+        batched_driver = MockEventListenerDriver(
+            batched=True, linger_time=None, on_event_payload_batch_publish=lambda _: values.append(var.get())
+        )
+
+        token = var.set("foo")
+        try:
+            driver.publish_event(MockEvent().to_dict())
+            batched_driver.publish_event(MockEvent().to_dict())
+        finally:
+            var.reset(token)
+        driver.flush_events()
+        batched_driver.flush_events()
+
+        assert values == ["foo", "foo"]
+
+    def test_flush_events_at_exit(self, mocker):
+        mocker.patch("griptape.drivers.event_listener.base_event_listener_driver.PUBLISHER_IDLE_TIMEOUT", 0.01)
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=True, linger_time=None, on_event_payload_batch_publish=mock_fn)
+        driver_refs = []
+        for _ in range(10):
+            temporary_driver = MockEventListenerDriver(batched=True, linger_time=None)
+            temporary_driver.publish_event(MockEvent().to_dict())
+            temporary_driver.flush_events()
+            driver_refs.append(weakref.ref(temporary_driver))
+        del temporary_driver
+        driver.publish_event(MockEvent().to_dict())
+        time.sleep(0.1)
+        gc.collect()
+
+        # Drivers are only registered while they're alive.
+        assert all(driver_ref() is None for driver_ref in driver_refs)
+        assert any(d is driver for d in base_event_listener_driver._drivers_with_publisher_threads.values())
+
+        base_event_listener_driver._flush_events_at_exit()
+
+        mock_fn.assert_called_once()
+
     def test__safe_publish_event_payload(self):
         mock_fn = MagicMock()
         driver = MockEventListenerDriver(
@@ -1,8 +1,9 @@
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 import pytest
 
 from griptape.drivers.event_listener.webhook_event_listener_driver import WebhookEventListenerDriver
+from griptape.events import CompactEventEncoder
 from tests.mocks.mock_event import MockEvent
 
 
@@ -36,3 +37,19 @@ class TestWebhookEventListenerDriver:
             mock_post.assert_called_with(
                 url="foo bar", json=event.to_dict(), headers={"Authorization": "Bearer foo bar"}
             )
+
+    def test_try_publish_event_payload_batch_with_event_encoder(self, mock_post):
+        event_encoder = CompactEventEncoder(compression="gzip")
+        driver = WebhookEventListenerDriver(
+            webhook_url="foo bar", headers={"Authorization": "Bearer foo bar"}, event_encoder=event_encoder
+        )
+        event_payloads = [MockEvent().to_dict() for _ in range(3)]
+
+        driver.try_publish_event_payload_batch(event_payloads)
+
+        mock_post.assert_called_once_with(
+            url="foo bar",
+            data=ANY,
+            headers={"Content-Type": "application/octet-stream", "Authorization": "Bearer foo bar"},
+        )
+        assert event_encoder.decode(mock_post.call_args.kwargs["data"]) == event_payloads
@@ -1,9 +1,12 @@
+import json
+
 import boto3
 import pytest
 from moto import mock_aws
 
+from griptape.artifacts import TextArtifact
 from griptape.drivers.memory.conversation.amazon_dynamodb import AmazonDynamoDbConversationMemoryDriver
-from griptape.memory.structure import ConversationMemory
+from griptape.memory.structure import ConversationMemory, Run
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
 from tests.utils.aws import mock_aws_credentials
@@ -149,3 +152,117 @@ class TestDynamoDbConversationMemoryDriver:
 
         assert len(runs) == 2
         assert metadata == {"foo": "bar"}
+
+    def test_append(self):
+        session = boto3.Session(region_name=self.AWS_REGION)
+        table = session.resource("dynamodb").Table(self.DYNAMODB_COMPOSITE_TABLE_NAME)
+        memory_driver = AmazonDynamoDbConversationMemoryDriver(
+            session=session,
+            table_name=self.DYNAMODB_COMPOSITE_TABLE_NAME,
+            partition_key=self.DYNAMODB_PARTITION_KEY,
+            value_attribute_key=self.VALUE_ATTRIBUTE_KEY,
+            partition_key_value=self.PARTITION_KEY_VALUE,
+            sort_key=self.DYNAMODB_SORT_KEY,
+            sort_key_value=self.SORT_KEY_VALUE,
+        )
+        memory = ConversationMemory(conversation_memory_driver=memory_driver, max_runs=2, meta={"foo": "bar"})
+
+        for i in range(4):
+            memory.add_run(Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")))
+
+        # Each Run has an item of its own, and Runs beyond `max_runs` are deleted.
+        assert "Item" not in table.get_item(Key={"entryId": "bar#1", "sortKey": "baz"})
+        assert "Item" in table.get_item(Key={"entryId": "bar#3", "sortKey": "baz"})
+
+        runs, metadata = memory_driver.load()
+
+        assert [run.input.value for run in runs] == ["input 2", "input 3"]
+        assert metadata == {"foo": "bar"}
+
+    def test_store_fewer_runs(self):
+        session = boto3.Session(region_name=self.AWS_REGION)
+        table = session.resource("dynamodb").Table(self.DYNAMODB_TABLE_NAME)
+        memory_driver = AmazonDynamoDbConversationMemoryDriver(
+            session=session,
+            table_name=self.DYNAMODB_TABLE_NAME,
+            partition_key=self.DYNAMODB_PARTITION_KEY,
+            value_attribute_key=self.VALUE_ATTRIBUTE_KEY,
+            partition_key_value=self.PARTITION_KEY_VALUE,
+        )
+        runs = [Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")) for i in range(4)]
+        memory_driver.store(runs, {})
+
+        memory_driver.store(runs[:1], {})
+
+        # The items of the Runs beyond the new conversation are deleted.
+        assert "Item" in table.get_item(Key={"entryId": "bar#0"})
+        assert all("Item" not in table.get_item(Key={"entryId": f"bar#{i}"}) for i in range(1, 4))
+        assert [run.input.value for run in memory_driver.load_last_runs(3)[0]] == ["input 0"]
+
+    def test_load_last_runs(self):
+        memory_driver = AmazonDynamoDbConversationMemoryDriver(
+            session=boto3.Session(region_name=self.AWS_REGION),
+            table_name=self.DYNAMODB_TABLE_NAME,
+            partition_key=self.DYNAMODB_PARTITION_KEY,
+            value_attribute_key=self.VALUE_ATTRIBUTE_KEY,
+            partition_key_value=self.PARTITION_KEY_VALUE,
+        )
+        memory = ConversationMemory(conversation_memory_driver=memory_driver, max_runs=4)
+
+        for i in range(6):
+            memory.add_run(Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")))
+
+        assert [run.input.value for run in memory_driver.load_last_runs(2)[0]] == ["input 4", "input 5"]
+        assert [run.input.value for run in memory_driver.load_last_runs(2, offset=1)[0]] == ["input 3", "input 4"]
+        # Runs beyond `max_runs` were deleted.
+        assert [run.input.value for run in memory_driver.load_last_runs(3, offset=2)[0]] == ["input 2", "input 3"]
+        assert memory_driver.load_last_runs(2, offset=4)[0] == []
+
+    def test_load_with_table(self):
+        # The Session's region has no table, so Runs can only be loaded with the table's client.
+        table = boto3.Session(region_name=self.AWS_REGION).resource("dynamodb").Table(self.DYNAMODB_TABLE_NAME)
+        memory_driver = AmazonDynamoDbConversationMemoryDriver(
+            session=boto3.Session(region_name="us-east-1"),
+            table=table,
+            table_name=self.DYNAMODB_TABLE_NAME,
+            partition_key=self.DYNAMODB_PARTITION_KEY,
+            value_attribute_key=self.VALUE_ATTRIBUTE_KEY,
+            partition_key_value=self.PARTITION_KEY_VALUE,
+        )
+        runs = [Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")) for i in range(3)]
+        memory_driver.store(runs, {"foo": "bar"})
+
+        loaded_runs, metadata = memory_driver.load()
+
+        assert [run.input.value for run in loaded_runs] == ["input 0", "input 1", "input 2"]
+        assert metadata == {"foo": "bar"}
+        assert [run.input.value for run in memory_driver.load_last_runs(1)[0]] == ["input 2"]
+
+    def test_load_legacy(self):
+        session = boto3.Session(region_name=self.AWS_REGION)
+        table = session.resource("dynamodb").Table(self.DYNAMODB_TABLE_NAME)
+        table.put_item(
+            Item={
+                self.DYNAMODB_PARTITION_KEY: self.PARTITION_KEY_VALUE,
+                self.VALUE_ATTRIBUTE_KEY: json.dumps(
+                    {
+                        "runs": [Run(input=TextArtifact("foo"), output=TextArtifact("bar")).to_dict()],
+                        "metadata": {"foo": "bar"},
+                    }
+                ),
+            }
+        )
+        memory_driver = AmazonDynamoDbConversationMemoryDriver(
+            session=session,
+            table_name=self.DYNAMODB_TABLE_NAME,
+            partition_key=self.DYNAMODB_PARTITION_KEY,
+            value_attribute_key=self.VALUE_ATTRIBUTE_KEY,
+            partition_key_value=self.PARTITION_KEY_VALUE,
+        )
+
+        runs, metadata = memory_driver.load()
+
+        assert len(runs) == 1
+        assert metadata == {"foo": "bar"}
+        assert "Item" in table.get_item(Key={"entryId": "bar#0"})
+        assert len(memory_driver.load()[0]) == 1
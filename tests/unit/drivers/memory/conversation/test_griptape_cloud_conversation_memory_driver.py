@@ -113,6 +113,24 @@ class TestGriptapeCloudConversationMemoryDriver:
         ]
         assert driver.store(runs, {}) is None
 
+    def test_append(self, driver, mocker):
+        load = mocker.spy(GriptapeCloudConversationMemoryDriver, "load")
+        store = mocker.spy(GriptapeCloudConversationMemoryDriver, "store")
+        runs = [
+            Run(input=BaseArtifact.from_dict(run["input"]), output=BaseArtifact.from_dict(run["output"]))
+            for run in json.loads(TEST_CONVERSATION)["runs"]
+        ]
+
+        driver.append(runs, {}, all_runs=True)
+
+        assert load.call_count == 0
+        assert store.call_args.args[1] == runs
+
+        driver.append(runs, {})
+
+        assert load.call_count == 1
+        assert len(store.call_args.args[1]) == 2
+
     def test_load(self, driver):
         runs, metadata = driver.load()
         assert len(runs) == 1
@@ -1,11 +1,13 @@
 import contextlib
+import json
 import os
 from pathlib import Path
 
 import pytest
 
+from griptape.artifacts import TextArtifact
 from griptape.drivers.memory.conversation.local import LocalConversationMemoryDriver
-from griptape.memory.structure import ConversationMemory
+from griptape.memory.structure import ConversationMemory, Run
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
 
@@ -79,6 +81,49 @@ class TestLocalConversationMemoryDriver:
         assert autoloaded_memory.runs[0].input.value == "test"
         assert autoloaded_memory.runs[0].output.value == "mock output"
 
+    def test_append(self):
+        memory_driver = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH)
+        memory = ConversationMemory(conversation_memory_driver=memory_driver, meta={"foo": "bar"})
+
+        for i in range(3):
+            memory.add_run(Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")))
+
+        lines = Path(self.MEMORY_FILE_PATH).read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[1])["run"]["input"]["value"] == "input 1"
+
+        runs, metadata = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH).load()
+        assert [run.input.value for run in runs] == ["input 0", "input 1", "input 2"]
+        assert metadata == {"foo": "bar"}
+
+    def test_append_max_runs(self):
+        memory_driver = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH)
+        memory = ConversationMemory(conversation_memory_driver=memory_driver, max_runs=2)
+
+        for i in range(4):
+            memory.add_run(Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")))
+
+            runs, _ = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH).load()
+            assert [run.input.value for run in runs] == [run.input.value for run in memory.runs]
+
+        # The file was rewritten with only the kept Runs once `max_runs` Runs were appended.
+        assert len(Path(self.MEMORY_FILE_PATH).read_text().splitlines()) == 1
+
+    def test_load_legacy(self):
+        Path(self.MEMORY_FILE_PATH).write_text(
+            json.dumps(
+                {
+                    "runs": [Run(input=TextArtifact("foo"), output=TextArtifact("bar")).to_dict()],
+                    "metadata": {"foo": "bar"},
+                }
+            )
+        )
+
+        runs, metadata = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH).load()
+
+        assert len(runs) == 1
+        assert metadata == {"foo": "bar"}
+
     def __delete_file(self, persist_file) -> None:
         with contextlib.suppress(FileNotFoundError):
             os.remove(persist_file)
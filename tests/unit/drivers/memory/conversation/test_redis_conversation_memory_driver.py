@@ -4,7 +4,9 @@ import redis
 from griptape.drivers.memory.conversation.redis_conversation_memory_driver import RedisConversationMemoryDriver
 from griptape.memory.structure.base_conversation_memory import BaseConversationMemory
 
-TEST_DATA = '{"runs": [{"input": {"type": "TextArtifact", "value": "Hi There, Hello"}, "output": {"type": "TextArtifact", "value": "Hello! How can I assist you today?"}}], "metadata": {"foo": "bar"}}'
+TEST_DATA = '{"runs": [], "metadata": {"foo": "bar"}}'
+TEST_LEGACY_DATA = '{"runs": [{"input": {"type": "TextArtifact", "value": "Hi There, Hello"}, "output": {"type": "TextArtifact", "value": "Hello! How can I assist you today?"}}], "metadata": {"foo": "bar"}}'
+TEST_RUN = '{"type": "Run", "input": {"type": "TextArtifact", "value": "Hi There, Hello"}, "output": {"type": "TextArtifact", "value": "Hello! How can I assist you today?"}}'
 TEST_MEMORY = '{"type": "ConversationMemory", "runs": [{"type": "Run", "id": "729ca6be5d79433d9762eb06dfd677e2", "input": {"type": "TextArtifact", "id": "1234", "value": "Hi There, Hello"}, "output": {"type": "TextArtifact", "id": "123", "value": "Hello! How can I assist you today?"}}], "max_runs": 2}'
 CONVERSATION_ID = "117151897f344ff684b553d0655d8f39"
 INDEX = "griptape_conversation"
@@ -19,6 +21,8 @@ class TestRedisConversationMemoryDriver:
         mocker.patch.object(redis.StrictRedis, "hset", return_value=None)
         mocker.patch.object(redis.StrictRedis, "keys", return_value=[b"test"])
         mocker.patch.object(redis.StrictRedis, "hget", return_value=TEST_DATA)
+        mocker.patch.object(redis.StrictRedis, "lrange", return_value=[TEST_RUN])
+        mocker.patch.object(redis.StrictRedis, "pipeline", return_value=mocker.MagicMock())
 
         fake_redisearch = mocker.MagicMock()
         fake_redisearch.search = mocker.MagicMock(return_value=mocker.MagicMock(docs=[]))
@@ -35,11 +39,41 @@ class TestRedisConversationMemoryDriver:
         memory = BaseConversationMemory.from_json(TEST_MEMORY)
         assert driver.store(memory.runs, memory.meta) is None
 
+        pipeline = driver.client.pipeline()
+        pipeline.delete.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs")
+        pipeline.rpush.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs", memory.runs[0].to_json())
+        pipeline.execute.assert_called_once()
+
+    def test_append(self, driver):
+        memory = BaseConversationMemory.from_json(TEST_MEMORY)
+        driver.append(memory.runs, memory.meta, max_runs=2)
+
+        pipeline = driver.client.pipeline()
+        pipeline.rpush.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs", memory.runs[-1].to_json())
+        pipeline.ltrim.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs", -2, -1)
+        pipeline.delete.assert_not_called()
+
     def test_load(self, driver):
         runs, metadata = driver.load()
         assert len(runs) == 1
+        assert runs[0].input.value == "Hi There, Hello"
         assert metadata == {"foo": "bar"}
 
+    def test_load_last_runs(self, driver):
+        runs, metadata = driver.load_last_runs(2, offset=3)
+
+        driver.client.lrange.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs", -5, -4)
+        assert len(runs) == 1
+        assert metadata == {"foo": "bar"}
+
+    def test_load_legacy(self, mocker, driver):
+        mocker.patch.object(redis.StrictRedis, "hget", return_value=TEST_LEGACY_DATA)
+        runs, metadata = driver.load()
+        assert len(runs) == 1
+        assert metadata == {"foo": "bar"}
+
+        driver.client.pipeline().rpush.assert_called_once()
+
     def test_load_empty(self, mocker, driver):
         mocker.patch.object(redis.StrictRedis, "hget", return_value=None)
         runs, metadata = driver.load()
@@ -0,0 +1,105 @@
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers.memory.conversation.sqlite import SqliteConversationMemoryDriver
+from griptape.memory.structure import ConversationMemory, Run
+from griptape.structures import Pipeline
+from griptape.tasks import PromptTask
+
+
+class TestSqliteConversationMemoryDriver:
+    @pytest.fixture()
+    def database(self, tmp_path):
+        return str(tmp_path / "memory.db")
+
+    @pytest.fixture()
+    def driver(self, database):
+        return SqliteConversationMemoryDriver(database=database, conversation_id="foo")
+
+    def test_store(self, driver, database):
+        memory = ConversationMemory(conversation_memory_driver=driver, autoload=False)
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+        pipeline.run()
+
+        with sqlite3.connect(database) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            assert connection.execute("SELECT COUNT(*) FROM conversation_runs").fetchone() == (1,)
+
+    def test_load(self, driver):
+        memory = ConversationMemory(conversation_memory_driver=driver, autoload=False, meta={"foo": "bar"})
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+        pipeline.run()
+        pipeline.run()
+
+        runs, metadata = driver.load()
+
+        assert len(runs) == 2
+        assert runs[0].input.value == "test"
+        assert runs[0].output.value == "mock output"
+        assert metadata == {"foo": "bar"}
+
+    def test_load_missing_conversation(self, driver):
+        assert driver.load() == ([], {})
+        assert driver.load_last_runs(2) == ([], {})
+
+    def test_append(self, driver):
+        runs = [Run(input=TextArtifact(str(i)), output=TextArtifact(str(i))) for i in range(5)]
+
+        driver.store(runs[:2], {})
+        for i in range(2, 5):
+            driver.append(runs[: i + 1], {"count": i + 1}, max_runs=3)
+
+        loaded_runs, metadata = driver.load()
+
+        assert [run.input.value for run in loaded_runs] == ["2", "3", "4"]
+        assert metadata == {"count": 5}
+
+    def test_load_last_runs(self, driver):
+        driver.store([Run(input=TextArtifact(str(i)), output=TextArtifact(str(i))) for i in range(5)], {})
+
+        assert [run.input.value for run in driver.load_last_runs(2)[0]] == ["3", "4"]
+        assert [run.input.value for run in driver.load_last_runs(2, offset=2)[0]] == ["1", "2"]
+        assert driver.load_last_runs(0)[0] == []
+
+    def test_conversations(self, database):
+        driver = SqliteConversationMemoryDriver(database=database, conversation_id="foo")
+        other_driver = SqliteConversationMemoryDriver(database=database, conversation_id="bar")
+
+        driver.store([Run(input=TextArtifact("foo"), output=TextArtifact("foo"))], {})
+        other_driver.store([], {})
+
+        assert len(driver.load()[0]) == 1
+        assert len(other_driver.load()[0]) == 0
+
+    def test_concurrent_append(self, database):
+        def append(i: int) -> None:
+            driver = SqliteConversationMemoryDriver(database=database, conversation_id="foo")
+            for j in range(10):
+                driver.append([Run(input=TextArtifact(f"{i}-{j}"), output=TextArtifact("foo"))], {})
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(append, range(4)))
+
+        runs, _ = SqliteConversationMemoryDriver(database=database, conversation_id="foo").load()
+
+        assert len(runs) == 40
+
+    def test_autoload(self, driver):
+        memory = ConversationMemory(conversation_memory_driver=driver, autoload=False)
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+        pipeline.run()
+        pipeline.run()
+
+        autoloaded_memory = ConversationMemory(conversation_memory_driver=driver)
+
+        assert len(autoloaded_memory.runs) == 2
+        assert autoloaded_memory.runs[0].input.value == "test"
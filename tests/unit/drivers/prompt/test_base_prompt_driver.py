@@ -1,11 +1,20 @@
 import json
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from griptape.artifacts import ActionArtifact, ErrorArtifact, TextArtifact
-from griptape.common import Message, PromptStack
-from griptape.events import FinishPromptEvent, StartPromptEvent
+from griptape.artifacts import ActionArtifact, ErrorArtifact, ImageArtifact, TextArtifact
+from griptape.common import ActionCallMessageContent, ImageMessageContent, Message, PromptStack, ToolAction
+from griptape.events import (
+    ActionChunkEvent,
+    ChunkEventCoalescer,
+    EventBus,
+    EventListener,
+    FinishPromptEvent,
+    StartPromptEvent,
+)
 from griptape.events.event_bus import _EventBus
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
@@ -32,14 +41,14 @@ class TestBasePromptDriver:
 
         assert isinstance(pipeline.run().output_task.output, ErrorArtifact)
 
-    def test_run_via_pipeline_publishes_events(self, mocker):
-        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+    def test_run_via_pipeline_publishes_events(self):
+        events = []
+        EventBus.add_event_listener(EventListener(on_event=events.append))
         pipeline = Pipeline()
         pipeline.add_task(PromptTask("test"))
 
         pipeline.run()
 
-        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
         assert len([instance for instance in events if isinstance(instance, StartPromptEvent)]) == 1
         assert len([instance for instance in events if isinstance(instance, FinishPromptEvent)]) == 1
 
@@ -72,6 +81,161 @@ class TestBasePromptDriver:
         assert isinstance(output, TextArtifact)
         assert output.value == "mock output"
 
+    def test_run_with_stream_and_chunk_event_coalescer(self):
+        events = []
+        EventBus.add_event_listener(EventListener(on_event=events.append))
+        prompt_driver = MockPromptDriver(
+            stream=True, use_native_tools=True, chunk_event_coalescer=ChunkEventCoalescer(max_delay=None)
+        )
+
+        result = prompt_driver.run(PromptStack(messages=[], tools=[MockTool()]))
+
+        chunk_events = [event for event in events if isinstance(event, ActionChunkEvent)]
+        assert len(chunk_events) == 1
+        assert chunk_events[0].name == "MockTool"
+        assert chunk_events[0].partial_input == '{ "values": { "test": "test-value" } }'
+        assert isinstance(result.to_artifact(), ActionArtifact)
+
+    def test_run_with_stream_without_event_listeners(self, mocker):
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+        prompt_driver = MockPromptDriver(stream=True, use_native_tools=True)
+
+        result = prompt_driver.run(PromptStack(messages=[], tools=[MockTool()]))
+
+        mock_publish_event.assert_not_called()
+        assert isinstance(result.to_artifact(), ActionArtifact)
+
+    def test_convert_message(self, mocker):
+        prompt_driver = MockPromptDriver()
+        converter = mocker.Mock(side_effect=lambda message: {"content": message.to_text()})
+
+        first = prompt_driver._convert_message(Message("foo", role=Message.USER_ROLE), converter)
+        second = prompt_driver._convert_message(Message("foo", role=Message.USER_ROLE), converter)
+        prompt_driver._convert_message(Message("foo", role=Message.ASSISTANT_ROLE), converter)
+        prompt_driver._convert_message(Message("bar", role=Message.USER_ROLE), converter)
+
+        assert first is second
+        assert converter.call_count == 3
+
+    def test_convert_message_uncacheable(self, mocker):
+        prompt_driver = MockPromptDriver()
+        converter = mocker.Mock(return_value={})
+        message = Message(
+            content=[ActionCallMessageContent(ActionArtifact(ToolAction(tag="foo", name="bar", input={})))],
+            role=Message.ASSISTANT_ROLE,
+        )
+
+        prompt_driver._convert_message(message, converter)
+        prompt_driver._convert_message(message, converter)
+
+        assert converter.call_count == 2
+
+    def test_convert_message_cache_size(self, mocker):
+        prompt_driver = MockPromptDriver(message_cache_size=1)
+        converter = mocker.Mock(return_value={})
+
+        prompt_driver._convert_message(Message("foo", role=Message.USER_ROLE), converter)
+        prompt_driver._convert_message(Message("bar", role=Message.USER_ROLE), converter)
+        prompt_driver._convert_message(Message("foo", role=Message.USER_ROLE), converter)
+
+        assert converter.call_count == 3
+
+        prompt_driver = MockPromptDriver(message_cache_size=0)
+        prompt_driver._convert_message(Message("foo", role=Message.USER_ROLE), converter)
+        prompt_driver._convert_message(Message("foo", role=Message.USER_ROLE), converter)
+
+        assert converter.call_count == 5
+
+    def test_request_hash(self):
+        prompt_driver = MockPromptDriver()
+        request_hash = prompt_driver.request_hash(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        assert request_hash == prompt_driver.request_hash(
+            PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+        )
+        assert request_hash != prompt_driver.request_hash(
+            PromptStack(messages=[Message("bar", role=Message.USER_ROLE)])
+        )
+        assert request_hash != prompt_driver.request_hash(
+            PromptStack(messages=[Message("foo", role=Message.ASSISTANT_ROLE)])
+        )
+        assert request_hash != prompt_driver.request_hash(
+            PromptStack(messages=[Message("foo", role=Message.USER_ROLE)], tools=[MockTool()])
+        )
+
+    def test_request_hash_with_images(self):
+        prompt_driver = MockPromptDriver()
+
+        def image_request_hash(value: bytes, image_format: str = "png") -> str:
+            return prompt_driver.request_hash(
+                PromptStack(
+                    messages=[
+                        Message(
+                            [ImageMessageContent(ImageArtifact(value, format=image_format, width=1, height=1))],
+                            role=Message.USER_ROLE,
+                        )
+                    ]
+                )
+            )
+
+        assert image_request_hash(b"foo") == image_request_hash(b"foo")
+        assert image_request_hash(b"foo") != image_request_hash(b"bar")
+        assert image_request_hash(b"foo") != image_request_hash(b"foo", "jpeg")
+
+    def test_run_with_single_flight_images(self):
+        def mock_output(prompt_stack: PromptStack) -> str:
+            time.sleep(0.2)
+
+            return prompt_stack.messages[0].content[0].artifact.value.decode()
+
+        prompt_driver = MockPromptDriver(mock_output=mock_output, single_flight=True)
+
+        with ThreadPoolExecutor() as executor:
+            results = list(
+                executor.map(
+                    lambda value: prompt_driver.run(
+                        PromptStack(
+                            messages=[
+                                Message(
+                                    [ImageMessageContent(ImageArtifact(value, format="png", width=1, height=1))],
+                                    role=Message.USER_ROLE,
+                                )
+                            ]
+                        )
+                    ),
+                    [b"foo", b"bar"],
+                )
+            )
+
+        assert [result.to_text() for result in results] == ["foo", "bar"]
+
+    def test_run_with_single_flight(self):
+        calls = []
+
+        def mock_output(_: PromptStack) -> str:
+            calls.append(None)
+            time.sleep(0.2)
+
+            return "mock output"
+
+        prompt_driver = MockPromptDriver(mock_output=mock_output, single_flight=True)
+
+        with ThreadPoolExecutor() as executor:
+            results = list(
+                executor.map(
+                    lambda _: prompt_driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])),
+                    range(3),
+                )
+            )
+
+        assert len(calls) == 1
+        assert [result.value for result in results] == ["mock output"] * 3
+        assert results[0] is not results[1]
+
+        prompt_driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        assert len(calls) == 2
+
     def test_native_structured_output_strategy(self):
         from schema import Schema
 
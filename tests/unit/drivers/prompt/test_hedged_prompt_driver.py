@@ -0,0 +1,125 @@
+import time
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.common import Message, PromptStack
+from griptape.drivers.prompt.hedged import HedgedPromptDriver
+from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def slow_output(output: str, delay: float):
+    def mock_output(_: PromptStack) -> str:
+        time.sleep(delay)
+
+        return output
+
+    return mock_output
+
+
+class TestHedgedPromptDriver:
+    @pytest.fixture()
+    def prompt_stack(self):
+        return PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+
+    def test_init(self):
+        prompt_driver = HedgedPromptDriver(prompt_drivers=[MockPromptDriver()])
+
+        assert prompt_driver.model == "test-model"
+        assert prompt_driver.tokenizer is prompt_driver.prompt_drivers[0].tokenizer
+
+    def test_init_with_invalid_hedge_percentile(self):
+        with pytest.raises(ValueError):
+            HedgedPromptDriver(prompt_drivers=[MockPromptDriver()], hedge_percentile=101)
+
+    def test_try_run_primary(self, prompt_stack):
+        prompt_driver = HedgedPromptDriver(prompt_drivers=[MockPromptDriver(mock_output="primary"), MockPromptDriver()])
+
+        assert prompt_driver.try_run(prompt_stack).value == "primary"
+
+    def test_try_run_hedges_slow_primary(self, prompt_stack):
+        prompt_driver = HedgedPromptDriver(
+            prompt_drivers=[
+                MockPromptDriver(mock_output=slow_output("primary", 1)),
+                MockPromptDriver(mock_output="secondary"),
+            ],
+            hedge_delay=0.01,
+        )
+
+        assert prompt_driver.try_run(prompt_stack).value == "secondary"
+
+    def test_try_run_without_hedging(self, prompt_stack):
+        prompt_driver = HedgedPromptDriver(
+            prompt_drivers=[
+                MockPromptDriver(mock_output=slow_output("primary", 0.1)),
+                MockPromptDriver(mock_output="secondary"),
+            ],
+            hedge_percentile=None,
+        )
+
+        assert prompt_driver.current_hedge_delay is None
+        assert prompt_driver.try_run(prompt_stack).value == "primary"
+
+    def test_try_run_falls_back(self, prompt_stack):
+        prompt_driver = HedgedPromptDriver(
+            prompt_drivers=[MockFailingPromptDriver(max_failures=1), MockPromptDriver(mock_output="secondary")]
+        )
+
+        assert prompt_driver.try_run(prompt_stack).value == "secondary"
+
+    def test_try_run_all_fail(self, prompt_stack):
+        prompt_driver = HedgedPromptDriver(
+            prompt_drivers=[MockFailingPromptDriver(max_failures=1), MockFailingPromptDriver(max_failures=1)]
+        )
+
+        with pytest.raises(Exception, match="failed attempt"):
+            prompt_driver.try_run(prompt_stack)
+
+    def test_try_run_ignores_non_fallback_exceptions(self, prompt_stack):
+        prompt_driver = HedgedPromptDriver(
+            prompt_drivers=[MockFailingPromptDriver(max_failures=1), MockPromptDriver()],
+            fallback_exception_types=(ValueError,),
+        )
+
+        with pytest.raises(Exception, match="failed attempt"):
+            prompt_driver.try_run(prompt_stack)
+
+    def test_current_hedge_delay(self):
+        prompt_driver = HedgedPromptDriver(
+            prompt_drivers=[MockPromptDriver()], hedge_delay=5, hedge_percentile=50, min_latency_samples=4
+        )
+
+        assert prompt_driver.current_hedge_delay == 5
+
+        prompt_driver._latencies.extend([4.0, 1.0, 3.0, 2.0])
+
+        assert prompt_driver.current_hedge_delay == 3.0
+
+    def test_try_run_records_primary_latency(self, prompt_stack):
+        prompt_driver = HedgedPromptDriver(prompt_drivers=[MockPromptDriver(), MockPromptDriver()])
+
+        prompt_driver.try_run(prompt_stack)
+
+        assert len(prompt_driver._latencies) == 1
+
+    def test_try_stream_falls_back(self, prompt_stack):
+        prompt_driver = HedgedPromptDriver(
+            prompt_drivers=[MockFailingPromptDriver(max_failures=1), MockPromptDriver(mock_output="secondary")],
+            stream=True,
+        )
+
+        assert prompt_driver.run(prompt_stack).value == "secondary"
+
+    def test_try_stream_all_fail(self, prompt_stack):
+        prompt_driver = HedgedPromptDriver(
+            prompt_drivers=[MockFailingPromptDriver(max_failures=1), MockFailingPromptDriver(max_failures=1)]
+        )
+
+        with pytest.raises(Exception, match="failed attempt"):
+            list(prompt_driver.try_stream(prompt_stack))
+
+    def test_run(self):
+        prompt_driver = HedgedPromptDriver(prompt_drivers=[MockPromptDriver()])
+
+        assert prompt_driver.run(TextArtifact("foo")).value == "mock output"
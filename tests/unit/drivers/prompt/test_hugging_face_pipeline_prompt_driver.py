@@ -2,6 +2,7 @@ import pytest
 
 from griptape.common import PromptStack
 from griptape.drivers.prompt.huggingface_pipeline import HuggingFacePipelinePromptDriver
+from griptape.utils import ModelRegistry
 
 
 class TestHuggingFacePipelinePromptDriver:
@@ -117,3 +118,22 @@ class TestHuggingFacePipelinePromptDriver:
             ValueError, match="HuggingFacePipelinePromptDriver does not support `native` structured output strategy."
         ):
             HuggingFacePipelinePromptDriver(model="foo", structured_output_strategy="native")
+
+    def test_model_registry(self, mock_pipeline, mock_autotokenizer):
+        import transformers
+
+        ModelRegistry.enabled = True
+
+        try:
+            driver = HuggingFacePipelinePromptDriver(model="foo", max_tokens=42)
+            other_driver = HuggingFacePipelinePromptDriver(model="foo", max_tokens=24)
+
+            assert driver.tokenizer.tokenizer is other_driver.tokenizer.tokenizer is mock_autotokenizer
+            assert driver.pipeline is other_driver.pipeline is mock_pipeline
+            transformers.AutoTokenizer.from_pretrained.assert_called_once_with("foo")
+            transformers.pipeline.assert_called_once_with(
+                task="text-generation", model="foo", tokenizer=mock_autotokenizer
+            )
+        finally:
+            ModelRegistry.enabled = False
+            ModelRegistry.clear_models()
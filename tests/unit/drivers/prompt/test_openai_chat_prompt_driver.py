@@ -606,3 +606,25 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
             max_tokens=1,
         )
         assert event.value[0].value == "model-output"
+
+    def test_try_run_reuses_converted_messages(self, mock_chat_completion_create):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("system-input")
+        prompt_stack.add_user_message("user-input")
+
+        driver.try_run(prompt_stack)
+        first_messages = mock_chat_completion_create.call_args.kwargs["messages"]
+        prompt_stack.add_assistant_message("assistant-output")
+        prompt_stack.add_user_message("user-input-2")
+        driver.try_run(prompt_stack)
+        second_messages = mock_chat_completion_create.call_args.kwargs["messages"]
+
+        assert second_messages == [
+            {"role": "system", "content": "system-input"},
+            {"role": "user", "content": "user-input"},
+            {"role": "assistant", "content": "assistant-output"},
+            {"role": "user", "content": "user-input-2"},
+        ]
+        assert first_messages[0] is second_messages[0]
+        assert first_messages[1] is second_messages[1]
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.common import Message, PromptStack
+from griptape.drivers.prompt.cassette import RecordingPromptDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+class TestRecordingPromptDriver:
+    @pytest.fixture()
+    def cassette_file(self, tmp_path):
+        return str(tmp_path / "cassette.jsonl")
+
+    @pytest.fixture()
+    def prompt_stack(self):
+        return PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+
+    def read_cassette(self, cassette_file: str) -> list[dict]:
+        with open(cassette_file) as file:
+            return [json.loads(line) for line in file]
+
+    def test_init(self, cassette_file):
+        prompt_driver = RecordingPromptDriver(
+            prompt_driver=MockPromptDriver(stream=True, use_native_tools=True), cassette_file=cassette_file
+        )
+
+        assert prompt_driver.model == "test-model"
+        assert prompt_driver.tokenizer is prompt_driver.prompt_driver.tokenizer
+        assert prompt_driver.stream is True
+        assert prompt_driver.use_native_tools is True
+
+    def test_try_run(self, cassette_file, prompt_stack):
+        prompt_driver = RecordingPromptDriver(prompt_driver=MockPromptDriver(), cassette_file=cassette_file)
+
+        message = prompt_driver.try_run(prompt_stack)
+        prompt_driver.try_run(prompt_stack)
+
+        interactions = self.read_cassette(cassette_file)
+        assert message.value == "mock output"
+        assert len(interactions) == 2
+        assert interactions[0]["request_hash"] == MockPromptDriver().request_hash(prompt_stack)
+        assert interactions[0]["stream"] is False
+        assert interactions[0]["latency"] >= 0
+        assert Message.from_dict(interactions[0]["message"]).value == "mock output"
+
+    def test_try_stream(self, cassette_file, prompt_stack):
+        prompt_driver = RecordingPromptDriver(prompt_driver=MockPromptDriver(), cassette_file=cassette_file)
+
+        delta_messages = list(prompt_driver.try_stream(prompt_stack))
+
+        interactions = self.read_cassette(cassette_file)
+        assert len(interactions) == 1
+        assert interactions[0]["stream"] is True
+        assert [delta["delta_message"] for delta in interactions[0]["deltas"]] == [
+            delta_message.to_dict() for delta_message in delta_messages
+        ]
+        assert all(delta["delay"] >= 0 for delta in interactions[0]["deltas"])
+
+    def test_run(self, cassette_file):
+        prompt_driver = RecordingPromptDriver(prompt_driver=MockPromptDriver(), cassette_file=cassette_file)
+
+        assert prompt_driver.run(TextArtifact("foo")).value == "mock output"
+        assert len(self.read_cassette(cassette_file)) == 1
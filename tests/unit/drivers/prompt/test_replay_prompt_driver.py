@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from griptape.common import Message, PromptStack
+from griptape.drivers.prompt.cassette import RecordingPromptDriver, ReplayPromptDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def slow_output(output: str, delay: float):
+    def mock_output(_: PromptStack) -> str:
+        time.sleep(delay)
+
+        return output
+
+    return mock_output
+
+
+class TestReplayPromptDriver:
+    @pytest.fixture()
+    def cassette_file(self, tmp_path):
+        return str(tmp_path / "cassette.jsonl")
+
+    @pytest.fixture()
+    def prompt_stack(self):
+        return PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+
+    def test_init(self, cassette_file):
+        prompt_driver = ReplayPromptDriver(cassette_file=cassette_file)
+
+        assert prompt_driver.model == "replay"
+        assert prompt_driver.max_attempts == 1
+
+    def test_try_run(self, cassette_file, prompt_stack):
+        recording_driver = RecordingPromptDriver(
+            prompt_driver=MockPromptDriver(mock_output=slow_output("mock output", 0.1)), cassette_file=cassette_file
+        )
+        recorded_message = recording_driver.try_run(prompt_stack)
+        prompt_driver = ReplayPromptDriver(cassette_file=cassette_file)
+
+        start_time = time.perf_counter()
+        message = prompt_driver.try_run(prompt_stack)
+
+        assert time.perf_counter() - start_time >= 0.1
+        assert message.to_dict() == recorded_message.to_dict()
+
+    def test_try_run_latency_scale(self, cassette_file, prompt_stack):
+        recording_driver = RecordingPromptDriver(
+            prompt_driver=MockPromptDriver(mock_output=slow_output("mock output", 0.2)), cassette_file=cassette_file
+        )
+        recording_driver.try_run(prompt_stack)
+        prompt_driver = ReplayPromptDriver(cassette_file=cassette_file, latency_scale=0)
+
+        start_time = time.perf_counter()
+        prompt_driver.try_run(prompt_stack)
+
+        assert time.perf_counter() - start_time < 0.2
+
+    def test_try_run_replays_in_order(self, cassette_file, prompt_stack):
+        RecordingPromptDriver(prompt_driver=MockPromptDriver(mock_output="foo"), cassette_file=cassette_file).try_run(
+            prompt_stack
+        )
+        RecordingPromptDriver(prompt_driver=MockPromptDriver(mock_output="bar"), cassette_file=cassette_file).try_run(
+            prompt_stack
+        )
+        prompt_driver = ReplayPromptDriver(cassette_file=cassette_file)
+
+        assert [prompt_driver.try_run(prompt_stack).value for _ in range(3)] == ["foo", "bar", "foo"]
+
+    def test_try_run_not_recorded(self, cassette_file, prompt_stack):
+        RecordingPromptDriver(prompt_driver=MockPromptDriver(), cassette_file=cassette_file).try_run(prompt_stack)
+        prompt_driver = ReplayPromptDriver(cassette_file=cassette_file)
+
+        with pytest.raises(ValueError, match="No response recorded for request"):
+            prompt_driver.try_run(PromptStack(messages=[Message("bar", role=Message.USER_ROLE)]))
+        with pytest.raises(ValueError, match="No streamed response recorded for request"):
+            list(prompt_driver.try_stream(prompt_stack))
+
+    def test_try_stream(self, cassette_file, prompt_stack):
+        recording_driver = RecordingPromptDriver(prompt_driver=MockPromptDriver(), cassette_file=cassette_file)
+        recorded_delta_messages = list(recording_driver.try_stream(prompt_stack))
+        prompt_driver = ReplayPromptDriver(cassette_file=cassette_file)
+
+        delta_messages = list(prompt_driver.try_stream(prompt_stack))
+
+        assert [delta_message.to_dict() for delta_message in delta_messages] == [
+            delta_message.to_dict() for delta_message in recorded_delta_messages
+        ]
+
+    def test_run(self, cassette_file, prompt_stack):
+        recording_driver = RecordingPromptDriver(
+            prompt_driver=MockPromptDriver(stream=True), cassette_file=cassette_file
+        )
+        recording_driver.run(prompt_stack)
+        prompt_driver = ReplayPromptDriver(cassette_file=cassette_file, stream=True)
+
+        assert prompt_driver.run(prompt_stack).value == "mock output"
@@ -0,0 +1,53 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from attrs import define
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers.rerank import BaseRerankDriver
+from tests.mocks.mock_rerank_driver import MockRerankDriver
+
+
+class TestBaseRerankDriver:
+    def test_run(self):
+        artifacts = [TextArtifact("foo"), TextArtifact("bar")]
+
+        assert MockRerankDriver().run("query", artifacts) == [artifacts[1], artifacts[0]]
+
+    def test_run_override(self):
+        @define(kw_only=True)
+        class RunRerankDriver(BaseRerankDriver):
+            def run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]:
+                return artifacts[:1]
+
+        artifacts = [TextArtifact("foo"), TextArtifact("bar")]
+
+        assert RunRerankDriver().run("query", artifacts) == [artifacts[0]]
+
+    def test_try_run_not_implemented(self):
+        @define(kw_only=True)
+        class EmptyRerankDriver(BaseRerankDriver): ...
+
+        with pytest.raises(NotImplementedError):
+            EmptyRerankDriver().run("query", [TextArtifact("foo")])
+
+    def test_run_with_single_flight(self):
+        calls = []
+
+        def mock_output(query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]:
+            calls.append(query)
+            time.sleep(0.2)
+
+            return list(reversed(artifacts))
+
+        driver = MockRerankDriver(mock_output=mock_output, single_flight=True)
+        artifacts = [[TextArtifact("foo"), TextArtifact("bar")] for _ in range(3)]
+
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(lambda artifacts: driver.run("query", artifacts), artifacts))
+
+        assert calls == ["query"]
+        for result, caller_artifacts in zip(results, artifacts):
+            assert result[0] is caller_artifacts[1]
+            assert result[1] is caller_artifacts[0]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import pytest
 
@@ -36,6 +36,48 @@ class TestBaseVectorStoreDriver(ABC):
         assert foo_entries[0].to_artifact().value == "foo"
         assert bar_entries[0].to_artifact().value == "bar"
 
+    def test_upsert_text_artifacts_in_batches(self, driver, mocker):
+        driver.embedding_driver.batch_size = 2
+        embed_strings = mocker.spy(driver.embedding_driver, "embed_strings")
+        driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+
+        vector_ids = driver.upsert_text_artifacts({"foo": [TextArtifact(value) for value in ["foo", "bar", "baz"]]})
+
+        assert len(vector_ids["foo"]) == 3
+        assert len(driver.load_entries(namespace="foo")) == 3
+        # The existing Artifact isn't embedded again.
+        assert sorted(call.args[0] for call in embed_strings.call_args_list) == [["bar"], ["baz"]]
+
+    def test_delete_namespace_unsupported(self, driver, mocker):
+        mocker.patch.object(type(driver), "supports_namespace_deletion", new_callable=PropertyMock, return_value=False)
+        load_entries = mocker.patch.object(type(driver), "load_entries")
+
+        # The namespace's entries aren't loaded when they can't be deleted.
+        with pytest.raises(NotImplementedError):
+            BaseVectorStoreDriver.delete_namespace(driver, "foo")
+        assert not load_entries.called
+
+    def test_corpus_version(self, driver):
+        foo_version = driver.get_corpus_version("foo")
+        bar_version = driver.get_corpus_version("bar")
+        version = driver.get_corpus_version()
+
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")]})
+
+        assert driver.get_corpus_version("foo") != foo_version
+        assert driver.get_corpus_version("bar") == bar_version
+        assert driver.get_corpus_version() != version
+
+        foo_version = driver.get_corpus_version("foo")
+        driver.upsert_text_artifact(TextArtifact("bar"), namespace="bar")
+
+        assert driver.get_corpus_version("foo") == foo_version
+        assert driver.get_corpus_version("bar") != bar_version
+
+        driver.bump_corpus_version("foo", version="ingestion-1")
+
+        assert driver.get_corpus_version("foo") == ":ingestion-1"
+
     def test_query(self, driver):
         vector_id = driver.upsert_text_artifact(TextArtifact("foobar"), namespace="test-namespace")
 
@@ -11,12 +11,43 @@ class TestLocalVectorStoreDriver(TestBaseVectorStoreDriver):
     def driver(self):
         return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
 
+    def test_unknown_corpus_version(self, driver):
+        assert driver.get_corpus_version() is None
+        assert driver.get_corpus_version("foo") is None
+
+        driver.upsert_text_artifacts({"bar": [TextArtifact("bar")]})
+
+        assert driver.get_corpus_version() is not None
+        assert driver.get_corpus_version("foo") is None
+
+        driver.bump_corpus_version("foo", version="ingestion-1")
+
+        assert driver.get_corpus_version("foo") == ":ingestion-1"
+
     def test_upsert_text_artifacts_dict(self, driver):
         driver.upsert_text_artifacts({"foo": [TextArtifact("bar"), TextArtifact("baz")], "bar": [TextArtifact("bar")]})
 
         assert len(driver.load_artifacts(namespace="foo")) == 2
         assert len(driver.load_artifacts(namespace="bar")) == 1
 
+    def test_upsert_text_artifacts_custom_upsert_text_artifact(self):
+        class CustomLocalVectorStoreDriver(LocalVectorStoreDriver):
+            def upsert_text_artifact(self, artifact, *, namespace=None, meta=None, vector_id=None, **kwargs) -> str:
+                return super().upsert_text_artifact(
+                    artifact, namespace=namespace, meta={**(meta or {}), "custom": True}, vector_id=vector_id, **kwargs
+                )
+
+        driver = CustomLocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(batch_size=2))
+        meta = {"foo": "bar"}
+
+        driver.upsert_text_artifacts(
+            {"foo": [TextArtifact("bar"), TextArtifact("baz"), TextArtifact("qux")]}, meta=meta
+        )
+
+        # Each Artifact is upserted with the overriding `upsert_text_artifact`.
+        assert [entry.meta["custom"] for entry in driver.load_entries(namespace="foo")] == [True, True, True]
+        assert meta == {"foo": "bar"}
+
     def test_upsert_text_artifacts_list(self, driver):
         driver.upsert_text_artifacts([TextArtifact("bar"), TextArtifact("baz")])
 
@@ -36,6 +67,14 @@ class TestLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         assert len(driver.query("foo", namespace="test2")) == 1000
         assert len(driver.query("foo", namespace="test3")) == 1000
 
+    def test_delete_namespace(self, driver):
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")], "bar": [TextArtifact("foo")]})
+
+        driver.delete_namespace("foo")
+
+        assert driver.load_entries(namespace="foo") == []
+        assert len(driver.load_entries(namespace="bar")) == 1
+
     def test_query_vector(self, driver):
         driver.upsert_text_artifacts({"foo": [TextArtifact("foo bar")]})
 
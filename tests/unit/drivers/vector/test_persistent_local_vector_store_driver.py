@@ -29,3 +29,21 @@ class TestPersistentLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
 
         assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+
+    def test_persisted_corpus_version(self, driver, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")]})
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+        version = new_driver.get_corpus_version("foo")
+
+        assert version is not None
+        assert version == LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file
+        ).get_corpus_version("foo")
+
+        driver.upsert_text_artifacts({"foo": [TextArtifact("bar")]})
+
+        assert version != LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file
+        ).get_corpus_version("foo")
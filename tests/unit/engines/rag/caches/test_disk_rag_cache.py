@@ -0,0 +1,21 @@
+from griptape.engines.rag.caches import DiskRagCache
+
+
+class TestDiskRagCache:
+    def test_store(self, tmp_path):
+        cache = DiskRagCache(directory=str(tmp_path / "cache"))
+
+        cache.store("foo", {"outputs": [{"type": "TextArtifact", "value": "foo"}]})
+
+        assert cache.load("foo") == {"outputs": [{"type": "TextArtifact", "value": "foo"}]}
+        assert cache.load("bar") is None
+        assert DiskRagCache(directory=str(tmp_path / "cache")).load("foo") is not None
+        assert [path.name for path in (tmp_path / "cache").iterdir()] == ["foo.json"]
+
+    def test_clear(self, tmp_path):
+        cache = DiskRagCache(directory=str(tmp_path))
+
+        cache.store("foo", {})
+        cache.clear()
+
+        assert cache.load("foo") is None
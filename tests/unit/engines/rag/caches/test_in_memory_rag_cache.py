@@ -0,0 +1,50 @@
+from griptape.engines.rag import RagContext
+from griptape.engines.rag.caches import InMemoryRagCache
+from griptape.engines.rag.modules import TextChunksResponseRagModule
+from griptape.engines.rag.stages import ResponseRagStage
+
+
+class TestInMemoryRagCache:
+    def test_get_key(self):
+        cache = InMemoryRagCache()
+        stage = ResponseRagStage(response_modules=[TextChunksResponseRagModule(name="response")])
+
+        key = cache.get_key(stage, RagContext(query="What is  Griptape?"))
+
+        assert key == cache.get_key(stage, RagContext(query=" what is griptape? "))
+        assert key != cache.get_key(stage, RagContext(query="What is Griptape?", queries=["Griptape"]))
+        assert key != cache.get_key(
+            stage, RagContext(query="What is Griptape?", module_configs={"response": {"foo": "bar"}})
+        )
+        assert key != cache.get_key(
+            ResponseRagStage(response_modules=[TextChunksResponseRagModule(name="other")]),
+            RagContext(query="What is Griptape?"),
+        )
+
+    def test_store(self):
+        cache = InMemoryRagCache()
+
+        cache.store("foo", {"outputs": []})
+
+        assert cache.load("foo") == {"outputs": []}
+        assert cache.load("bar") is None
+
+    def test_max_entries(self):
+        cache = InMemoryRagCache(max_entries=2)
+
+        cache.store("foo", {})
+        cache.store("bar", {})
+        cache.load("foo")
+        cache.store("baz", {})
+
+        assert cache.load("foo") == {}
+        assert cache.load("bar") is None
+        assert cache.load("baz") == {}
+
+    def test_clear(self):
+        cache = InMemoryRagCache()
+
+        cache.store("foo", {})
+        cache.clear()
+
+        assert cache.load("foo") is None
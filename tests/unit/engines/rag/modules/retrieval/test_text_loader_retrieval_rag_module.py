@@ -24,3 +24,16 @@ class TestTextLoaderRetrievalRagModule:
         )
 
         assert module.run(RagContext(query="foo"))[0].value == "foobar"
+
+    def test_is_cacheable(self):
+        module = TextLoaderRetrievalRagModule(
+            loader=WebLoader(),
+            vector_store_driver=LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver()),
+            source="https://www.griptape.ai",
+        )
+
+        assert not module.is_cacheable(RagContext(query="foo"))
+
+        module.static_source = True
+
+        assert module.is_cacheable(RagContext(query="foo"))
@@ -0,0 +1,55 @@
+import time
+
+from attrs import define, field
+
+from griptape.engines.rag import RagContext
+from griptape.engines.rag.modules import BaseQueryRagModule
+from griptape.engines.rag.stages import QueryRagStage
+
+
+@define(kw_only=True)
+class MockQueryRagModule(BaseQueryRagModule):
+    suffix: str = field()
+
+    def run(self, context: RagContext) -> RagContext:
+        time.sleep(0.2)
+        context.query = f"{context.query} {self.suffix}"
+
+        return context
+
+
+class TestQueryRagStage:
+    def test_run(self):
+        stage = QueryRagStage(query_modules=[MockQueryRagModule(suffix="foo"), MockQueryRagModule(suffix="bar")])
+
+        context = stage.run(RagContext(query="test"))
+
+        assert context.query == "test foo bar"
+        assert context.queries == []
+
+    def test_run_parallel(self):
+        stage = QueryRagStage(
+            query_modules=[MockQueryRagModule(suffix="foo")],
+            parallel_query_modules=[
+                MockQueryRagModule(suffix="bar"),
+                MockQueryRagModule(suffix="baz"),
+                MockQueryRagModule(suffix="bar"),
+            ],
+        )
+
+        start = time.perf_counter()
+        context = stage.run(RagContext(query="test"))
+        elapsed = time.perf_counter() - start
+
+        assert context.query == "test foo"
+        assert context.queries == ["test foo bar", "test foo baz"]
+        assert elapsed < 0.2 * 3
+        assert len(stage.modules) == 4
+
+    def test_merge_queries(self):
+        stage = QueryRagStage(
+            parallel_query_modules=[MockQueryRagModule(suffix="bar"), MockQueryRagModule(suffix="baz")],
+            merge_queries=lambda context, module_contexts: [module_contexts[-1].query],
+        )
+
+        assert stage.run(RagContext(query="test")).queries == ["test baz"]
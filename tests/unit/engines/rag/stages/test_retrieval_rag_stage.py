@@ -0,0 +1,31 @@
+from collections.abc import Sequence
+
+from attrs import define
+
+from griptape.artifacts import TextArtifact
+from griptape.engines.rag import RagContext
+from griptape.engines.rag.modules import BaseRetrievalRagModule
+from griptape.engines.rag.stages import RetrievalRagStage
+
+
+@define(kw_only=True)
+class MockRetrievalRagModule(BaseRetrievalRagModule):
+    def run(self, context: RagContext) -> Sequence[TextArtifact]:
+        return [TextArtifact(context.query), TextArtifact("shared")]
+
+
+class TestRetrievalRagStage:
+    def test_run(self):
+        stage = RetrievalRagStage(retrieval_modules=[MockRetrievalRagModule()])
+
+        context = stage.run(RagContext(query="test"))
+
+        assert [chunk.value for chunk in context.text_chunks] == ["test", "shared"]
+
+    def test_run_with_queries(self):
+        stage = RetrievalRagStage(retrieval_modules=[MockRetrievalRagModule(), MockRetrievalRagModule()], max_chunks=3)
+
+        context = stage.run(RagContext(query="test", queries=["foo", "bar"]))
+
+        assert [chunk.value for chunk in context.text_chunks] == ["test", "shared", "foo"]
+        assert context.query == "test"
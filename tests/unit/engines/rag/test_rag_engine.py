@@ -1,7 +1,9 @@
 import pytest
 
+from griptape.artifacts import TextArtifact
 from griptape.drivers.vector.local import LocalVectorStoreDriver
 from griptape.engines.rag import RagContext, RagEngine
+from griptape.engines.rag.caches import DiskRagCache, InMemoryRagCache
 from griptape.engines.rag.modules import PromptResponseRagModule, VectorStoreRetrievalRagModule
 from griptape.engines.rag.stages import ResponseRagStage, RetrievalRagStage
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
@@ -49,3 +51,106 @@ class TestRagEngine:
 
     def test_process(self, engine):
         assert engine.process(RagContext(query="test")).outputs[0].value == "mock output"
+
+    def test_process_cached(self, mocker):
+        cache = InMemoryRagCache()
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        prompt_driver = MockPromptDriver()
+        engine = RagEngine(
+            retrieval_stage=RetrievalRagStage(
+                retrieval_modules=[
+                    VectorStoreRetrievalRagModule(
+                        vector_store_driver=vector_store_driver, query_params={"namespace": "foo"}
+                    )
+                ],
+                cache=cache,
+            ),
+            response_stage=ResponseRagStage(
+                response_modules=[PromptResponseRagModule(prompt_driver=prompt_driver)], cache=cache
+            ),
+        )
+        vector_store_driver.upsert_text_artifacts({"foo": [TextArtifact("foo")]})
+        query = mocker.spy(LocalVectorStoreDriver, "query")
+        try_run = mocker.spy(MockPromptDriver, "try_run")
+
+        context = engine.process_query("What is foo?")
+        cached_context = engine.process_query("what is  foo?")
+
+        assert query.call_count == 1
+        assert try_run.call_count == 1
+        assert cached_context.query == "what is  foo?"
+        assert [chunk.value for chunk in cached_context.text_chunks] == ["foo"]
+        assert cached_context.outputs[0].value == context.outputs[0].value
+
+        vector_store_driver.upsert_text_artifacts({"bar": [TextArtifact("bar")]})
+        engine.process_query("What is foo?")
+
+        assert query.call_count == 1
+
+        vector_store_driver.upsert_text_artifacts({"foo": [TextArtifact("bar")]})
+        engine.process_query("What is foo?")
+
+        assert query.call_count == 2
+        assert try_run.call_count == 2
+
+    def test_process_cached_response_configuration(self, tmp_path, mocker):
+        def create_engine(response_module: PromptResponseRagModule) -> RagEngine:
+            return RagEngine(
+                response_stage=ResponseRagStage(
+                    response_modules=[response_module], cache=DiskRagCache(directory=str(tmp_path))
+                )
+            )
+
+        def generate_system_template(context, artifacts) -> str:
+            return "custom"
+
+        try_run = mocker.spy(MockPromptDriver, "try_run")
+
+        create_engine(PromptResponseRagModule(name="responder", prompt_driver=MockPromptDriver())).process_query("foo")
+        create_engine(PromptResponseRagModule(name="responder", prompt_driver=MockPromptDriver())).process_query("foo")
+
+        assert try_run.call_count == 1
+
+        # Changing the template or the Prompt Driver's configuration doesn't reuse the cached output.
+        create_engine(
+            PromptResponseRagModule(
+                name="responder", prompt_driver=MockPromptDriver(), generate_system_template=generate_system_template
+            )
+        ).process_query("foo")
+        create_engine(
+            PromptResponseRagModule(name="responder", prompt_driver=MockPromptDriver(extra_params={"top_p": 0.5}))
+        ).process_query("foo")
+
+        assert try_run.call_count == 3
+
+    def test_process_cached_unknown_corpus_version(self, tmp_path):
+        def create_engine(vector_store_driver: LocalVectorStoreDriver) -> RagEngine:
+            return RagEngine(
+                retrieval_stage=RetrievalRagStage(
+                    retrieval_modules=[
+                        VectorStoreRetrievalRagModule(
+                            name="retriever",
+                            vector_store_driver=vector_store_driver,
+                            query_params={"namespace": "foo"},
+                        )
+                    ],
+                    cache=DiskRagCache(directory=str(tmp_path)),
+                )
+            )
+
+        old_vector_store_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        old_vector_store_driver.upsert_text_artifacts({"foo": [TextArtifact("old fact")]})
+        # Simulates a query server that loaded the store without writing to it.
+        reader_vector_store_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), entries=dict(old_vector_store_driver.entries)
+        )
+        new_vector_store_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        new_vector_store_driver.upsert_text_artifacts({"foo": [TextArtifact("new fact")]})
+
+        assert [chunk.value for chunk in create_engine(new_vector_store_driver).process_query("fact").text_chunks] == [
+            "new fact"
+        ]
+        assert [
+            chunk.value for chunk in create_engine(reader_vector_store_driver).process_query("fact").text_chunks
+        ] == ["old fact"]
+        assert len(list(tmp_path.iterdir())) == 1
@@ -29,6 +29,19 @@ class TestBaseEvent:
     def test_to_dict(self):
         assert "timestamp" in MockEvent().to_dict()
 
+    def test_meta(self):
+        event = MockEvent()
+
+        assert event._meta is None
+        assert event.meta == {}
+
+        event.meta = {"foo": "bar"}
+
+        assert event.to_dict()["meta"] == {"foo": "bar"}
+        assert TextChunkEvent.from_dict(TextChunkEvent(token="foo", meta={"foo": "bar"}).to_dict()).meta == {
+            "foo": "bar"
+        }
+
     def test_start_prompt_event_from_dict(self):
         dict_value = {
             "type": "StartPromptEvent",
@@ -0,0 +1,105 @@
+import threading
+
+import pytest
+
+from griptape.events import ActionChunkEvent, ChunkEventCoalescer, TextChunkEvent
+
+
+class TestChunkEventCoalescer:
+    @pytest.fixture()
+    def coalescer(self):
+        return ChunkEventCoalescer(max_delay=None, max_bytes=None)
+
+    def test_coalesce_text(self, coalescer):
+        events = list(coalescer.coalesce([TextChunkEvent(token="foo"), TextChunkEvent(token=" bar")]))
+
+        assert len(events) == 1
+        assert isinstance(events[0], TextChunkEvent)
+        assert events[0].token == "foo bar"
+
+    def test_coalesce_single_event(self, coalescer):
+        event = TextChunkEvent(token="foo")
+
+        assert list(coalescer.coalesce([event])) == [event]
+
+    def test_coalesce_empty(self, coalescer):
+        assert list(coalescer.coalesce([])) == []
+
+    def test_coalesce_different_index(self, coalescer):
+        events = list(
+            coalescer.coalesce(
+                [TextChunkEvent(token="foo", index=0), TextChunkEvent(token="bar", index=1)],
+            )
+        )
+
+        assert [(event.token, event.index) for event in events] == [("foo", 0), ("bar", 1)]
+
+    def test_coalesce_action_boundaries(self, coalescer):
+        events = list(
+            coalescer.coalesce(
+                [
+                    TextChunkEvent(token="foo"),
+                    TextChunkEvent(token="bar"),
+                    ActionChunkEvent(tag="1", name="MockTool", path="test", index=1),
+                    ActionChunkEvent(partial_input='{"values": ', index=1),
+                    ActionChunkEvent(partial_input='{"test": "value"}}', index=1),
+                    ActionChunkEvent(tag="2", name="MockTool", path="test", index=2),
+                    ActionChunkEvent(partial_input="{}", index=2),
+                    TextChunkEvent(token="baz", index=3),
+                ]
+            )
+        )
+
+        assert len(events) == 4
+        assert isinstance(events[0], TextChunkEvent)
+        assert events[0].token == "foobar"
+        assert isinstance(events[1], ActionChunkEvent)
+        assert events[1].tag == "1"
+        assert events[1].partial_input == '{"values": {"test": "value"}}'
+        assert isinstance(events[2], ActionChunkEvent)
+        assert events[2].tag == "2"
+        assert events[2].partial_input == "{}"
+        assert isinstance(events[3], TextChunkEvent)
+        assert events[3].token == "baz"
+
+    def test_coalesce_max_bytes(self):
+        coalescer = ChunkEventCoalescer(max_delay=None, max_bytes=4)
+
+        events = list(coalescer.coalesce([TextChunkEvent(token=token) for token in ["ab", "cd", "ef", "g"]]))
+
+        assert [event.token for event in events] == ["abcd", "efg"]
+
+    def test_coalesce_max_delay(self):
+        coalescer = ChunkEventCoalescer(max_delay=0, max_bytes=None)
+
+        events = list(coalescer.coalesce([TextChunkEvent(token=token) for token in ["ab", "cd"]]))
+
+        assert [event.token for event in events] == ["ab", "cd"]
+
+    def test_coalesce_max_delay_stalled_stream(self):
+        coalescer = ChunkEventCoalescer(max_delay=0.01, max_bytes=None)
+        resumed = threading.Event()
+
+        def stream():
+            yield TextChunkEvent(token="ab")
+            resumed.wait()
+            yield TextChunkEvent(token="cd")
+
+        events = coalescer.coalesce(stream())
+
+        # The buffered chunk is flushed while the stream stalls.
+        assert next(events).token == "ab"
+
+        resumed.set()
+
+        assert [event.token for event in events] == ["cd"]
+
+    def test_coalesce_max_delay_error(self):
+        coalescer = ChunkEventCoalescer(max_delay=10, max_bytes=None)
+
+        def stream():
+            yield TextChunkEvent(token="ab")
+            raise ValueError("error")
+
+        with pytest.raises(ValueError, match="error"):
+            list(coalescer.coalesce(stream()))
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from griptape.common import Message, PromptStack
+from griptape.events import ActionChunkEvent, CompactEventEncoder, StartPromptEvent, TextChunkEvent
+
+
+class TestCompactEventEncoder:
+    @pytest.fixture()
+    def event_payloads(self):
+        return [
+            StartPromptEvent(model="foo", prompt_stack=PromptStack(messages=[Message("bar", role="user")])).to_dict(),
+            *[TextChunkEvent(token=f"token {i}", index=0).to_dict() for i in range(10)],
+            ActionChunkEvent(partial_input='{"foo": ', tag="foo", name="bar", path="baz", index=1).to_dict(),
+            ActionChunkEvent(partial_input='"bar"}', index=1).to_dict(),
+        ]
+
+    @pytest.mark.parametrize("compression", [None, "gzip", "zlib", "bz2", "lzma"])
+    def test_encode_decode(self, event_payloads, compression):
+        encoder = CompactEventEncoder(compression=compression)
+
+        assert CompactEventEncoder().decode(encoder.encode(event_payloads)) == event_payloads
+        assert CompactEventEncoder().decode(encoder.encode_text(event_payloads)) == event_payloads
+        assert CompactEventEncoder().decode(encoder.encode(event_payloads[0])) == event_payloads[0]
+
+    def test_encode_compression_level(self, event_payloads):
+        encoder = CompactEventEncoder(compression="lzma", compression_level=1)
+
+        assert encoder.decode(encoder.encode(event_payloads)) == event_payloads
+
+    def test_encode_interns_keys(self):
+        encoder = CompactEventEncoder()
+
+        message = json.loads(encoder.encode([{"foo": {"bar": 1}}, {"foo": {"bar": 2}}]))
+
+        assert message["k"] == ["foo", "bar"]
+        assert message["p"] == [{"0": {"1": 1}}, {"0": {"1": 2}}]
+
+    def test_encode_delta(self):
+        encoder = CompactEventEncoder()
+        event_payloads = [
+            {"type": "TextChunkEvent", "token": "foo", "meta": {}},
+            {"type": "OtherEvent"},
+            {"type": "TextChunkEvent", "token": "bar"},
+        ]
+
+        message = json.loads(encoder.encode(event_payloads))
+
+        assert message["p"][2] == {"^": 2, "1": "bar", "-": [2]}
+        assert encoder.decode(encoder.encode(event_payloads)) == event_payloads
+
+    def test_encode_smaller(self, event_payloads):
+        assert len(CompactEventEncoder().encode(event_payloads)) < len(json.dumps(event_payloads))
+        assert len(CompactEventEncoder(compression="gzip").encode(event_payloads)) < len(json.dumps(event_payloads)) / 2
+
+    def test_decode_unrecognized(self):
+        with pytest.raises(ValueError, match="Unrecognized compact event message"):
+            CompactEventEncoder().decode(b"foo")
+
+    def test_decode_unsupported_version(self):
+        with pytest.raises(ValueError, match="Unsupported compact event format version"):
+            CompactEventEncoder().decode(b'{"v": 0}')
@@ -1,6 +1,7 @@
 from unittest.mock import Mock
 
-from griptape.events import EventBus, EventListener
+from griptape.common import PromptStack
+from griptape.events import BasePromptEvent, EventBus, EventListener
 from griptape.events.finish_prompt_event import FinishPromptEvent
 from griptape.events.start_prompt_event import StartPromptEvent
 from griptape.utils import with_contextvars
@@ -61,6 +62,59 @@ class TestEventBus:
         # Then
         mock_handler.assert_called_once_with(mock_event)
 
+    def test_publish_event_by_type(self):
+        start_handler = Mock()
+        finish_handler = Mock()
+        EventBus.add_event_listeners(
+            [
+                EventListener(on_event=start_handler, event_types=[StartPromptEvent]),
+                EventListener(on_event=finish_handler, event_types=[FinishPromptEvent]),
+            ]
+        )
+        start_event = StartPromptEvent(model="foo", prompt_stack=PromptStack())
+
+        EventBus.publish_event(start_event)
+
+        start_handler.assert_called_once_with(start_event)
+        finish_handler.assert_not_called()
+
+    def test_publish_event_by_type_after_add(self):
+        EventBus.publish_event(MockEvent())
+        mock_handler = Mock()
+        EventBus.add_event_listener(EventListener(on_event=mock_handler, event_types=[MockEvent]))
+        mock_event = MockEvent()
+
+        EventBus.publish_event(mock_event)
+
+        mock_handler.assert_called_once_with(mock_event)
+
+    def test_publish_event_flush(self):
+        mock_event_listener_driver = Mock()
+        EventBus.add_event_listener(
+            EventListener(event_types=[StartPromptEvent], event_listener_driver=mock_event_listener_driver)
+        )
+
+        EventBus.publish_event(MockEvent(), flush=True)
+
+        mock_event_listener_driver.flush_events.assert_called_once()
+
+    def test_has_listeners(self):
+        assert not EventBus.has_listeners(MockEvent)
+
+        event_listener = EventListener(event_types=[BasePromptEvent])
+        EventBus.add_event_listener(event_listener)
+
+        assert EventBus.has_listeners(StartPromptEvent)
+        assert not EventBus.has_listeners(MockEvent)
+
+        EventBus.remove_event_listener(event_listener)
+
+        assert not EventBus.has_listeners(StartPromptEvent)
+
+        EventBus.add_event_listener(EventListener())
+
+        assert EventBus.has_listeners(MockEvent)
+
     def test_context_manager(self):
         e1 = EventListener()
         EventBus.add_event_listeners([e1])
@@ -208,14 +208,20 @@ class TestEventListener:
         assert mock_event_listener_driver.batch == []
 
     def test_publish_event_no_flush(self):
-        mock_event_listener_driver = MockEventListenerDriver()
-        mock_event_listener_driver.flush_events = Mock(side_effect=mock_event_listener_driver.flush_events)
+        on_event_payload_batch_publish = Mock()
+        mock_event_listener_driver = MockEventListenerDriver(
+            linger_time=None, on_event_payload_batch_publish=on_event_payload_batch_publish
+        )
+        flush_events = mock_event_listener_driver.flush_events
+        mock_event_listener_driver.flush_events = Mock(side_effect=flush_events)
 
         event_listener = EventListener(event_listener_driver=mock_event_listener_driver, event_types=[MockEvent])
         mock_event = MockEvent()
         event_listener.publish_event(mock_event, flush=False)
 
         mock_event_listener_driver.flush_events.assert_not_called()
-        assert mock_event_listener_driver.batch == [
-            mock_event.to_dict(),
-        ]
+        on_event_payload_batch_publish.assert_not_called()
+
+        flush_events()
+
+        on_event_payload_batch_publish.assert_called_once_with([mock_event.to_dict()])
@@ -2,6 +2,7 @@ import json
 
 from griptape.artifacts import TextArtifact
 from griptape.common import PromptStack
+from griptape.drivers.memory.conversation.local import LocalConversationMemoryDriver
 from griptape.memory.structure import BaseConversationMemory, ConversationMemory, Run
 from griptape.structures import Agent, Pipeline
 from griptape.tasks import PromptTask
@@ -18,6 +19,53 @@ class TestConversationMemory:
 
         assert memory.runs[0] == run
 
+    def test_add_run_appends(self, mocker):
+        memory = ConversationMemory(autoload=False)
+        store = mocker.spy(memory.conversation_memory_driver, "store")
+        append = mocker.spy(memory.conversation_memory_driver, "append")
+
+        memory.add_run(Run(input=TextArtifact("foo"), output=TextArtifact("bar")))
+        memory.add_run(Run(input=TextArtifact("foo"), output=TextArtifact("bar")))
+
+        # The unloaded conversation is stored whole, and new Runs are appended after that.
+        assert store.call_count == 1
+        assert append.call_count == 1
+
+    def test_add_run_appends_all_runs(self, tmp_path, mocker):
+        driver = LocalConversationMemoryDriver(persist_file=str(tmp_path / "memory.jsonl"))
+        ConversationMemory(conversation_memory_driver=driver).add_run(
+            Run(input=TextArtifact("foo"), output=TextArtifact("bar"))
+        )
+        append = mocker.spy(LocalConversationMemoryDriver, "append")
+
+        ConversationMemory(conversation_memory_driver=driver).add_run(
+            Run(input=TextArtifact("foo"), output=TextArtifact("bar"))
+        )
+        windowed_memory = ConversationMemory(conversation_memory_driver=driver, autoload_last_n=1)
+        windowed_memory.add_run(Run(input=TextArtifact("foo"), output=TextArtifact("bar")))
+
+        assert [call.kwargs["all_runs"] for call in append.call_args_list] == [True, False]
+
+        windowed_memory.load_older_runs(5)
+        windowed_memory.add_run(Run(input=TextArtifact("foo"), output=TextArtifact("bar")))
+
+        assert append.call_args_list[-1].kwargs["all_runs"] is True
+
+    def test_load_runs_last_n(self, tmp_path):
+        driver = LocalConversationMemoryDriver(persist_file=str(tmp_path / "memory.jsonl"))
+        memory = ConversationMemory(conversation_memory_driver=driver)
+        for i in range(5):
+            memory.add_run(Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")))
+
+        windowed_memory = ConversationMemory(conversation_memory_driver=driver, autoload_last_n=2)
+
+        assert [run.input.value for run in windowed_memory.runs] == ["foo3", "foo4"]
+
+        assert [run.input.value for run in windowed_memory.load_older_runs(2)] == ["foo1", "foo2"]
+        assert [run.input.value for run in windowed_memory.load_older_runs(2)] == ["foo0"]
+        assert windowed_memory.load_older_runs(2) == []
+        assert [run.input.value for run in windowed_memory.runs] == ["foo0", "foo1", "foo2", "foo3", "foo4"]
+
     def test_to_json(self):
         memory = ConversationMemory()
         memory.add_run(Run(input=TextArtifact("foo"), output=TextArtifact("bar")))
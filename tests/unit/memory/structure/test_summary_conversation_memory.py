@@ -1,6 +1,8 @@
 import json
+import threading
 
 from griptape.artifacts import TextArtifact
+from griptape.drivers.memory.conversation.local import LocalConversationMemoryDriver
 from griptape.memory.structure import Run, SummaryConversationMemory
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
@@ -89,3 +91,49 @@ class TestSummaryConversationMemory:
         pipeline.add_tasks(PromptTask("test"))
 
         assert isinstance(memory.prompt_driver, MockPromptDriver)
+
+    def test_background_summarization(self):
+        summarizing = threading.Event()
+        summarized = threading.Event()
+
+        def mock_output(prompt_stack) -> str:
+            summarizing.set()
+            summarized.wait()
+
+            return "summary"
+
+        memory = SummaryConversationMemory(
+            offset=1, background_summarization=True, prompt_driver=MockPromptDriver(mock_output=mock_output)
+        )
+
+        memory.add_run(Run(input=TextArtifact("foo1"), output=TextArtifact("bar1")))
+        memory.add_run(Run(input=TextArtifact("foo2"), output=TextArtifact("bar2")))
+        summarizing.wait()
+        memory.add_run(Run(input=TextArtifact("foo3"), output=TextArtifact("bar3")))
+
+        # Adding Runs doesn't wait on the summarization, and the Prompt Stack still holds every Run.
+        assert memory.summary is None
+        assert len(memory.to_prompt_stack().messages) == 6
+
+        summarized.set()
+        memory.wait_for_summarization()
+
+        # The Run added during the summarization is summarized after it.
+        assert memory.summary == "summary"
+        assert memory.summary_index == 2
+        assert len(memory.to_prompt_stack().messages) == 3
+
+    def test_load_older_runs(self, tmp_path):
+        driver = LocalConversationMemoryDriver(persist_file=str(tmp_path / "memory.jsonl"))
+        driver.store([Run(input=TextArtifact(f"in{i}"), output=TextArtifact(f"out{i}")) for i in range(6)], {})
+
+        memory = SummaryConversationMemory(conversation_memory_driver=driver, autoload_last_n=3, offset=1)
+        memory.add_run(Run(input=TextArtifact("in6"), output=TextArtifact("out6")))
+
+        assert memory.summary_index == 3
+
+        memory.load_older_runs(3)
+
+        assert [run.input.value for run in memory.runs] == [f"in{i}" for i in range(7)]
+        assert memory.summary_index == 6
+        assert [run.input.value for run in memory.unsummarized_runs()] == ["in6"]
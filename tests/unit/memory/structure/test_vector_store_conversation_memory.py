@@ -0,0 +1,97 @@
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.common import PromptStack
+from griptape.drivers.memory.conversation.local import LocalConversationMemoryDriver
+from griptape.drivers.vector.local import LocalVectorStoreDriver
+from griptape.memory.structure import BaseConversationMemory, Run, VectorStoreConversationMemory
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+TOPICS = ["cats", "dogs", "birds", "fish"]
+
+
+class TestVectorStoreConversationMemory:
+    @pytest.fixture()
+    def vector_store_driver(self):
+        # Embeds text by the topics it mentions.
+        return LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(
+                mock_output=lambda chunk: [1.0 if topic in chunk else 0.01 for topic in TOPICS]
+            )
+        )
+
+    @pytest.fixture()
+    def memory(self, vector_store_driver):
+        memory = VectorStoreConversationMemory(
+            vector_store_driver=vector_store_driver, recent_count=1, retrieval_count=1
+        )
+
+        for topic in [*TOPICS, "weather"]:
+            memory.add_run(Run(input=TextArtifact(f"Tell me about {topic}"), output=TextArtifact(f"About {topic}")))
+
+        return memory
+
+    def test_add_run(self, memory, vector_store_driver):
+        assert len(vector_store_driver.load_entries(namespace=memory.namespace)) == 5
+
+    def test_index_runs(self, memory, vector_store_driver, mocker):
+        embed_string = mocker.spy(MockEmbeddingDriver, "embed_string")
+
+        memory.index_runs(memory.runs)
+
+        assert embed_string.call_count == 0
+
+    def test_autoload(self, vector_store_driver, tmp_path):
+        conversation_memory_driver = LocalConversationMemoryDriver(persist_file=str(tmp_path / "memory.json"))
+        memory = VectorStoreConversationMemory(
+            conversation_memory_driver=conversation_memory_driver, vector_store_driver=vector_store_driver
+        )
+        for topic in TOPICS:
+            memory.add_run(Run(input=TextArtifact(f"Tell me about {topic}"), output=TextArtifact(f"About {topic}")))
+
+        loaded_memory = VectorStoreConversationMemory(
+            conversation_memory_driver=conversation_memory_driver,
+            vector_store_driver=LocalVectorStoreDriver(embedding_driver=vector_store_driver.embedding_driver),
+            namespace="loaded",
+            autoload_last_n=2,
+            retrieval_count=1,
+        )
+
+        assert [run.input.value for run in loaded_memory.retrieve_runs("fish")] == ["Tell me about fish"]
+
+        loaded_memory.load_older_runs(2)
+
+        assert [run.input.value for run in loaded_memory.retrieve_runs("cats")] == ["Tell me about cats"]
+
+    def test_retrieve_runs(self, memory):
+        runs = memory.retrieve_runs("What did you say about dogs?")
+
+        assert [run.input.value for run in runs] == ["Tell me about dogs"]
+        assert memory.retrieve_runs("dogs", exclude=runs)[0].input.value != "Tell me about dogs"
+
+    def test_add_to_prompt_stack(self, memory):
+        prompt_stack = PromptStack()
+        prompt_stack.add_user_message("What did you say about birds?")
+
+        memory.add_to_prompt_stack(MockPromptDriver(), prompt_stack, 0)
+
+        assert [message.to_text() for message in prompt_stack.messages] == [
+            "Tell me about birds",
+            "About birds",
+            "Tell me about weather",
+            "About weather",
+            "What did you say about birds?",
+        ]
+
+    def test_to_prompt_stack(self, memory):
+        assert len(memory.to_prompt_stack().messages) == 10
+        assert memory.to_prompt_stack(1).messages[0].to_text() == "Tell me about weather"
+
+    def test_from_dict(self, memory):
+        deserialized_memory = BaseConversationMemory.from_dict(memory.to_dict())
+
+        assert isinstance(deserialized_memory, VectorStoreConversationMemory)
+        assert deserialized_memory.namespace == memory.namespace
+        assert deserialized_memory.recent_count == 1
+        assert len(deserialized_memory.runs) == 5
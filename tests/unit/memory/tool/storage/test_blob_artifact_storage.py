@@ -22,6 +22,12 @@ class TestBlobArtifactStorage:
         assert storage.load_artifacts("test").value == [artifact]
         assert not bool(storage.load_artifacts("empty"))
 
+    def test_delete_artifacts(self, storage):
+        storage.store_artifact("test", BlobArtifact(b"foo"))
+        storage.delete_artifacts("test")
+
+        assert not bool(storage.load_artifacts("test"))
+
     def test_can_store(self, storage):
         assert not storage.can_store(TextArtifact("foo"))
         assert storage.can_store(BlobArtifact(b"foo"))
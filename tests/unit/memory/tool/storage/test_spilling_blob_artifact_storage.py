@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from griptape.artifacts import BlobArtifact, ImageArtifact, TextArtifact
+from griptape.memory.task.storage import SpillingBlobArtifactStorage
+
+
+class TestSpillingBlobArtifactStorage:
+    @pytest.fixture()
+    def storage(self, tmp_path):
+        return SpillingBlobArtifactStorage(max_memory_bytes=10, spill_directory=str(tmp_path))
+
+    def test_store_artifact(self, storage):
+        artifact = BlobArtifact(b"foo", name="foo")
+        storage.store_artifact("test", artifact)
+
+        assert storage.load_artifacts("test").value == [artifact]
+        assert storage.memory_bytes == 3
+
+        with pytest.raises(ValueError):
+            storage.store_artifact("test", TextArtifact("foo"))
+
+    def test_spill(self, storage, tmp_path):
+        artifacts = [BlobArtifact(b"foobar"), ImageArtifact(b"image", format="png", width=1, height=1)]
+        for artifact in artifacts:
+            storage.store_artifact("test", artifact)
+        storage.store_artifact("other", BlobArtifact(b"bar"))
+
+        # The first Artifact is spilled to stay within the budget.
+        assert storage.memory_bytes == 8
+        assert len(os.listdir(tmp_path)) == 2
+
+        loaded_artifacts = storage.load_artifacts("test").value
+
+        assert loaded_artifacts == artifacts
+        assert isinstance(loaded_artifacts[1], ImageArtifact)
+        assert storage.memory_bytes <= 10
+        assert storage.load_artifacts("other").value[0].value == b"bar"
+
+    def test_spill_encoding(self, storage):
+        artifact = BlobArtifact("caf\u00e9".encode("latin-1"), encoding="latin-1", encoding_error_handler="replace")
+        storage.store_artifact("test", artifact)
+        storage.store_artifact("other", BlobArtifact(b"foobarbaz"))
+
+        loaded_artifact = storage.load_artifacts("test").value[0]
+
+        assert loaded_artifact.encoding == "latin-1"
+        assert loaded_artifact.encoding_error_handler == "replace"
+        assert loaded_artifact.to_text() == "caf\u00e9"
+
+    def test_load_artifacts(self, storage):
+        assert not bool(storage.load_artifacts("empty"))
+
+    def test_delete_artifacts(self, storage, tmp_path):
+        storage.store_artifact("test", BlobArtifact(b"foobarbaz"))
+        storage.store_artifact("test", BlobArtifact(b"foobarbaz"))
+        storage.delete_artifacts("test")
+
+        assert not bool(storage.load_artifacts("test"))
+        assert storage.memory_bytes == 0
+        assert os.listdir(tmp_path) == []
+
+    def test_temporary_spill_directory(self):
+        storage = SpillingBlobArtifactStorage(max_memory_bytes=0)
+        storage.store_artifact("test", BlobArtifact(b"foo"))
+
+        assert storage.spill_directory is not None
+        assert os.path.isdir(storage.spill_directory)
+        assert storage.load_artifacts("test").value[0].value == b"foo"
+
+    def test_can_store(self, storage):
+        assert not storage.can_store(TextArtifact("foo"))
+        assert storage.can_store(BlobArtifact(b"foo"))
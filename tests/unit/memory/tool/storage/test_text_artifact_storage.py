@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from griptape.artifacts import BlobArtifact, TextArtifact
@@ -15,6 +17,16 @@ class TestTextArtifactStorage:
 
         assert storage.load_artifacts("test").value[0].value == "foo"
 
+    def test_store_artifacts(self, storage, mocker):
+        upsert_text_artifacts = mocker.spy(storage.vector_store_driver, "upsert_text_artifacts")
+        storage.store_artifacts("test", [TextArtifact("foo"), TextArtifact("bar")])
+
+        assert [artifact.value for artifact in storage.load_artifacts("test").value] == ["foo", "bar"]
+        assert upsert_text_artifacts.call_count == 1
+
+        with pytest.raises(ValueError):
+            storage.store_artifacts("test", [TextArtifact("foo"), BlobArtifact(b"bar")])
+
     def test_load_artifacts(self, storage):
         artifact = TextArtifact("foo", name="foo")
         storage.store_artifact("test", artifact)
@@ -22,6 +34,97 @@ class TestTextArtifactStorage:
         assert storage.load_artifacts("test").value[0].value == "foo"
         assert not bool(storage.load_artifacts("empty"))
 
+    def test_defer_embedding(self, storage, mocker):
+        storage.defer_embedding = True
+        embed_strings = mocker.spy(storage.vector_store_driver.embedding_driver, "embed_strings")
+
+        storage.store_artifacts("test", [TextArtifact("foo"), TextArtifact("bar")])
+
+        assert [artifact.value for artifact in storage.load_artifacts("test").value] == ["foo", "bar"]
+        assert not embed_strings.called
+
+        assert len(storage.query("test", "foo")) == 2
+        assert embed_strings.called
+        assert len(storage.load_artifacts("test")) == 2
+
+    def test_defer_embedding_upsert_error(self, storage, mocker):
+        storage.defer_embedding = True
+        storage.store_artifacts("test", [TextArtifact("foo"), TextArtifact("bar")])
+        mocker.patch.object(storage.vector_store_driver, "upsert_text_artifacts", side_effect=RuntimeError("error"))
+
+        with pytest.raises(RuntimeError):
+            storage.query("test", "foo")
+
+        # The Artifacts are held again, and embedded by the next query.
+        assert [artifact.value for artifact in storage.load_artifacts("test").value] == ["foo", "bar"]
+
+        mocker.stopall()
+
+        assert len(storage.query("test", "foo")) == 2
+        assert len(storage.load_artifacts("test")) == 2
+
+    def test_defer_embedding_upsert_without_lock(self, storage, mocker):
+        storage.defer_embedding = True
+        storage.store_artifacts("test", [TextArtifact("foo")])
+        upserting = threading.Event()
+        upserted = threading.Event()
+        upsert_text_artifacts = storage.vector_store_driver.upsert_text_artifacts
+
+        def mock_upsert_text_artifacts(*args, **kwargs):
+            upserting.set()
+            upserted.wait()
+
+            return upsert_text_artifacts(*args, **kwargs)
+
+        mocker.patch.object(
+            storage.vector_store_driver, "upsert_text_artifacts", side_effect=mock_upsert_text_artifacts
+        )
+        thread = threading.Thread(target=storage.embed_artifacts, args=("test",))
+        thread.start()
+        upserting.wait()
+
+        # Other namespaces, and the Artifacts being embedded, can be used during the upsert.
+        storage.store_artifacts("other", [TextArtifact("bar")])
+        assert [artifact.value for artifact in storage.load_artifacts("other").value] == ["bar"]
+        assert [artifact.value for artifact in storage.load_artifacts("test").value] == ["foo"]
+
+        upserted.set()
+        thread.join()
+
+        assert [artifact.value for artifact in storage.load_artifacts("test").value] == ["foo"]
+        assert len(storage.vector_store_driver.load_entries(namespace="test")) == 1
+
+    def test_defer_embedding_vector_store_query(self, storage):
+        storage.defer_embedding = True
+        storage.store_artifacts("test", [TextArtifact("foo")])
+
+        # Held Artifacts are only found by searching the storage.
+        assert storage.vector_store_driver.query("foo", namespace="test") == []
+        assert len(storage.query("test", "foo")) == 1
+        assert len(storage.vector_store_driver.query("foo", namespace="test")) == 1
+
+    def test_lexical_prefilter(self, storage):
+        storage.defer_embedding = True
+        storage.lexical_prefilter_count = 1
+
+        storage.store_artifacts("test", [TextArtifact("foo bar"), TextArtifact("foo baz"), TextArtifact("bar baz")])
+
+        assert [artifact.value for artifact in storage.query("test", "bar baz")] == ["bar baz"]
+        assert [artifact.value for artifact in storage.query("test", "qux")] == ["bar baz"]
+        assert len(storage.vector_store_driver.load_entries(namespace="test")) == 1
+        assert len(storage.load_artifacts("test")) == 3
+
+    def test_delete_artifacts(self, storage):
+        storage.store_artifact("test", TextArtifact("foo"))
+        storage.store_artifact("other", TextArtifact("bar"))
+        storage.defer_embedding = True
+        storage.store_artifact("test", TextArtifact("baz"))
+
+        storage.delete_artifacts("test")
+
+        assert not bool(storage.load_artifacts("test"))
+        assert len(storage.load_artifacts("other")) == 1
+
     def test_can_store(self, storage):
         assert storage.can_store(TextArtifact("foo"))
         assert not storage.can_store(BlobArtifact(b"foo"))
@@ -116,3 +116,61 @@ class TestTaskMemory:
         )
 
         assert len(deserialized_memory.load_artifacts("test")) == 2
+
+    def test_namespace_ttl(self, memory, mocker):
+        mock_time = mocker.patch("time.time", return_value=0)
+        memory.namespace_ttl = 10
+        memory.store_artifact("foo", TextArtifact("foo"))
+        memory.store_artifact("bar", BlobArtifact(b"bar"))
+        memory.namespace_metadata["foo"] = "[]"
+
+        mock_time.return_value = 5
+        assert len(memory.load_artifacts("bar")) == 1
+
+        mock_time.return_value = 12
+        assert len(memory.load_artifacts("foo")) == 0
+        assert len(memory.load_artifacts("bar")) == 1
+        assert "foo" not in memory.namespace_storage
+        assert "foo" not in memory.namespace_metadata
+        assert memory.artifact_storages[TextArtifact].vector_store_driver.load_entries(namespace="foo") == []
+        assert memory.eviction_metrics.expired_namespaces == 1
+
+    @pytest.mark.parametrize(("eviction_policy", "evicted_namespace"), [("lru", "bar"), ("oldest", "foo")])
+    def test_max_namespaces(self, memory, mocker, eviction_policy, evicted_namespace):
+        mock_time = mocker.patch("time.time", return_value=0)
+        memory.max_namespaces = 2
+        memory.eviction_policy = eviction_policy
+        memory.store_artifact("foo", TextArtifact("foo"))
+        mock_time.return_value = 1
+        memory.store_artifact("bar", TextArtifact("bar"))
+        mock_time.return_value = 2
+        memory.load_artifacts("foo")
+        mock_time.return_value = 3
+        memory.store_artifact("baz", TextArtifact("baz"))
+
+        assert set(memory.namespace_storage) == {"foo", "bar", "baz"} - {evicted_namespace}
+        assert memory.eviction_metrics.evicted_namespaces == 1
+
+    def test_max_artifacts(self, memory):
+        memory.max_artifacts = 3
+        memory.store_artifact("foo", ListArtifact([TextArtifact("foo1"), TextArtifact("foo2")]))
+        memory.store_artifact("bar", ListArtifact([BlobArtifact(b"bar1"), BlobArtifact(b"bar2")]))
+
+        assert list(memory.namespace_storage) == ["bar"]
+        assert memory.eviction_metrics == TaskMemory.EvictionMetrics(
+            expired_namespaces=0, evicted_namespaces=1, evicted_artifacts=2
+        )
+        assert len(memory.load_artifacts("bar")) == 2
+
+    def test_max_artifacts_without_deletion(self, memory, mocker):
+        vector_store_driver = memory.artifact_storages[TextArtifact].vector_store_driver
+        mocker.patch.object(type(vector_store_driver), "delete_namespace", side_effect=NotImplementedError)
+        memory.max_artifacts = 3
+        memory.store_artifact("foo", ListArtifact([TextArtifact("foo1"), TextArtifact("foo2")]))
+        memory.store_artifact("bar", ListArtifact([BlobArtifact(b"bar1"), BlobArtifact(b"bar2")]))
+
+        # The namespace is evicted, but its Artifacts weren't deleted, so they aren't counted.
+        assert list(memory.namespace_storage) == ["bar"]
+        assert memory.eviction_metrics == TaskMemory.EvictionMetrics(
+            expired_namespaces=0, evicted_namespaces=1, evicted_artifacts=0
+        )
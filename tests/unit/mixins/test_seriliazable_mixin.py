@@ -1,4 +1,5 @@
 import json
+from importlib import import_module as import_module_fn
 
 import pytest
 
@@ -71,7 +72,26 @@ class TestSerializableMixin:
 
         assert MockSerializable._import_cls_rec("tests.mocks.mock_tool.tool", "MockTool") == MockTool
 
+    def test_import_class_rec_cached(self, mocker):
+        import_module = mocker.patch("griptape.mixins.serializable_mixin.import_module", side_effect=import_module_fn)
+
+        MockSerializable._import_cls_rec("tests.mocks.mock_tool.tool", "MockTool")
+        import_module.reset_mock()
+
+        assert MockSerializable._import_cls_rec("tests.mocks.mock_tool.tool", "MockTool") == MockTool
+        import_module.assert_not_called()
+
     def test_nested_optional_serializable(self):
         assert MockSerializable(nested=None).to_dict().get("nested") is None
 
         assert MockSerializable(nested=MockSerializable.NestedMockSerializable()).to_dict()["nested"]["foo"] == "bar"
+
+    def test_slots(self):
+        serializable = MockSerializable()
+        serializable.undeclared = "foo"
+
+        assert serializable.undeclared == "foo"
+
+        # Artifacts are slotted, and reject undeclared attributes.
+        with pytest.raises(AttributeError):
+            TextArtifact("foo").undeclared = "foo"
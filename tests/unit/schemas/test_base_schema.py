@@ -45,6 +45,14 @@ class TestBaseSchema:
         with pytest.raises(ValueError):
             BaseSchema.from_attrs_cls(TextLoader)
 
+    def test_from_attrs_cls_cached(self, mocker):
+        resolve_types = mocker.spy(BaseSchema, "_resolve_types")
+
+        schema_cls = BaseSchema.from_attrs_cls(MockSerializable)
+
+        assert BaseSchema.from_attrs_cls(MockSerializable) is schema_cls
+        assert resolve_types.call_count <= 1
+
     def test_get_field_for_type(self):
         assert isinstance(BaseSchema._get_field_for_type(BaseArtifact), fields.Nested)
 
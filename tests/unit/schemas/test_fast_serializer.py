@@ -0,0 +1,109 @@
+import json
+import random
+
+import pytest
+
+from griptape.artifacts import ActionArtifact, ImageArtifact, TextArtifact
+from griptape.common import (
+    ActionCallMessageContent,
+    Message,
+    Reference,
+    TextMessageContent,
+    ToolAction,
+)
+from griptape.events import ActionChunkEvent, TextChunkEvent
+from griptape.schemas import BaseSchema, FastSerializer
+
+SEEDS = range(50)
+
+
+def random_text(rng: random.Random) -> str:
+    return "".join(rng.choice("abc xyz \n\"'\\é漢🙂") for _ in range(rng.randint(0, 20)))
+
+
+def random_optional_text(rng: random.Random):
+    return rng.choice([None, random_text(rng)])
+
+
+def random_meta(rng: random.Random) -> dict:
+    return {
+        random_text(rng): rng.choice([random_text(rng), rng.randint(-10, 10), rng.random(), None, [1, "a"], {"b": 2}])
+        for _ in range(rng.randint(0, 3))
+    }
+
+
+def random_text_artifact(rng: random.Random) -> TextArtifact:
+    return TextArtifact(
+        random_text(rng),
+        name=random_text(rng),
+        meta=random_meta(rng),
+        reference=rng.choice([None, Reference(title=random_text(rng), authors=[random_text(rng)])]),
+    )
+
+
+def random_message(rng: random.Random) -> Message:
+    contents = [
+        lambda: TextMessageContent(random_text_artifact(rng)),
+        lambda: ActionCallMessageContent(
+            ActionArtifact(ToolAction(tag=random_text(rng), name=random_text(rng), input={"values": {}}))
+        ),
+    ]
+
+    return Message(
+        content=[rng.choice(contents)() for _ in range(rng.randint(0, 3))],
+        role=rng.choice([Message.USER_ROLE, Message.ASSISTANT_ROLE, Message.SYSTEM_ROLE]),
+        usage=Message.Usage(
+            input_tokens=rng.choice([None, rng.randint(0, 100), rng.random()]),
+            output_tokens=rng.choice([None, rng.randint(0, 100)]),
+        ),
+    )
+
+
+def random_text_chunk_event(rng: random.Random) -> TextChunkEvent:
+    return TextChunkEvent(token=random_text(rng), index=rng.randint(0, 3), meta=random_meta(rng))
+
+
+def random_action_chunk_event(rng: random.Random) -> ActionChunkEvent:
+    return ActionChunkEvent(
+        partial_input=random_optional_text(rng),
+        tag=random_optional_text(rng),
+        name=random_optional_text(rng),
+        path=random_optional_text(rng),
+        index=rng.randint(0, 3),
+    )
+
+
+class TestFastSerializer:
+    @pytest.mark.parametrize(
+        "factory", [random_text_artifact, random_message, random_text_chunk_event, random_action_chunk_event]
+    )
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_to_dict(self, factory, seed):
+        obj = factory(random.Random(seed))
+
+        serialized = FastSerializer.to_dict(obj)
+
+        assert serialized is not None
+        assert json.dumps(serialized) == json.dumps(dict(BaseSchema.from_attrs_cls(type(obj))().dump(obj)))
+        assert json.dumps(type(obj).from_dict(serialized).to_dict()) == json.dumps(serialized)
+
+    def test_to_dict_subclass(self):
+        class MockTextArtifact(TextArtifact):
+            pass
+
+        assert FastSerializer.to_dict(MockTextArtifact("foo")) is None
+
+    def test_to_dict_not_fast_serializable(self):
+        assert FastSerializer.to_dict(ImageArtifact(b"foo", format="png", width=1, height=1)) is None
+
+    def test_to_dict_uses_fast_serializer(self, mocker):
+        dump = mocker.spy(BaseSchema, "dump")
+
+        TextArtifact("foo").to_dict()
+
+        dump.assert_not_called()
+
+    def test_dumps(self):
+        serialized = TextArtifact("é").to_dict()
+
+        assert json.loads(FastSerializer.dumps(serialized)) == serialized
@@ -0,0 +1,97 @@
+import httpx
+import openai
+import pytest
+
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.utils import ClientRegistry
+
+
+class TestClientRegistry:
+    @pytest.fixture()
+    def client_registry(self):
+        ClientRegistry.enabled = True
+        ClientRegistry.timeout = 30
+
+        yield ClientRegistry
+
+        ClientRegistry.enabled = False
+        ClientRegistry.timeout = None
+        ClientRegistry.clear_clients()
+
+    def test_get_client_disabled(self):
+        assert ClientRegistry.get_client(openai.OpenAI, api_key="foo") is not ClientRegistry.get_client(
+            openai.OpenAI, api_key="foo"
+        )
+
+    def test_get_client(self, client_registry):
+        client = client_registry.get_client(openai.OpenAI, api_key="foo", base_url="https://example.com")
+
+        assert client is client_registry.get_client(openai.OpenAI, base_url="https://example.com", api_key="foo")
+        assert client is not client_registry.get_client(openai.OpenAI, api_key="bar", base_url="https://example.com")
+        assert client is not client_registry.get_client(
+            openai.AzureOpenAI, api_key="foo", base_url="https://example.com", api_version="1"
+        )
+
+    def test_get_client_http_client(self, client_registry):
+        client = client_registry.get_client(openai.OpenAI, api_key="foo")
+
+        assert isinstance(client._client, httpx.Client)
+        assert client.timeout == httpx.Timeout(30)
+
+    def test_get_client_without_http_client(self, client_registry):
+        def create_client(api_key: str) -> dict:
+            return {"api_key": api_key}
+
+        assert client_registry.get_client(create_client, api_key="foo") == {"api_key": "foo"}
+
+    def test_get_client_unhashable_kwargs(self, client_registry):
+        client = client_registry.get_client(openai.OpenAI, api_key="foo", default_headers={"foo": "bar"})
+
+        assert client is client_registry.get_client(openai.OpenAI, api_key="foo", default_headers={"foo": "bar"})
+        assert client is not client_registry.get_client(openai.OpenAI, api_key="foo", default_headers={"foo": "baz"})
+
+    def test_get_client_uncomparable_kwargs(self, client_registry):
+        def create_client(options: object) -> dict:
+            return {"options": options}
+
+        options = type("Options", (), {"__eq__": lambda self, other: self is other, "__hash__": None})()
+
+        assert client_registry.get_client(create_client, options=options) is not client_registry.get_client(
+            create_client, options=options
+        )
+
+    def test_get_client_httpx_client(self, client_registry):
+        def create_client(api_key: str, httpx_client: httpx.Client) -> dict:
+            return {"api_key": api_key, "httpx_client": httpx_client}
+
+        client = client_registry.get_client(create_client, api_key="foo")
+
+        assert isinstance(client["httpx_client"], httpx.Client)
+
+    def test_max_clients(self, client_registry):
+        client_registry.max_clients = 2
+        try:
+            client = client_registry.get_client(openai.OpenAI, api_key="foo")
+            client_registry.get_client(openai.OpenAI, api_key="bar")
+            client_registry.get_client(openai.OpenAI, api_key="foo")
+            client_registry.get_client(openai.OpenAI, api_key="baz")
+
+            assert client is client_registry.get_client(openai.OpenAI, api_key="foo")
+            assert len(client_registry._clients) == 2
+        finally:
+            client_registry.max_clients = 64
+
+    def test_clear_clients(self, client_registry):
+        client = client_registry.get_client(openai.OpenAI, api_key="foo")
+
+        client_registry.clear_clients()
+
+        assert client is not client_registry.get_client(openai.OpenAI, api_key="foo")
+
+    def test_drivers_share_client(self, client_registry):
+        prompt_driver = OpenAiChatPromptDriver(model="gpt-4o", api_key="foo")
+        embedding_driver = OpenAiEmbeddingDriver(api_key="foo")
+
+        assert prompt_driver.client is embedding_driver.client
+        assert prompt_driver.client is not OpenAiChatPromptDriver(model="gpt-4o", api_key="bar").client
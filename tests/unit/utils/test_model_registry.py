@@ -0,0 +1,97 @@
+import gc
+from unittest.mock import Mock
+
+import pytest
+
+from griptape.utils import ModelRegistry
+
+
+class MockOwner:
+    pass
+
+
+class MockModel:
+    def __init__(self, size: int = 0) -> None:
+        self.size = size
+
+    def get_memory_footprint(self) -> int:
+        return self.size
+
+
+class TestModelRegistry:
+    @pytest.fixture()
+    def model_registry(self):
+        ModelRegistry.enabled = True
+
+        yield ModelRegistry
+
+        ModelRegistry.enabled = False
+        ModelRegistry.max_memory = None
+        ModelRegistry.clear_models()
+
+    def test_get_model_disabled(self):
+        loader = Mock(side_effect=MockModel)
+
+        assert ModelRegistry.get_model("foo", loader) is not ModelRegistry.get_model("foo", loader)
+        assert loader.call_count == 2
+
+    def test_get_model(self, model_registry):
+        loader = Mock(side_effect=MockModel)
+
+        model = model_registry.get_model("foo", loader, owner=MockOwner())
+
+        assert model is model_registry.get_model("foo", loader, owner=MockOwner())
+        assert model is not model_registry.get_model("bar", loader)
+        assert loader.call_count == 2
+
+    def test_warm_up(self, model_registry):
+        loader = Mock(side_effect=MockModel)
+
+        model = model_registry.warm_up("foo", loader)
+
+        assert model is model_registry.get_model("foo", loader, owner=MockOwner())
+        assert loader.call_count == 1
+
+    def test_memory_usage(self, model_registry):
+        model_registry.get_model("foo", lambda: MockModel(10))
+        model_registry.get_model("bar", lambda: Mock(model=MockModel(20)))
+        model_registry.get_model("baz", lambda: "tokenizer")
+
+        assert model_registry.memory_usage == 30
+
+    def test_evict(self, model_registry):
+        model_registry.max_memory = 25
+        owner = MockOwner()
+
+        foo_model = model_registry.get_model("foo", lambda: MockModel(10), owner=owner)
+        bar_model = model_registry.get_model("bar", lambda: MockModel(10))
+        model_registry.get_model("baz", lambda: MockModel(10))
+
+        # The least recently used unreferenced model is evicted.
+        assert model_registry.memory_usage == 20
+        assert model_registry.get_model("foo", Mock()) is foo_model
+        assert model_registry.get_model("bar", lambda: MockModel(10)) is not bar_model
+
+    def test_evict_on_release(self, model_registry):
+        model_registry.max_memory = 15
+        foo_owner = MockOwner()
+        bar_owner = MockOwner()
+
+        model_registry.get_model("foo", lambda: MockModel(10), owner=foo_owner)
+        model_registry.get_model("bar", lambda: MockModel(10), owner=bar_owner)
+
+        assert model_registry.memory_usage == 20
+
+        del foo_owner
+        gc.collect()
+
+        assert model_registry.memory_usage == 10
+
+    def test_clear_models(self, model_registry):
+        loader = Mock(side_effect=MockModel)
+
+        model = model_registry.get_model("foo", loader)
+        model_registry.clear_models()
+
+        assert model is not model_registry.get_model("foo", loader)
+        assert model_registry.memory_usage == 0
@@ -0,0 +1,68 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from griptape.utils import SingleFlight
+
+
+class TestSingleFlight:
+    def test_do(self):
+        single_flight = SingleFlight()
+
+        assert single_flight.do("foo", lambda: "bar") == ("bar", False)
+        assert single_flight.do("foo", lambda: "baz") == ("baz", False)
+
+    def test_do_concurrent(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def func() -> str:
+            calls.append(None)
+            started.set()
+            release.wait()
+
+            return "bar"
+
+        with ThreadPoolExecutor() as executor:
+            leader = executor.submit(single_flight.do, "foo", func)
+            started.wait()
+            followers = [executor.submit(single_flight.do, "foo", func) for _ in range(3)]
+            other = executor.submit(single_flight.do, "other", lambda: "baz")
+            assert other.result() == ("baz", False)
+            # Give the followers time to start waiting on the leader.
+            time.sleep(0.1)
+            release.set()
+
+            assert leader.result() == ("bar", False)
+            assert [follower.result() for follower in followers] == [("bar", True)] * 3
+
+        assert len(calls) == 1
+
+    def test_do_exception(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def func() -> str:
+            started.set()
+            release.wait()
+
+            raise ValueError("nope")
+
+        with ThreadPoolExecutor() as executor:
+            leader = executor.submit(single_flight.do, "foo", func)
+            started.wait()
+            follower = executor.submit(single_flight.do, "foo", func)
+            time.sleep(0.1)
+            release.set()
+
+            with pytest.raises(ValueError, match="nope"):
+                leader.result()
+            with pytest.raises(ValueError, match="nope"):
+                follower.result()
+
+        assert single_flight.do("foo", lambda: "bar") == ("bar", False)